@@ -0,0 +1,116 @@
+"""
+Atom style resolution micro-benchmark
+
+Compares building the Button/Input style dicts on every call (how the
+atoms used to work) with looking up the shared precomputed style tables,
+and reports time and allocations per atom construction. Legacy atoms
+also allocate their own padding/border objects, which stay alive with
+the control; the table versions share one set.
+
+    python benchmarks/bench_atom_styles.py [--n 20000]
+"""
+
+import argparse
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import flet as ft
+from components.atoms import button, input as input_atom
+
+
+def legacy_button_styles(variant, size):
+    variant_styles = {
+        "primary": {"bgcolor": ft.Colors.BLUE, "color": ft.Colors.WHITE, "border": None},
+        "secondary": {"bgcolor": ft.Colors.GREY_300, "color": ft.Colors.BLACK, "border": None},
+        "danger": {"bgcolor": ft.Colors.RED, "color": ft.Colors.WHITE, "border": None},
+        "ghost": {"bgcolor": ft.Colors.TRANSPARENT, "color": ft.Colors.BLUE, "border": ft.border.all(1, ft.Colors.BLUE)},
+    }
+    size_styles = {
+        "small": {"height": 32, "padding": ft.padding.symmetric(horizontal=12)},
+        "medium": {"height": 40, "padding": ft.padding.symmetric(horizontal=16)},
+        "large": {"height": 48, "padding": ft.padding.symmetric(horizontal=20)},
+    }
+    return variant_styles.get(variant, variant_styles["primary"]), size_styles.get(size, size_styles["medium"])
+
+
+def legacy_input_styles(variant, size):
+    variant_styles = {
+        "default": {"border": ft.InputBorder.UNDERLINE, "bgcolor": ft.Colors.TRANSPARENT},
+        "outlined": {"border": ft.InputBorder.OUTLINE, "bgcolor": ft.Colors.TRANSPARENT},
+        "filled": {"border": ft.InputBorder.NONE, "bgcolor": ft.Colors.GREY_100},
+    }
+    size_styles = {
+        "small": {"height": 32, "text_size": 12},
+        "medium": {"height": 40, "text_size": 14},
+        "large": {"height": 48, "text_size": 16},
+    }
+    return variant_styles.get(variant, variant_styles["default"]), size_styles.get(size, size_styles["medium"])
+
+
+def legacy_button(text, variant, size):
+    style, size_style = legacy_button_styles(variant, size)
+    return ft.Container(
+        ft.Row([ft.Text(text, weight=ft.FontWeight.W_500)], alignment=ft.MainAxisAlignment.CENTER, spacing=8),
+        bgcolor=style["bgcolor"],
+        border=style.get("border"),
+        border_radius=6,
+        padding=size_style["padding"],
+        height=size_style["height"],
+        ink=True
+    )
+
+
+def legacy_input(placeholder, variant, size):
+    style, size_style = legacy_input_styles(variant, size)
+    return ft.TextField(
+        hint_text=placeholder,
+        border=style["border"],
+        bgcolor=style["bgcolor"],
+        height=size_style["height"],
+        text_size=size_style["text_size"],
+        border_radius=6
+    )
+
+
+def measure(fn, n):
+    """Seconds per call, plus memory blocks and bytes held by each result while it is kept alive"""
+    seconds = min(timeit.repeat(fn, number=n, repeat=3)) / n
+
+    tracemalloc.start()
+    before_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    before_bytes, _ = tracemalloc.get_traced_memory()
+    kept = [fn() for _ in range(n)]
+    after_bytes, _ = tracemalloc.get_traced_memory()
+    after_blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics("filename"))
+    tracemalloc.stop()
+    del kept
+    return seconds, (after_blocks - before_blocks) / n, (after_bytes - before_bytes) / n
+
+
+def report(name, fn, n):
+    seconds, blocks, retained = measure(fn, n)
+    print(f"{name:<28} {seconds * 1e6:8.2f} us {blocks:8.1f} blocks {retained:9.0f} B held")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=20000)
+    n = parser.parse_args().n
+
+    print(f"per call, n={n}")
+    report("button styles: legacy", lambda: legacy_button_styles("ghost", "large"), n)
+    report("button styles: table", lambda: button.resolve_style("ghost", "large"), n)
+    report("input styles: legacy", lambda: legacy_input_styles("filled", "large"), n)
+    report("input styles: table", lambda: input_atom.resolve_style("filled", "large"), n)
+    report("Button(): legacy", lambda: legacy_button("Go", "ghost", "large"), n)
+    report("Button(): table", lambda: button.Button("Go", variant="ghost", size="large"), n)
+    report("Input(): legacy", lambda: legacy_input("Name", "filled", "large"), n)
+    report("Input(): table", lambda: input_atom.Input("Name", variant="filled", size="large"), n)
+
+
+if __name__ == "__main__":
+    main()
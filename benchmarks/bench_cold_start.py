@@ -0,0 +1,72 @@
+"""
+Cold-start benchmark
+
+Runs every entry point in fresh interpreters and reports how long it
+takes to import Flet, to import the entry module, and to build and
+send the first page to a headless stub page.
+
+    python benchmarks/bench_cold_start.py [--runs 10] [entry ...]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+ENTRY_POINTS = ["main", "atomic_example", "design_tokens_demo"]
+
+# Executed in a fresh interpreter per run
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import flet
+flet_loaded = time.perf_counter()
+entry = __import__(sys.argv[1])
+entry_loaded = time.perf_counter()
+from perf.stub_page import stub_page
+page = stub_page()
+built = time.perf_counter()
+entry.main(page)
+first_page = time.perf_counter()
+print(json.dumps({
+    "import_flet": flet_loaded - start,
+    "import_entry": entry_loaded - flet_loaded,
+    "first_page": first_page - built,
+    "total": first_page - start - (built - entry_loaded),
+    "bytes": page.connection.bytes,
+}))
+"""
+
+
+def probe(entry):
+    env = dict(os.environ, PYTHONPATH=str(SRC), CHAT_DB=":memory:")
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, entry],
+        cwd=SRC, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("entries", nargs="*", default=ENTRY_POINTS)
+    args = parser.parse_args()
+
+    print(f"median of {args.runs} runs, ms")
+    print(f"{'entry':<20} {'flet':>8} {'entry':>8} {'1st page':>9} {'total':>8} {'bytes':>8}")
+    for entry in args.entries:
+        runs = [probe(entry) for _ in range(args.runs)]
+        m = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+        print(
+            f"{entry:<20} {m['import_flet'] * 1000:8.1f} {m['import_entry'] * 1000:8.1f} "
+            f"{m['first_page'] * 1000:9.1f} {m['total'] * 1000:8.1f} {m['bytes']:8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Component construction benchmark
+
+Reports the time and memory it takes to build one instance of each
+component, measured in-process with perf_counter and tracemalloc.
+
+    python benchmarks/bench_components.py [--count 2000] [--repeat 5] [--json]
+"""
+
+import argparse
+import gc
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import flet as ft
+from components.atoms.button import Button
+from components.atoms.input import Input
+from components.molecules.input_with_button import InputWithButton
+from components.message_bubble import LargeMessageBubble, MessageBubble
+from components.chat_container import ChatContainer
+from chat.message import Message
+
+COMPONENTS = {
+    "Button": lambda i: Button(f"Button {i}", icon=ft.Icons.SEND),
+    "Input": lambda i: Input(f"Field {i}"),
+    "InputWithButton": lambda i: InputWithButton(f"Field {i}"),
+    "MessageBubble": lambda i: MessageBubble(f"message number {i}", "You", True),
+    "LargeMessageBubble": lambda i: LargeMessageBubble(Message("You", True, f"log line {i}\n" * 5000)),
+    "ChatContainer": lambda i: ChatContainer([ft.ListView(), ft.Row()]),
+}
+
+
+def construction_time(build, count, repeat):
+    """Median microseconds per instance over `repeat` batches of `count`"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        kept = [build(i) for i in range(count)]
+        samples.append((time.perf_counter() - start) / count * 1e6)
+        del kept
+    return statistics.median(samples)
+
+
+def allocations(build, count):
+    """Bytes and allocated blocks kept alive per instance"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    kept = [build(i) for i in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del kept
+    return size / count, blocks / count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--count", type=int, default=2000, help="instances built per batch")
+    parser.add_argument("--repeat", type=int, default=5, help="timed batches per component")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("components", nargs="*", default=list(COMPONENTS))
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.components:
+        build = COMPONENTS[name]
+        build(0)  # warm up imports and lazily built tables
+        size, blocks = allocations(build, args.count)
+        results[name] = {
+            "us": construction_time(build, args.count, args.repeat),
+            "bytes": size,
+            "blocks": blocks,
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"per instance, median of {args.repeat} batches of {args.count}")
+    print(f"{'component':<16} {'time':>10} {'memory':>10} {'blocks':>8}")
+    for name, result in results.items():
+        print(
+            f"{name:<16} {result['us']:>8.1f}us "
+            f"{result['bytes']:>8.0f} B {result['blocks']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+"""
+Web load test
+Drives many simulated chat clients against one local web server process
+
+Starts src/main.py as a Flet web server on 127.0.0.1 (the server
+`flet run --web` runs) with a throwaway history file. It then connects
+clients over the same websocket protocol the browser client uses, in
+steps of increasing size (--clients 25,50,100,200). Each client registers
+a session, finds the chat field in the controls it is sent, and then
+submits a message every 1/--rate seconds.
+
+For each step it reports:
+- send -> render: time from submitting until the frame with the user's
+  bubble arrives, at p50/p95/p99
+- send -> reply: time until the first chunk of the echo reply arrives, at p95
+- server CPU, as a share of one core, and CPU and RSS per connected
+  session; both include the server's reply worker processes
+
+Nothing leaves localhost. --url points the clients at a server that is
+already running instead; with --pid its CPU and RSS are sampled as well.
+
+    python benchmarks/bench_load.py [--clients 25,50,100,200] [--rate 0.5] [--duration 20] [--json]
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from urllib.parse import urlparse
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+# The chat field's hint, to find it among the controls a session is sent
+FIELD_HINT = "Type a message..."
+
+
+class WebSocket:
+    """Just enough of an RFC 6455 client for ws:// on localhost: text messages, no extensions"""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, host, port, path="/ws"):
+        reader, writer = await asyncio.open_connection(host, port)
+        key = base64.b64encode(os.urandom(16)).decode()
+        writer.write(
+            f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\nSec-WebSocket-Version: 13\r\n\r\n".encode()
+        )
+        status = await reader.readline()
+        if b" 101 " not in status:
+            writer.close()
+            raise ConnectionError(f"websocket upgrade refused: {status.decode().strip()}")
+        while await reader.readline() not in (b"\r\n", b""):
+            pass
+        return cls(reader, writer)
+
+    async def send(self, text):
+        await self._send_frame(0x1, text.encode())
+
+    async def _send_frame(self, opcode, data):
+        size = len(data)
+        header = bytearray([0x80 | opcode])
+        if size < 126:
+            header.append(0x80 | size)
+        elif size < 1 << 16:
+            header += bytes([0x80 | 126]) + size.to_bytes(2, "big")
+        else:
+            header += bytes([0x80 | 127]) + size.to_bytes(8, "big")
+        # Clients must mask what they send
+        mask = os.urandom(4)
+        key = (mask * (size // 4 + 1))[:size]
+        masked = (int.from_bytes(data, "big") ^ int.from_bytes(key, "big")).to_bytes(size, "big")
+        self.writer.write(bytes(header) + mask + masked)
+        await self.writer.drain()
+
+    async def recv(self):
+        """Next text message, or None once the server has closed the connection"""
+        message = bytearray()
+        while True:
+            try:
+                head = await self.reader.readexactly(2)
+            except asyncio.IncompleteReadError:
+                return None
+            opcode = head[0] & 0x0F
+            size = head[1] & 0x7F
+            if size == 126:
+                size = int.from_bytes(await self.reader.readexactly(2), "big")
+            elif size == 127:
+                size = int.from_bytes(await self.reader.readexactly(8), "big")
+            if head[1] & 0x80:
+                await self.reader.readexactly(4)  # servers don't mask; skip it if one does
+            payload = await self.reader.readexactly(size)
+            if opcode == 0x8:
+                return None
+            if opcode == 0x9:
+                await self._send_frame(0xA, payload)
+                continue
+            if opcode == 0xA:
+                continue
+            message += payload
+            if head[0] & 0x80:
+                return message.decode()
+
+    def close(self):
+        self.writer.close()
+
+
+def register_message():
+    payload = {
+        "pageName": "", "pageRoute": "/", "pageWidth": "800", "pageHeight": "600",
+        "windowWidth": "800", "windowHeight": "600", "windowTop": "0", "windowLeft": "0",
+        "isPWA": "false", "isWeb": "true", "isDebug": "false", "platform": "linux",
+        "platformBrightness": "light", "media": "{}", "sessionId": "",
+    }
+    return json.dumps({"action": "registerWebClient", "payload": payload})
+
+
+def sent_controls(message):
+    """Control dicts in a server message: the session snapshot, added controls, batches"""
+    action, payload = message.get("action"), message.get("payload") or {}
+    if action == "registerWebClient":
+        yield from ((payload.get("session") or {}).get("controls") or {}).values()
+    elif action == "addPageControls":
+        yield from payload.get("controls", [])
+    elif action == "pageControlsBatch":
+        for item in payload:
+            yield from sent_controls(item)
+
+
+class Client:
+    """One simulated browser session sending a message every `interval` seconds"""
+
+    def __init__(self, number, host, port, path, interval, timeout):
+        self.number = number
+        self.host, self.port, self.path = host, port, path
+        self.interval = interval
+        self.timeout = timeout
+        self.field = None
+        self.ready = asyncio.Event()
+        self.sent = 0
+        self.render = []        # send -> user bubble, seconds
+        self.reply = []         # send -> first reply chunk, seconds
+        self._rendering = {}    # nonce -> send time, until the bubble arrives
+        self._replying = {}
+        self.error = None
+
+    async def run(self, stop):
+        try:
+            ws = await WebSocket.connect(self.host, self.port, self.path)
+        except OSError as e:
+            self.error = str(e)
+            self.ready.set()
+            return
+        reader = asyncio.ensure_future(self._read(ws))
+        await ws.send(register_message())
+        try:
+            await asyncio.wait_for(self.ready.wait(), self.timeout)
+        except asyncio.TimeoutError:
+            self.error = "chat field never arrived"
+        if self.field is None:
+            self.error = self.error or "session closed before the chat field arrived"
+            self.ready.set()
+        else:
+            await self._send_loop(ws, stop)
+        reader.cancel()
+        ws.close()
+
+    async def _send_loop(self, ws, stop):
+        # Spread clients over the interval instead of sending in lockstep
+        await asyncio.sleep(random.uniform(0, self.interval))
+        while not stop.is_set():
+            # Terminated, so lt1x1 can't match in the frame for lt1x10
+            nonce = f"lt{self.number}x{self.sent}."
+            self.sent += 1
+            now = time.perf_counter()
+            self._rendering[f"You: {nonce}"] = now
+            self._replying[f"Echo: {nonce}"] = now
+            await ws.send(json.dumps({"action": "updateControlProps", "payload": {"props": [{"i": self.field, "value": nonce}]}}))
+            await ws.send(json.dumps({"action": "pageEventFromWeb", "payload": {"eventTarget": self.field, "eventName": "submit", "eventData": ""}}))
+            try:
+                await asyncio.wait_for(stop.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _read(self, ws):
+        while True:
+            text = await ws.recv()
+            if text is None:
+                self.ready.set()
+                return
+            now = time.perf_counter()
+            if self.field is None:
+                for control in sent_controls(json.loads(text)):
+                    if control.get("t") == "textfield" and control.get("hinttext") == FIELD_HINT:
+                        self.field = control["i"]
+                        self.ready.set()
+            for pending, samples in ((self._rendering, self.render), (self._replying, self.reply)):
+                for marker in [marker for marker in pending if marker in text]:
+                    samples.append(now - pending.pop(marker))
+
+    def reset(self):
+        self.render.clear()
+        self.reply.clear()
+        self.sent = 0
+
+    @property
+    def unanswered(self):
+        """Messages whose bubble is older than the timeout and still hasn't arrived"""
+        deadline = time.perf_counter() - self.timeout
+        return sum(1 for sent in self._rendering.values() if sent < deadline)
+
+
+class ProcessSampler:
+    """
+    CPU time and RSS of a process and its descendants (the reply worker
+    processes), via psutil if installed, else /proc
+
+    CPU time of a descendant that exits between samples is kept at its
+    last reading, so the total never goes backwards. RSS is summed over
+    the processes, counting pages they share once per process.
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        try:
+            import psutil
+            self._process = psutil.Process(pid)
+        except ImportError:
+            self._process = None
+        self._ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._page = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+        self._cpu = {}      # pid -> cpu seconds at the last sample
+        self._exited = 0.0  # cpu seconds of descendants that have exited
+        self.processes = 0
+
+    def sample(self):
+        """(cpu seconds, rss bytes), or None if the process can't be read"""
+        readings = self._read_psutil() if self._process is not None else self._read_proc()
+        if readings is None:
+            return None
+        for pid in self._cpu.keys() - readings.keys():
+            self._exited += self._cpu.pop(pid)
+        self._cpu.update((pid, cpu) for pid, (cpu, _) in readings.items())
+        self.processes = len(readings)
+        return self._exited + sum(self._cpu.values()), sum(rss for _, rss in readings.values())
+
+    def _read_psutil(self):
+        import psutil
+        readings = {}
+        try:
+            processes = [self._process] + self._process.children(recursive=True)
+        except psutil.Error:
+            return None
+        for process in processes:
+            try:
+                times = process.cpu_times()
+                readings[process.pid] = (times.user + times.system, process.memory_info().rss)
+            except psutil.Error:
+                # Exited since it was listed
+                pass
+        return readings
+
+    def _read_proc(self):
+        stats = {}
+        for entry in os.listdir("/proc"):
+            if entry.isdigit():
+                try:
+                    with open(f"/proc/{entry}/stat") as f:
+                        fields = f.read().rsplit(")", 1)[1].split()
+                    with open(f"/proc/{entry}/statm") as f:
+                        rss_pages = int(f.read().split()[1])
+                except OSError:
+                    continue
+                # fields[1] is the parent pid
+                stats[int(entry)] = (int(fields[1]), (int(fields[11]) + int(fields[12])) / self._ticks, rss_pages * self._page)
+        if self.pid not in stats:
+            return None
+        tree, readings = [self.pid], {}
+        while tree:
+            pid = tree.pop()
+            readings[pid] = stats[pid][1:]
+            tree += [child for child, (parent, *_) in stats.items() if parent == pid]
+        return readings
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(port, history):
+    """src/main.py as a web server on 127.0.0.1:`port`, the way `flet run --web` starts it"""
+    env = dict(
+        os.environ,
+        FLET_FORCE_WEB_SERVER="true",
+        FLET_SERVER_IP="127.0.0.1",
+        FLET_SERVER_PORT=str(port),
+        CHAT_DB=history,
+    )
+    return subprocess.Popen(
+        [sys.executable, "main.py"], cwd=SRC, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+    )
+
+
+async def wait_for_server(host, port, server=None, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server is not None and server.poll() is not None:
+            raise RuntimeError(f"server exited:\n{server.stderr.read().decode()[-2000:]}")
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server didn't start listening on {host}:{port} within {timeout}s")
+
+
+def percentile(samples, q):
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+
+async def run_steps(host, port, path, steps, rate, duration, timeout, sampler):
+    stop = asyncio.Event()
+    clients, tasks = [], []
+    baseline = sampler.sample() if sampler else None
+    results = []
+
+    for step in steps:
+        # Add sessions up to this step and let them register
+        new = [Client(len(clients) + i, host, port, path, 1 / rate, timeout) for i in range(step - len(clients))]
+        clients += new
+        tasks += [asyncio.ensure_future(client.run(stop)) for client in new]
+        await asyncio.gather(*(client.ready.wait() for client in new))
+        connected = [client for client in clients if client.error is None]
+        for client in clients:
+            client.reset()
+
+        before = sampler.sample() if sampler else None
+        start = time.perf_counter()
+        await asyncio.sleep(duration)
+        elapsed = time.perf_counter() - start
+        after = sampler.sample() if sampler else None
+
+        render = [s for client in connected for s in client.render]
+        reply = [s for client in connected for s in client.reply]
+        result = {
+            "clients": len(connected),
+            "failed": len(clients) - len(connected),
+            "messages": sum(client.sent for client in connected),
+            "unanswered": sum(client.unanswered for client in connected),
+            "render_p50_ms": percentile(render, 0.50),
+            "render_p95_ms": percentile(render, 0.95),
+            "render_p99_ms": percentile(render, 0.99),
+            "reply_p95_ms": percentile(reply, 0.95),
+        }
+        if before and after and connected:
+            cpu = (after[0] - before[0]) / elapsed
+            result["server_processes"] = sampler.processes
+            result["server_cpu_pct"] = cpu * 100
+            result["cpu_pct_per_session"] = cpu * 100 / len(connected)
+            result["rss_mb"] = after[1] / 2**20
+            result["rss_kb_per_session"] = (after[1] - baseline[1]) / 1024 / len(connected)
+        results.append(result)
+        yield result
+
+    stop.set()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def fmt(value, width, unit=""):
+    return f"{value:>{width - len(unit)}.1f}{unit}" if value is not None else f"{'-':>{width}}"
+
+
+async def main_async(args):
+    steps = sorted(int(step) for step in args.clients.split(","))
+    server = sampler = None
+    history = None
+    if args.url:
+        url = urlparse(args.url)
+        host, port, path = url.hostname, url.port or 80, url.path or "/ws"
+        if host not in ("127.0.0.1", "localhost", "::1"):
+            raise SystemExit("the load test only targets servers on localhost")
+        sampler = ProcessSampler(args.pid) if args.pid else None
+    else:
+        host, port, path = "127.0.0.1", free_port(), "/ws"
+        history = tempfile.NamedTemporaryFile(suffix=".sqlite3", delete=False).name
+        server = start_server(port, history)
+        sampler = ProcessSampler(server.pid)
+
+    try:
+        await wait_for_server(host, port, server)
+        if not args.json:
+            print(f"{'clients':>7} {'failed':>6} {'msgs':>6} {'late':>5} {'p50':>9} {'p95':>9} {'p99':>9} "
+                  f"{'reply p95':>10} {'procs':>5} {'cpu':>7} {'cpu/sess':>9} {'rss':>8} {'rss/sess':>9}")
+        results = []
+        async for result in run_steps(host, port, path, steps, args.rate, args.duration, args.timeout, sampler):
+            results.append(result)
+            if not args.json:
+                print(
+                    f"{result['clients']:>7} {result['failed']:>6} {result['messages']:>6} {result['unanswered']:>5} "
+                    f"{fmt(result['render_p50_ms'], 9, 'ms')} {fmt(result['render_p95_ms'], 9, 'ms')} "
+                    f"{fmt(result['render_p99_ms'], 9, 'ms')} {fmt(result['reply_p95_ms'], 10, 'ms')} "
+                    f"{result.get('server_processes', '-'):>5} {fmt(result.get('server_cpu_pct'), 7, '%')} {fmt(result.get('cpu_pct_per_session'), 9, '%')} "
+                    f"{fmt(result.get('rss_mb'), 8, 'MB')} {fmt(result.get('rss_kb_per_session'), 9, 'KB')}",
+                    flush=True
+                )
+        if args.json:
+            print(json.dumps(results, indent=2))
+    finally:
+        if server is not None:
+            server.terminate()
+            try:
+                server.wait(10)
+            except subprocess.TimeoutExpired:
+                server.kill()
+        if history is not None:
+            for suffix in ("", "-wal", "-shm"):
+                try:
+                    os.unlink(history + suffix)
+                except OSError:
+                    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", default="25,50,100,200", help="comma-separated session counts to step through")
+    parser.add_argument("--rate", type=float, default=0.5, help="messages per second per client")
+    parser.add_argument("--duration", type=float, default=20, help="seconds to measure at each step")
+    parser.add_argument("--timeout", type=float, default=10, help="seconds before a message counts as late")
+    parser.add_argument("--url", help="websocket URL of a running local server, e.g. ws://127.0.0.1:8550/ws")
+    parser.add_argument("--pid", type=int, help="process id of the --url server, to sample its CPU and RSS")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Message memory benchmark
+
+Reports bytes per message for Message records at several history sizes,
+next to MessageBubble controls (how history used to be held) at the
+sizes where building controls is still practical.
+
+    python benchmarks/bench_message_memory.py [--sizes 10000 100000 1000000] [--bubbles 10000]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from chat.message import Message
+from components.message_bubble import MessageBubble
+
+
+def text(i):
+    return f"message number {i}"
+
+
+def bytes_per_message(build, n):
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    kept = [build(i) for i in range(n)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return (after - before) / n
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--bubbles", type=int, nargs="*", default=[10_000],
+                        help="history sizes to measure as MessageBubble controls")
+    args = parser.parse_args()
+
+    # The text itself is part of both; shown separately for reference
+    text_only = bytes_per_message(text, args.sizes[0])
+    print(f"text alone: {text_only:.0f} B/message")
+
+    print(f"{'messages':>10} {'records':>12} {'bubbles':>12}")
+    for n in sorted(set(args.sizes) | set(args.bubbles)):
+        record = bytes_per_message(lambda i: Message("You", True, text(i), 0.0, i), n) if n in args.sizes else None
+        bubble = bytes_per_message(lambda i: MessageBubble(text(i), "You", True), n) if n in args.bubbles else None
+        print(
+            f"{n:>10} "
+            f"{f'{record:.0f} B' if record is not None else '-':>12} "
+            f"{f'{bubble:.0f} B' if bubble is not None else '-':>12}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Screen size benchmark
+
+Builds every entry point on a headless stub page and reports how many
+controls the first page holds and how many bytes it takes to send.
+
+With --sessions N, also opens each screen in N sessions at once, as when
+many browsers connect to a web deployment, with and without the
+template cache, and reports per-session build latency and CPU time.
+
+    python benchmarks/bench_screens.py [--json] [--sessions N] [entry ...]
+"""
+
+import argparse
+import importlib
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+# Keep the chat screen off the on-disk history so runs are comparable
+os.environ["CHAT_DB"] = ":memory:"
+
+from components import templates
+from perf.patch_meter import count_controls
+from perf.stub_page import stub_page
+
+ENTRY_POINTS = ["main", "atomic_example", "design_tokens_demo"]
+
+
+def measure(entry):
+    module = importlib.import_module(entry)
+    page = stub_page()
+    start = time.perf_counter()
+    module.main(page)
+    elapsed = time.perf_counter() - start
+    return {
+        "controls": count_controls(page),
+        "messages": page.connection.messages,
+        "bytes": page.connection.bytes,
+        "build_ms": elapsed * 1000,
+    }
+
+
+def connect_storm(entry, sessions, cached):
+    """Build `entry` in `sessions` sessions at once on a handler thread pool"""
+    templates.ENABLED = cached
+    templates.clear()
+    module = importlib.import_module(entry)
+    module.main(stub_page())
+
+    def connect(_):
+        start = time.perf_counter()
+        module.main(stub_page())
+        return time.perf_counter() - start
+
+    cpu = time.process_time()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        latencies = sorted(pool.map(connect, range(sessions)))
+    cpu = time.process_time() - cpu
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(0.95 * (len(latencies) - 1))] * 1000,
+        "cpu_ms_per_session": cpu / sessions * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--sessions", type=int, default=0, help="also connect this many sessions at once")
+    parser.add_argument("entries", nargs="*", default=ENTRY_POINTS)
+    args = parser.parse_args()
+
+    # The first build pays for imports; measure a second one
+    for entry in args.entries:
+        measure(entry)
+    results = {entry: measure(entry) for entry in args.entries}
+
+    if args.sessions:
+        for entry in args.entries:
+            results[entry]["sessions"] = {
+                "templates": connect_storm(entry, args.sessions, True),
+                "no_templates": connect_storm(entry, args.sessions, False),
+            }
+        templates.ENABLED = True
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'screen':<20} {'controls':>9} {'messages':>9} {'bytes':>9} {'build':>10}")
+    for entry, result in results.items():
+        print(
+            f"{entry:<20} {result['controls']:>9} {result['messages']:>9} "
+            f"{result['bytes']:>9} {result['build_ms']:>8.2f}ms"
+        )
+
+    if args.sessions:
+        print(f"\n{args.sessions} sessions at once")
+        print(f"{'screen':<20} {'templates':<10} {'p50':>10} {'p95':>10} {'cpu/session':>12}")
+        for entry, result in results.items():
+            for mode, storm in result["sessions"].items():
+                print(
+                    f"{entry:<20} {'on' if mode == 'templates' else 'off':<10} {storm['p50_ms']:>8.2f}ms "
+                    f"{storm['p95_ms']:>8.2f}ms {storm['cpu_ms_per_session']:>10.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Send latency benchmark
+
+Builds the chat screen on a headless stub page over a history of 0, 1k
+and 10k messages, then times submitting a message: the send handler
+(store writes, list sync, starting the reply) plus the scheduler flush
+that patches the page. Each history size runs in a fresh interpreter
+with an in-memory store. Between sends the page's event loop runs until
+the reply has been produced, so no send finds the reply queue full.
+
+    python benchmarks/bench_send_latency.py [--sends 200] [--json] [history ...]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HISTORY_SIZES = [0, 1_000, 10_000]
+
+# Executed in a fresh interpreter per history size
+PROBE = """
+import asyncio, json, statistics, sys, time
+history, sends = int(sys.argv[1]), int(sys.argv[2])
+from chat.store import open_store
+store = open_store()
+for i in range(history):
+    store.add("You" if i % 2 == 0 else "Echo", i % 2 == 0, f"message number {i}")
+import main as entry
+from perf.stub_page import stub_page
+page = stub_page()
+entry.main(page)
+field = page.session.get("refs").get("chat_input.field")
+scheduler = page.session.get("update_scheduler")
+
+def drain():
+    # Run the loop until the reply and its flushes are done
+    while True:
+        page.loop.run_until_complete(asyncio.sleep(0.001))
+        if all(task.done() for task in asyncio.all_tasks(page.loop)):
+            return
+
+samples, sizes = [], []
+for i in range(sends):
+    field.value = f"new message {i}"
+    page.connection.reset()
+    start = time.perf_counter()
+    field.on_submit(None)
+    scheduler.flush()
+    samples.append(time.perf_counter() - start)
+    sizes.append(page.connection.bytes)
+    drain()
+if len(store) != history + 2 * sends:
+    sys.exit(f"{history + 2 * sends - len(store)} sends or replies missing")
+samples.sort()
+print(json.dumps({
+    "median_ms": statistics.median(samples) * 1000,
+    "p95_ms": samples[int(len(samples) * 0.95) - 1] * 1000,
+    "max_ms": samples[-1] * 1000,
+    "bytes": statistics.median(sizes),
+}))
+"""
+
+
+def probe(history, sends):
+    env = dict(os.environ, PYTHONPATH=str(SRC), CHAT_DB=":memory:", CHAT_REPLY_WORKERS="0")
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, str(history), str(sends)],
+        cwd=SRC, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sends", type=int, default=200, help="messages submitted per history size")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("history", type=int, nargs="*", default=HISTORY_SIZES)
+    args = parser.parse_args()
+
+    results = {history: probe(history, args.sends) for history in args.history}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{args.sends} sends per history size")
+    print(f"{'history':>8} {'median':>10} {'p95':>10} {'max':>10} {'patch':>9}")
+    for history, result in results.items():
+        print(
+            f"{history:>8} {result['median_ms']:>8.3f}ms {result['p95_ms']:>8.3f}ms "
+            f"{result['max_ms']:>8.3f}ms {result['bytes']:>7.0f} B"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Theme switch benchmark
+
+Builds the design tokens demo on a headless stub page and compares
+switching palettes through the page theme (one theme_mode patch) with
+rebuilding and re-sending the whole control tree.
+
+    python benchmarks/bench_theme_switch.py [--repeat 50]
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+import flet as ft
+import design_tokens_demo
+from components.updates import UpdateScheduler
+from design_tokens.theme import set_theme_mode
+from perf.stub_page import stub_page
+
+
+def demo_page():
+    page = stub_page()
+    design_tokens_demo.main(page)
+    page.connection.reset()
+    return page
+
+
+def theme_switch(page):
+    scheduler = UpdateScheduler(page)
+    set_theme_mode(page, ft.ThemeMode.DARK, scheduler)
+    scheduler.flush()
+
+
+def full_rebuild(page):
+    page.clean()
+    design_tokens_demo.main(page)
+
+
+def run(name, action, repeat):
+    times = []
+    sizes = []
+    for _ in range(repeat):
+        page = demo_page()
+        start = time.perf_counter()
+        action(page)
+        times.append(time.perf_counter() - start)
+        sizes.append(page.connection.bytes)
+    print(f"{name:<14} {statistics.median(times) * 1000:8.3f} ms {statistics.median(sizes):9.0f} B")
+    return statistics.median(times), statistics.median(sizes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=50)
+    repeat = parser.parse_args().repeat
+
+    print(f"median of {repeat}")
+    switch_time, switch_bytes = run("theme switch", theme_switch, repeat)
+    rebuild_time, rebuild_bytes = run("full rebuild", full_rebuild, repeat)
+    print(f"switch is {rebuild_time / switch_time:.1f}x faster and {rebuild_bytes / switch_bytes:.0f}x smaller")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 import flet as ft
-from components.atoms.button import Button
-from components.atoms.input import Input
-from components.molecules.input_with_button import InputWithButton
 
 
 def main(page: ft.Page):
+    # Components load on the first page build, not at process start
+    from components import Input
+    from components.templates import template
+    
     page.title = "Atomic Design Demo"
     page.bgcolor = ft.Colors.WHITE
     page.padding = 20
@@ -15,44 +16,71 @@ def main(page: ft.Page):
     def input_changed(e):
         print(f"Input changed: {e.control.value}")
     
+    def input_coalesced(e):
+        stats = e.control.on_change.stats()
+        print(f"Input changed ({stats['mode']}): {e.control.value}, {stats['dropped']} events dropped")
+    
+    # Static sections are built once per process and cloned for each
+    # session; the coalesced inputs keep per-session state, so they are
+    # built here every time
     page.add(
         ft.Column([
-            ft.Text("Atomic Design Components", size=24, weight=ft.FontWeight.BOLD),
-            
-            ft.Divider(),
-            ft.Text("Atoms - Buttons", size=18),
-            ft.Row([
-                Button("Primary", variant="primary", on_click=button_clicked),
-                Button("Secondary", variant="secondary", on_click=button_clicked),
-                Button("Danger", variant="danger", on_click=button_clicked),
-                Button("Ghost", variant="ghost", on_click=button_clicked),
-            ], spacing=10),
-            
-            ft.Row([
-                Button("Small", size="small", on_click=button_clicked),
-                Button("Medium", size="medium", on_click=button_clicked),
-                Button("Large", size="large", on_click=button_clicked),
-            ], spacing=10),
-            
-            ft.Divider(),
-            ft.Text("Atoms - Inputs", size=18),
+            *template("atomic_example.atoms", atoms, page, button_clicked=button_clicked),
             ft.Column([
-                Input(placeholder="Default input", variant="default", on_change=input_changed),
-                Input(placeholder="Outlined input", variant="outlined", on_change=input_changed),
-                Input(placeholder="Filled input", variant="filled", on_change=input_changed),
+                # Keystrokes are coalesced so a burst of typing runs the handler once
+                Input(placeholder="Default input (debounced)", variant="default",
+                      on_change=input_coalesced, change_mode="debounce"),
+                Input(placeholder="Outlined input (throttled)", variant="outlined",
+                      on_change=input_coalesced, change_mode="throttle", change_wait=0.5),
+                Input(placeholder="Filled input (on idle)", variant="filled",
+                      on_change=input_coalesced, change_mode="idle", change_wait=0.8),
             ], spacing=10),
-            
-            ft.Divider(),
-            ft.Text("Molecules - Input with Button", size=18),
-            InputWithButton(
-                placeholder="Type a message...",
-                button_text="Send",
-                on_send=button_clicked,
-                on_submit=input_changed
-            ),
-            
+            *template("atomic_example.molecules", molecules, page,
+                      button_clicked=button_clicked, input_changed=input_changed),
         ], spacing=20)
     )
 
 
-ft.app(main)
\ No newline at end of file
+def atoms(slot):
+    from components import Button
+    
+    return [
+        ft.Text("Atomic Design Components", size=24, weight=ft.FontWeight.BOLD),
+        
+        ft.Divider(),
+        ft.Text("Atoms - Buttons", size=18),
+        ft.Row([
+            Button("Primary", variant="primary", on_click=slot("button_clicked")),
+            Button("Secondary", variant="secondary", on_click=slot("button_clicked")),
+            Button("Danger", variant="danger", on_click=slot("button_clicked")),
+            Button("Ghost", variant="ghost", on_click=slot("button_clicked")),
+        ], spacing=10),
+        
+        ft.Row([
+            Button("Small", size="small", on_click=slot("button_clicked")),
+            Button("Medium", size="medium", on_click=slot("button_clicked")),
+            Button("Large", size="large", on_click=slot("button_clicked")),
+        ], spacing=10),
+        
+        ft.Divider(),
+        ft.Text("Atoms - Inputs", size=18),
+    ]
+
+
+def molecules(slot):
+    from components import InputWithButton
+    
+    return [
+        ft.Divider(),
+        ft.Text("Molecules - Input with Button", size=18),
+        InputWithButton(
+            placeholder="Type a message...",
+            button_text="Send",
+            on_send=slot("button_clicked"),
+            on_submit=slot("input_changed")
+        ),
+    ]
+
+
+if __name__ == "__main__":
+    ft.app(main)
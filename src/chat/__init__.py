@@ -0,0 +1 @@
+# Chat package
\ No newline at end of file
@@ -0,0 +1,166 @@
+"""
+Transcript Importer
+Streams JSONL conversations into the message store in bounded chunks
+
+One message per line, in the store's own fields or the role/content
+shape most chat tools export:
+
+    {"sender": "You", "is_user": true, "text": "hi", "ts": 1700000000.0}
+    {"role": "assistant", "content": "hello"}
+
+`ts`/`timestamp` is optional, and so is `image`, the path or URL of an
+attached image. With only `role`, "user" maps to the local sender "You"
+and other roles to their capitalized name.
+
+The file is read line by line and at most `chunk_size` messages are
+held at once, so memory stays flat however long the transcript is.
+Runs on a worker thread; progress is reported after every chunk and
+cancel() stops the import at the next chunk boundary, keeping what was
+already stored.
+
+    python -m chat.importer transcript.jsonl [--db chat_history.sqlite3] [--conversation ID]
+"""
+
+import argparse
+import json
+import os
+import threading
+import time
+from typing import NamedTuple
+
+from .message import Message
+
+
+class ImportStatus(NamedTuple):
+    imported: int       # messages stored so far
+    skipped: int        # lines that weren't a message
+    fraction: float     # share of the file read, 0..1
+    done: bool = False
+    cancelled: bool = False
+    error: str = None
+
+    def __str__(self):
+        if self.error:
+            return f"import failed: {self.error}"
+        state = "cancelled" if self.cancelled else "done" if self.done else f"{self.fraction:.0%}"
+        skipped = f", {self.skipped} lines skipped" if self.skipped else ""
+        return f"{self.imported} messages imported{skipped} ({state})"
+
+
+def parse_line(line):
+    """Message for one transcript line, or None if it isn't one"""
+    try:
+        record = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(record, dict):
+        return None
+
+    text = record.get("text", record.get("content"))
+    if not isinstance(text, str):
+        return None
+    role = record.get("role")
+    is_user = bool(record.get("is_user", role == "user"))
+    sender = record.get("sender") or ("You" if is_user else str(role or "Echo").capitalize())
+    timestamp = record.get("ts", record.get("timestamp"))
+    image = record.get("image")
+    return Message(
+        sender, is_user, text, timestamp if isinstance(timestamp, (int, float)) else None,
+        image=image if isinstance(image, str) else None
+    )
+
+
+class TranscriptImport:
+    """
+    One import of a JSONL file into a MessageStore
+
+    on_progress(status) is called from the importing thread after each
+    chunk and once at the end; it should only mark controls dirty (e.g.
+    on the UpdateScheduler) rather than update the page itself.
+    """
+
+    def __init__(self, store, path, chunk_size=1000, on_progress=None):
+        self.store = store
+        self.path = path
+        self.chunk_size = chunk_size
+        self.on_progress = on_progress
+        self._cancel = threading.Event()
+        self.status = ImportStatus(0, 0, 0.0)
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def start(self, page):
+        """Run on the page's handler threads; returns immediately"""
+        page.run_thread(self.run)
+
+    def run(self):
+        imported = skipped = read = 0
+        size = 1
+        try:
+            size = os.path.getsize(self.path) or 1
+            with open(self.path, "rb") as f:
+                chunk = []
+                for line in f:
+                    read += len(line)
+                    if not line.strip():
+                        continue
+                    message = parse_line(line)
+                    if message is None:
+                        skipped += 1
+                        continue
+                    chunk.append(message)
+                    if len(chunk) < self.chunk_size:
+                        continue
+
+                    self.store.extend(chunk)
+                    imported += len(chunk)
+                    chunk = []
+                    self._report(ImportStatus(imported, skipped, read / size))
+                    if self.cancelled:
+                        break
+                    # Let handler threads in between chunks
+                    time.sleep(0)
+                else:
+                    self.store.extend(chunk)
+                    imported += len(chunk)
+        except OSError as e:
+            self._report(ImportStatus(imported, skipped, read / size, True, error=str(e)))
+            return self.status
+
+        self._report(ImportStatus(imported, skipped, read / size, True, self.cancelled))
+        return self.status
+
+    def _report(self, status):
+        self.status = status
+        if self.on_progress:
+            self.on_progress(status)
+
+
+def main():
+    from .store import DEFAULT_CONVERSATION, open_store
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    parser.add_argument("--db", help="message store file (default: CHAT_DB or chat_history.sqlite3)")
+    parser.add_argument("--conversation", default=DEFAULT_CONVERSATION,
+                        help=f"conversation to add the messages to (default: {DEFAULT_CONVERSATION}, the desktop app's)")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    job = TranscriptImport(open_store(args.conversation, args.db), args.path, args.chunk_size,
+                           on_progress=lambda status: print(f"\r{status}", end="", flush=True))
+    try:
+        job.run()
+    except KeyboardInterrupt:
+        print(f"\rinterrupted; {job.status.imported} messages were stored")
+        return
+    print()
+
+
+if __name__ == "__main__":
+    main()
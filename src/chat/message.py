@@ -0,0 +1,43 @@
+"""
+Message Model
+Compact record for a chat message, kept separate from its bubble control
+"""
+
+import time
+
+
+class Message:
+    """
+    One chat message: id, sender, is_user, text, timestamp and an
+    optional image attachment (a local file path or a URL)
+
+    Uses __slots__ so a record costs a few dozen bytes on top of its
+    text. This is the source of truth for a message; MessageBubble
+    controls are only built from records when they are on screen.
+    `id` is None until the message store assigns one.
+
+    A store may load only the start of a very long text; `length` is
+    then the full length and `truncated` is true.
+    """
+
+    __slots__ = ("id", "sender", "is_user", "text", "timestamp", "image", "_length")
+
+    def __init__(self, sender, is_user, text, timestamp=None, id=None, length=None, image=None):
+        self.id = id
+        self.sender = sender
+        self.is_user = is_user
+        self.text = text
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.image = image
+        self._length = length if length is not None and length > len(text) else None
+
+    @property
+    def length(self):
+        return len(self.text) if self._length is None else self._length
+
+    @property
+    def truncated(self):
+        return self._length is not None
+
+    def __repr__(self):
+        return f"Message(id={self.id}, sender={self.sender!r}, is_user={self.is_user}, text={self.text[:40]!r})"
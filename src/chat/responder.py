@@ -0,0 +1,249 @@
+"""
+Responder Pipeline
+Streams replies from async producers into a single growing bubble
+"""
+
+import asyncio
+import logging
+import re
+import threading
+
+from components.message_bubble import is_large, update_message
+from .message import Message
+from .workers import run_in_pool
+
+logger = logging.getLogger(__name__)
+
+# Shown in a queued reply's bubble until its first chunk arrives
+WAITING = "…"
+
+
+async def echo_responder(text):
+    """Default producer: echoes the message back one word at a time"""
+    for chunk in re.findall(r"\s*\S+", text):
+        yield chunk
+        await asyncio.sleep(0)
+
+
+def pooled(fn):
+    """
+    Producer that runs fn(text) in the shared worker pool (see
+    chat.workers) and streams the result back one word at a time
+    """
+    async def produce(text):
+        reply = await run_in_pool(fn, text)
+        async for chunk in echo_responder(reply):
+            yield chunk
+
+    return produce
+
+
+class Busy(Exception):
+    """The session already has as many replies outstanding as its ReplyQueue allows"""
+
+
+class ReplyQueue:
+    """
+    One session's bounded queue of replies
+
+    At most `limit` replies can be outstanding; reserve() refuses more
+    by raising Busy, which is the backpressure a session gets when it
+    sends faster than its replies are produced. The replies it holds
+    are produced one at a time (see turn()), so a session never has
+    more than one job in the shared worker pool and sessions take turns
+    there however much one of them sends.
+
+    on_change(queue) is called whenever the number of outstanding
+    replies changes, on the thread that changed it.
+    """
+
+    def __init__(self, limit=3, on_change=None):
+        self.limit = limit
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._turn = None
+
+    @property
+    def pending(self):
+        return self._pending
+
+    @property
+    def full(self):
+        return self._pending >= self.limit
+
+    def reserve(self):
+        """Claim a place for one more reply, or raise Busy"""
+        with self._lock:
+            if self._pending >= self.limit:
+                raise Busy(f"{self._pending} replies outstanding")
+            self._pending += 1
+        self._changed()
+
+    def release(self):
+        with self._lock:
+            self._pending -= 1
+        self._changed()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change(self)
+
+    def turn(self):
+        """Lock a reply holds while it is produced; use on the page event loop"""
+        if self._turn is None:
+            self._turn = asyncio.Lock()
+        return self._turn
+
+
+class ResponderPipeline:
+    """
+    Produces replies off the event handler thread
+
+    reply_to() appends an empty reply item to the windowed chat list and
+    schedules the producer on the page event loop. `producer` is any
+    async generator function taking the user's text and yielding chunks;
+    chunks are accumulated and the bubble is marked on the session's
+    UpdateScheduler at most `max_rate` times per second, however fast
+    the producer yields.
+
+    With a ReplyQueue, replies are admitted and produced through it
+    (see reply_to()); cancel() stops every reply still in progress.
+
+    `chat_list` is the WindowedListView, or a function returning the
+    current one where it can be replaced (e.g. a ChatWindow's, which
+    set_props() may rebuild). Rows are looked up and changed under the
+    list's lock, since handler threads change the window while replies
+    stream in on the loop.
+    """
+
+    def __init__(self, page, chat_list, scheduler, producer=echo_responder, sender="Echo", max_rate=20,
+                 queue=None):
+        self.page = page
+        self._chat_list = chat_list
+        self.scheduler = scheduler
+        self.producer = producer
+        self.sender = sender
+        self.interval = 1 / max_rate
+        self.queue = queue
+        self._streams = set()
+        self._streams_lock = threading.Lock()
+
+    @property
+    def chat_list(self):
+        return self._chat_list() if callable(self._chat_list) else self._chat_list
+
+    def reply_to(self, text, before=None):
+        """
+        Start a reply to `text` and return the index of its item
+
+        Safe to call from a handler thread; call it before flushing the
+        list so the empty bubble goes out with the user's message.
+
+        With a queue, raises Busy when the session has its limit of
+        replies outstanding. before() runs once the reply is admitted and
+        ahead of its item, e.g. to append the user's message, so a
+        refused send leaves the list as it was.
+        """
+        if self.queue is not None:
+            self.queue.reserve()
+        try:
+            with self.chat_list.lock:
+                if before is not None:
+                    before()
+                message = Message(self.sender, False, "")
+                index = self.chat_list.append(message)
+                if self.queue is not None:
+                    # Marks the reply as in progress until its first chunk;
+                    # the new bubble goes out with the caller's flush of the list
+                    bubble = self.chat_list.row(index)
+                    if bubble is not None:
+                        update_message(bubble, WAITING, self.sender)
+        except BaseException:
+            if self.queue is not None:
+                self.queue.release()
+            raise
+        future = self.page.run_task(self._stream, index, message, text)
+        with self._streams_lock:
+            self._streams.add(future)
+        future.add_done_callback(self._finished)
+        return index
+
+    def _finished(self, future):
+        with self._streams_lock:
+            self._streams.discard(future)
+        if self.queue is not None:
+            self.queue.release()
+
+    def cancel(self):
+        """
+        Stop every reply still waiting or streaming, e.g. when the page
+        disconnects
+
+        Replies keep the text streamed so far. A job already running in
+        a worker process finishes there and its result is dropped.
+        """
+        with self._streams_lock:
+            streams = list(self._streams)
+        for future in streams:
+            future.cancel()
+
+    async def _stream(self, index, message, text):
+        if self.queue is None:
+            return await self._produce(index, message, text)
+        turn = self.queue.turn()
+        try:
+            await turn.acquire()
+        except asyncio.CancelledError:
+            self._render(index, message.text)
+            raise
+        try:
+            await self._produce(index, message, text)
+        finally:
+            turn.release()
+
+    async def _produce(self, index, message, text):
+        chunks = []
+        state = {"dirty": False, "done": False}
+
+        async def pump():
+            try:
+                async for chunk in self.producer(text):
+                    chunks.append(chunk)
+                    state["dirty"] = True
+            finally:
+                state["done"] = True
+
+        task = asyncio.create_task(pump())
+        try:
+            while not state["done"]:
+                await asyncio.sleep(self.interval)
+                if state["dirty"]:
+                    state["dirty"] = False
+                    self._render(index, "".join(chunks))
+            await task
+        except Exception:
+            logger.exception("Responder failed while replying to message %d", index)
+        finally:
+            # Only still running if the reply was cancelled
+            task.cancel()
+            message.text = "".join(chunks)
+            # Handler threads may be appending or scrolling meanwhile
+            with self.chat_list.lock:
+                self.chat_list.items[index] = message
+                if is_large(message, self.chat_list.large_message):
+                    # Swap the streamed bubble for an expandable one
+                    if self.chat_list.refresh(index):
+                        self.scheduler.mark(self.chat_list)
+                else:
+                    self._render(index, message.text)
+
+    def _render(self, index, text):
+        # The row is looked up on every flush: scrolling may have
+        # dropped it from the window or rebuilt it from the store.
+        # Long replies stream in cut to the large-message preview.
+        with self.chat_list.lock:
+            bubble = self.chat_list.row(index)
+            if bubble is not None:
+                update_message(bubble, text, self.sender, self.chat_list.large_message)
+                self.scheduler.mark(bubble)
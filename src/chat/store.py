@@ -0,0 +1,454 @@
+"""
+Message Store
+Persistent chat history in a local SQLite file
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from typing import NamedTuple
+
+from .message import Message
+
+SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY,
+    sender TEXT NOT NULL,
+    is_user INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    ts REAL NOT NULL,
+    image TEXT,
+    conversation_id TEXT NOT NULL,
+    seq INTEGER NOT NULL
+);
+"""
+
+# Created after _migrate(), since older files lack the columns
+INDEX_SCHEMA = """
+DROP INDEX IF EXISTS messages_ts;
+CREATE UNIQUE INDEX IF NOT EXISTS messages_seq ON messages (conversation_id, seq);
+CREATE INDEX IF NOT EXISTS messages_conversation_ts ON messages (conversation_id, ts);
+"""
+
+# Full-text index over message text, kept in step with the table by
+# triggers, so every append (and a streamed reply's final rewrite) is
+# indexed in the same transaction
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+    text, content = 'messages', content_rowid = 'id', prefix = '2 3'
+);
+CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_update AFTER UPDATE OF text ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+    INSERT INTO messages_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts (messages_fts, rowid, text) VALUES ('delete', old.id, old.text);
+END;
+"""
+
+COLUMNS = "id, sender, is_user, text, ts, image"
+QUALIFIED_COLUMNS = ", ".join(f"messages.{column}" for column in COLUMNS.split(", "))
+
+INSERT = "INSERT INTO messages (sender, is_user, text, ts, image, conversation_id, seq) VALUES (?, ?, ?, ?, ?, ?, ?)"
+
+# Wrap matched words in search results
+MATCH_START = "\x02"
+MATCH_END = "\x03"
+
+DEFAULT_FILENAME = "chat_history.sqlite3"
+
+# Conversation of the desktop app, and of history written before
+# messages were kept per conversation
+DEFAULT_CONVERSATION = "local"
+
+# Prefix of the conversations of web sessions, which only last as long as
+# their session (see MessageDatabase.delete_conversation())
+SESSION_CONVERSATION = "session:"
+
+# Seconds a Flet web session outlives its disconnected tab
+SESSION_TIMEOUT = 3600
+
+
+def _message(row):
+    id, sender, is_user, text, ts, image, *length = row
+    return Message(sender, bool(is_user), text, ts, id, length[0] if length else None, image)
+
+
+class SearchHit(NamedTuple):
+    index: int          # position in the conversation, as used by the chat list
+    message: Message
+    marked: str         # excerpt with matches between MATCH_START and MATCH_END
+
+
+class MessageDatabase:
+    """
+    SQLite file holding every conversation's messages
+
+    One per process, shared by all sessions: conversation() hands out
+    the MessageStore for one conversation, and all of them use this
+    connection and lock.
+
+    Conversations are kept until deleted. Those of web sessions are
+    deleted when their session closes; expire() drops the ones a server
+    left behind when it stopped before their sessions closed.
+    """
+
+    def __init__(self, path=":memory:"):
+        self.path = path
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self._migrate()
+        self.db.executescript(INDEX_SCHEMA)
+        self.searchable = self._create_index()
+        self._conversations = weakref.WeakValueDictionary()
+
+    def _migrate(self):
+        columns = {row[1] for row in self.db.execute("PRAGMA table_info(messages)")}
+        if "image" not in columns:
+            # History written before messages could carry an image
+            self.db.execute("ALTER TABLE messages ADD COLUMN image TEXT")
+        if "conversation_id" not in columns:
+            # History written before messages were kept per conversation
+            # becomes the default conversation, in its original order
+            self.db.execute(
+                f"ALTER TABLE messages ADD COLUMN conversation_id TEXT NOT NULL DEFAULT '{DEFAULT_CONVERSATION}'"
+            )
+            self.db.execute("ALTER TABLE messages ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+            self.db.execute("UPDATE messages SET seq = id")
+        self.db.commit()
+
+    def _create_index(self):
+        try:
+            exists = self.db.execute(
+                "SELECT 1 FROM sqlite_master WHERE name = 'messages_fts'"
+            ).fetchone()
+            self.db.executescript(SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            # SQLite built without FTS5; search() falls back to a scan
+            return False
+        if not exists and self.db.execute("SELECT 1 FROM messages LIMIT 1").fetchone():
+            # History written before the index existed
+            self.db.execute("INSERT INTO messages_fts (messages_fts) VALUES ('rebuild')")
+            self.db.commit()
+        return True
+
+    def conversation(self, conversation_id=DEFAULT_CONVERSATION, preview_chars=None):
+        """
+        The MessageStore for one conversation
+
+        Sessions asking for the same conversation share one store, so
+        its length stays in step however many are open; `preview_chars`
+        only applies to the call that creates it.
+        """
+        with self.lock:
+            store = self._conversations.get(conversation_id)
+            if store is None:
+                store = MessageStore(self, preview_chars, conversation_id)
+                self._conversations[conversation_id] = store
+            return store
+
+    def delete_conversation(self, conversation_id):
+        """Delete every message of a conversation; its open store, if any, becomes empty"""
+        with self.lock:
+            self.db.execute("DELETE FROM messages WHERE conversation_id = ?", (conversation_id,))
+            self.db.commit()
+            store = self._conversations.get(conversation_id)
+            if store is not None:
+                store._count = 0
+
+    def expire(self, prefix=SESSION_CONVERSATION, idle=SESSION_TIMEOUT):
+        """
+        Delete the conversations whose id starts with `prefix`, that
+        nobody has open and that have had no message for `idle` seconds;
+        returns how many
+        """
+        with self.lock:
+            stale = [
+                conversation_id for (conversation_id,) in self.db.execute(
+                    "SELECT conversation_id FROM messages WHERE substr(conversation_id, 1, ?) = ? "
+                    "GROUP BY conversation_id HAVING MAX(ts) < ?",
+                    (len(prefix), prefix, time.time() - idle)
+                )
+                if conversation_id not in self._conversations
+            ]
+            self.db.executemany("DELETE FROM messages WHERE conversation_id = ?", [(c,) for c in stale])
+            self.db.commit()
+        return len(stale)
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+class MessageStore:
+    """
+    Append-only history of one conversation, indexed by position and time
+
+    Messages are only deleted with their whole conversation (a streamed
+    reply may rewrite its own text once it completes), and each is
+    stored with its position in its conversation, so the store can act
+    as a sequence of Message records: len() and slices map onto ranges
+    of the (conversation, position) index and never scan the table. That makes it a drop-in
+    `items` source for the windowed ChatMessagesList, which only reads
+    the rows it is about to show. Message ids are unique across
+    conversations and are not positions.
+
+    `database` is a MessageDatabase, usually shared with other
+    conversations (see open_store()), or a file path to open one for
+    this store alone.
+
+    Message text is also kept in an FTS5 index for search().
+
+    With `preview_chars` set, messages read by position or time carry
+    only the first that many characters of their text (see
+    Message.truncated), so paging a window over pasted logs doesn't pull
+    megabytes out of the database; read_text() fetches the rest in parts.
+    """
+
+    def __init__(self, database=":memory:", preview_chars=None, conversation_id=DEFAULT_CONVERSATION):
+        self._owns_database = not isinstance(database, MessageDatabase)
+        self.database = MessageDatabase(database) if self._owns_database else database
+        self.path = self.database.path
+        self.preview_chars = preview_chars
+        self.conversation_id = conversation_id
+        self._lock = self.database.lock
+        self._db = self.database.db
+        (self._count,) = self._db.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM messages WHERE conversation_id = ?", (conversation_id,)
+        ).fetchone()
+
+    @property
+    def searchable(self):
+        return self.database.searchable
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._count)
+            if step != 1:
+                raise ValueError("MessageStore only supports contiguous slices")
+            return self.rows(start, stop - start)
+
+        index = key + self._count if key < 0 else key
+        if not 0 <= index < self._count:
+            raise IndexError("message index out of range")
+        return self.rows(index, 1)[0]
+
+    def __setitem__(self, index, message):
+        if not 0 <= index < self._count:
+            raise IndexError("message index out of range")
+        if message.truncated:
+            raise ValueError("can't store a message loaded as a preview")
+        with self._lock:
+            self._db.execute(
+                "UPDATE messages SET sender = ?, is_user = ?, text = ?, image = ? "
+                "WHERE conversation_id = ? AND seq = ?",
+                (message.sender, int(message.is_user), message.text, message.image, self.conversation_id, index + 1)
+            )
+            self._db.commit()
+
+    def append(self, message):
+        """Store a Message, assigning its id"""
+        message.id = self.add(message.sender, message.is_user, message.text, message.timestamp, message.image)
+        return message.id
+
+    def add(self, sender, is_user, text, timestamp=None, image=None):
+        """Store a message and return its id"""
+        with self._lock:
+            seq = self._count + 1
+            cursor = self._db.execute(
+                INSERT,
+                (sender, int(is_user), text, time.time() if timestamp is None else timestamp, image,
+                 self.conversation_id, seq)
+            )
+            self._db.commit()
+            self._count = seq
+            return cursor.lastrowid
+
+    def extend(self, messages):
+        """
+        Store a batch of Messages in one transaction, assigning their ids
+
+        Each call holds the store lock for the whole batch, so callers
+        importing many messages should pass bounded chunks to let reads
+        from the UI in between.
+        """
+        if not messages:
+            return
+        with self._lock:
+            first = self._count + 1
+            rows = [
+                (m.sender, int(m.is_user), m.text, time.time() if m.timestamp is None else m.timestamp, m.image,
+                 self.conversation_id, seq)
+                for seq, m in enumerate(messages, first)
+            ]
+            self._db.executemany(INSERT, rows)
+            self._db.commit()
+            ids = self._db.execute(
+                "SELECT id FROM messages WHERE conversation_id = ? AND seq >= ? ORDER BY seq",
+                (self.conversation_id, first)
+            ).fetchall()
+            self._count = first + len(rows) - 1
+        for (id,), message in zip(ids, messages):
+            message.id = id
+
+    @property
+    def _columns(self):
+        """COLUMNS, with the text cut to `preview_chars` and its full length added"""
+        if self.preview_chars is None:
+            return COLUMNS
+        return f"id, sender, is_user, substr(text, 1, {int(self.preview_chars)}), ts, image, length(text)"
+
+    def rows(self, start, count):
+        """`count` messages starting at position `start` (0-based, oldest first)"""
+        if count <= 0:
+            return []
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {self._columns} FROM messages "
+                "WHERE conversation_id = ? AND seq > ? AND seq <= ? ORDER BY seq",
+                (self.conversation_id, start, start + count)
+            ).fetchall()
+        return [_message(row) for row in rows]
+
+    def get(self, message_id):
+        """Message of this conversation with the given id, or None"""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {self._columns} FROM messages WHERE id = ? AND conversation_id = ?",
+                (message_id, self.conversation_id)
+            ).fetchone()
+        return _message(row) if row else None
+
+    def read_text(self, message_id, start=0, length=None):
+        """
+        Part of a message's text: `length` characters (default: the rest)
+        from character `start`, without loading the whole text
+        """
+        with self._lock:
+            if length is None:
+                row = self._db.execute(
+                    "SELECT substr(text, ?) FROM messages WHERE id = ? AND conversation_id = ?",
+                    (start + 1, message_id, self.conversation_id)
+                ).fetchone()
+            else:
+                row = self._db.execute(
+                    "SELECT substr(text, ?, ?) FROM messages WHERE id = ? AND conversation_id = ?",
+                    (start + 1, length, message_id, self.conversation_id)
+                ).fetchone()
+        return row[0] if row else ""
+
+    def since(self, timestamp, limit=100):
+        """The first `limit` messages sent at or after `timestamp`"""
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {self._columns} FROM messages WHERE conversation_id = ? AND ts >= ? ORDER BY ts LIMIT ?",
+                (self.conversation_id, timestamp, limit)
+            ).fetchall()
+        return [_message(row) for row in rows]
+
+    def search(self, query, limit=20):
+        """
+        The newest `limit` messages of this conversation containing every
+        word of `query`
+
+        Words match as prefixes, so results update sensibly while the
+        query is being typed. Any punctuation in the query is ignored.
+        """
+        words = re.findall(r"\w+", query)
+        if not words:
+            return []
+        if not self.searchable:
+            return self._scan(words, limit)
+
+        match = " ".join(f'"{word}"*' for word in words)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {QUALIFIED_COLUMNS}, messages.seq, snippet(messages_fts, 0, ?, ?, '…', 16) "
+                "FROM messages_fts JOIN messages ON messages.id = messages_fts.rowid "
+                "WHERE messages_fts MATCH ? AND messages.conversation_id = ? "
+                "ORDER BY messages_fts.rowid DESC LIMIT ?",
+                (MATCH_START, MATCH_END, match, self.conversation_id, limit)
+            ).fetchall()
+        return [SearchHit(row[6] - 1, _message(row[:6]), row[7]) for row in rows]
+
+    def _scan(self, words, limit):
+        where = " AND ".join("text LIKE ?" for _ in words)
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT {COLUMNS}, seq FROM messages WHERE conversation_id = ? AND {where} ORDER BY seq DESC LIMIT ?",
+                [self.conversation_id] + [f"%{word}%" for word in words] + [limit]
+            ).fetchall()
+        pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+        return [
+            SearchHit(
+                row[6] - 1, _message(row[:6]),
+                pattern.sub(lambda m: f"{MATCH_START}{m.group(0)}{MATCH_END}", row[3])
+            )
+            for row in rows
+        ]
+
+    def close(self):
+        """Close the database, if this store opened it"""
+        if self._owns_database:
+            self.database.close()
+
+
+_database = None
+_database_lock = threading.Lock()
+
+
+def open_database(path=None):
+    """
+    Process-wide MessageDatabase
+
+    The file goes to CHAT_DB if set, otherwise into the app data directory
+    Flet provides for packaged apps (the working directory when run from source).
+    `path` only applies to the call that opens the database.
+
+    Opening it deletes the web session conversations an earlier server
+    left behind: those idle for longer than sessions last
+    (FLET_SESSION_TIMEOUT seconds, default SESSION_TIMEOUT).
+    """
+    global _database
+    with _database_lock:
+        if _database is None:
+            path = path or os.getenv("CHAT_DB") or os.path.join(
+                os.getenv("FLET_APP_STORAGE_DATA", "."), DEFAULT_FILENAME
+            )
+            _database = MessageDatabase(path)
+            _database.expire(idle=int(os.getenv("FLET_SESSION_TIMEOUT", SESSION_TIMEOUT)))
+        return _database
+
+
+def open_store(conversation_id=DEFAULT_CONVERSATION, path=None, preview_chars=None):
+    """
+    MessageStore for one conversation in the process-wide database
+
+    Each web session should pass its own `conversation_id`, so users only
+    see and search their own messages: session_conversation() names one
+    that is deleted with the session.
+    """
+    return open_database(path).conversation(conversation_id, preview_chars)
+
+
+def session_conversation(page):
+    """
+    Conversation id for a web session's history; sets page.on_close to
+    delete it when the session closes (FLET_SESSION_TIMEOUT seconds after
+    its tab disconnects)
+    """
+    conversation_id = f"{SESSION_CONVERSATION}{page.session_id}"
+    page.on_close = lambda e: open_database().delete_conversation(conversation_id)
+    return conversation_id
@@ -0,0 +1,101 @@
+"""
+Reply Workers
+Process pool shared by every session for CPU-heavy reply generation
+
+Work done in a handler or on the page event loop holds up every other
+event of its session, and threads don't help with pure-Python work
+because of the GIL. Functions run with run_in_pool() execute in
+CHAT_REPLY_WORKERS worker processes (default: one per core) instead.
+
+They must be plain module-level functions of picklable arguments, in
+modules that don't import flet, so workers start quickly: this module
+only uses the standard library and holds the default job, echo().
+Spawned workers also import the app's main script again, as
+__mp_main__, which is why main.py only imports flet inside main().
+
+With CHAT_REPLY_WORKERS=0, or where processes can't be started (mobile
+builds), jobs run on a thread pool: off the event loop, but sharing the
+GIL with the app.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+logger = logging.getLogger(__name__)
+
+
+def echo(text):
+    """Default reply job: the text itself; stands in for real generation"""
+    return text
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _threads():
+    return ThreadPoolExecutor(os.cpu_count() or 1, thread_name_prefix="reply")
+
+
+def open_pool(workers=None):
+    """
+    Process-wide executor for reply jobs, created on first use
+
+    Workers are spawned rather than forked, since the app process runs
+    threads that a forked child would inherit mid-operation. Arguments
+    only apply to the call that creates the pool.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            if workers is None:
+                workers = int(os.getenv("CHAT_REPLY_WORKERS", os.cpu_count() or 1))
+            if workers > 0:
+                try:
+                    _pool = ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn"))
+                except (NotImplementedError, OSError) as e:
+                    logger.warning("No reply worker processes (%s); running replies on threads", e)
+            if _pool is None:
+                _pool = _threads()
+        return _pool
+
+
+def _replace_pool(broken, threads=False):
+    """Drop a pool that can't take jobs; the next open_pool() makes a new one"""
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = _threads() if threads else None
+    broken.shutdown(wait=False)
+
+
+async def run_in_pool(fn, *args):
+    """
+    Result of fn(*args) from the shared pool
+
+    Cancelling the awaiting task drops a job that hasn't started; one
+    already running in a worker finishes and its result is discarded.
+    """
+    loop = asyncio.get_running_loop()
+    pool = open_pool()
+    try:
+        # Worker processes are started here, as jobs are submitted
+        future = loop.run_in_executor(pool, fn, *args)
+    except (NotImplementedError, OSError) as e:
+        if not isinstance(pool, ProcessPoolExecutor):
+            raise
+        logger.warning("Can't start reply worker processes (%s); running replies on threads", e)
+        _replace_pool(pool, threads=True)
+        future = loop.run_in_executor(open_pool(), fn, *args)
+    try:
+        return await future
+    except BrokenProcessPool:
+        # A worker died (killed, out of memory); later jobs get a new pool
+        logger.warning("Reply worker pool broke; starting a new one")
+        _replace_pool(pool)
+        raise
@@ -1 +1,39 @@
-# Components package
\ No newline at end of file
+"""
+Components package
+
+Components are exported lazily: `from components import ChatInput`
+imports only the module that defines it, on first use.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "Button": ".atoms.button",
+    "Input": ".atoms.input",
+    "TokenButton": (".atoms.button_with_tokens", "Button"),
+    "InputWithButton": ".molecules.input_with_button",
+    "ChatContainer": ".chat_container",
+    "ChatWindow": ".organisms.chat_window",
+    "DebugOverlay": ".organisms.debug_overlay",
+    "ImportProgress": ".organisms.import_progress",
+    "Organism": ".organisms.base",
+    "ChatInput": ".chat_input",
+    "ChatMessagesList": ".chat_messages_list",
+    "MessageBubble": ".message_bubble",
+    "LargeMessageBubble": ".message_bubble",
+    "SearchBar": ".organisms.search_bar",
+}
+
+
+def __getattr__(name):
+    target = _EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module, attr = target if isinstance(target, tuple) else (target, name)
+    value = getattr(importlib.import_module(module, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
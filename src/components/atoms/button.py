@@ -1,7 +1,62 @@
+from typing import NamedTuple
+
 import flet as ft
+from perf.instrumentation import component, handler
+
+
+class ButtonStyle(NamedTuple):
+    bgcolor: str
+    color: str
+    border: object
+    height: int
+    padding: ft.Padding
+
+
+# Variant styles: (bgcolor, color, border) per theme
+VARIANT_STYLES = {
+    "light": {
+        "primary": (ft.Colors.BLUE, ft.Colors.WHITE, None),
+        "secondary": (ft.Colors.GREY_300, ft.Colors.BLACK, None),
+        "danger": (ft.Colors.RED, ft.Colors.WHITE, None),
+        "ghost": (ft.Colors.TRANSPARENT, ft.Colors.BLUE, ft.border.all(1, ft.Colors.BLUE)),
+    },
+    "dark": {
+        "primary": (ft.Colors.BLUE_300, ft.Colors.BLACK, None),
+        "secondary": (ft.Colors.GREY_700, ft.Colors.WHITE, None),
+        "danger": (ft.Colors.RED_300, ft.Colors.BLACK, None),
+        "ghost": (ft.Colors.TRANSPARENT, ft.Colors.BLUE_300, ft.border.all(1, ft.Colors.BLUE_300)),
+    },
+}
+
+# Size styles: (height, padding)
+SIZE_STYLES = {
+    "small": (32, ft.padding.symmetric(horizontal=12)),
+    "medium": (40, ft.padding.symmetric(horizontal=16)),
+    "large": (48, ft.padding.symmetric(horizontal=20)),
+}
 
+# Every (variant, size, theme) combination, built once at import and
+# shared by all buttons in all sessions. Treat the records as read-only.
+STYLES = {
+    (variant, size, theme): ButtonStyle(bgcolor, color, border, height, padding)
+    for theme, variants in VARIANT_STYLES.items()
+    for variant, (bgcolor, color, border) in variants.items()
+    for size, (height, padding) in SIZE_STYLES.items()
+}
 
-def Button(text="Button", variant="primary", size="medium", on_click=None, icon=None):
+
+def resolve_style(variant, size, theme="light"):
+    style = STYLES.get((variant, size, theme))
+    if style is None:
+        theme = theme if theme in VARIANT_STYLES else "light"
+        variant = variant if variant in VARIANT_STYLES[theme] else "primary"
+        size = size if size in SIZE_STYLES else "medium"
+        style = STYLES[(variant, size, theme)]
+    return style
+
+
+@component
+def Button(text="Button", variant="primary", size="medium", on_click=None, icon=None, ref=None, theme="light"):
     """
     Atomic Button component with variants
     
@@ -15,41 +70,13 @@ def Button(text="Button", variant="primary", size="medium", on_click=None, icon=
     - small: 32px height
     - medium: 40px height
     - large: 48px height
-    """
     
-    # Variant styles
-    variant_styles = {
-        "primary": {
-            "bgcolor": ft.Colors.BLUE,
-            "color": ft.Colors.WHITE,
-            "border": None
-        },
-        "secondary": {
-            "bgcolor": ft.Colors.GREY_300,
-            "color": ft.Colors.BLACK,
-            "border": None
-        },
-        "danger": {
-            "bgcolor": ft.Colors.RED,
-            "color": ft.Colors.WHITE,
-            "border": None
-        },
-        "ghost": {
-            "bgcolor": ft.Colors.TRANSPARENT,
-            "color": ft.Colors.BLUE,
-            "border": ft.border.all(1, ft.Colors.BLUE)
-        }
-    }
+    Themes: light, dark
     
-    # Size styles
-    size_styles = {
-        "small": {"height": 32, "padding": ft.padding.symmetric(horizontal=12)},
-        "medium": {"height": 40, "padding": ft.padding.symmetric(horizontal=16)},
-        "large": {"height": 48, "padding": ft.padding.symmetric(horizontal=20)}
-    }
+    Pass an ft.Ref as `ref` to get a handle on the button container.
+    """
     
-    style = variant_styles.get(variant, variant_styles["primary"])
-    size_style = size_styles.get(size, size_styles["medium"])
+    style = resolve_style(variant, size, theme)
     
     # Build row content, filtering out None values
     row_content = []
@@ -63,11 +90,12 @@ def Button(text="Button", variant="primary", size="medium", on_click=None, icon=
             alignment=ft.MainAxisAlignment.CENTER,
             spacing=8
         ),
-        bgcolor=style["bgcolor"],
-        border=style.get("border"),
+        bgcolor=style.bgcolor,
+        border=style.border,
         border_radius=6,
-        padding=size_style["padding"],
-        height=size_style["height"],
-        on_click=on_click,
-        ink=True
-    )
\ No newline at end of file
+        padding=style.padding,
+        height=style.height,
+        on_click=handler(on_click, "Button.on_click"),
+        ink=True,
+        ref=ref
+    )
@@ -1,81 +1,109 @@
+from typing import NamedTuple
+
 import flet as ft
+from perf.instrumentation import component, handler
+from design_tokens import colors
 from design_tokens.colors import Colors
 from design_tokens.spacing import Spacing
 from design_tokens.typography import Typography
 from design_tokens.borders import Borders
+from design_tokens.compiled import TOKENS
+from design_tokens.theme import Roles
+
+
+class ButtonStyle(NamedTuple):
+    bgcolor: str
+    color: str
+    border: object
+    height: int
+    padding: ft.Padding
+    text_size: int
+
+
+# Variant styles using design tokens: (bgcolor, color, border) per theme.
+# "auto" uses ColorScheme roles and follows the page theme; "light" and
+# "dark" pin literal token colors.
+VARIANT_STYLES = {
+    "auto": {
+        "primary": (Roles.PRIMARY, Roles.ON_PRIMARY, None),
+        "secondary": (Roles.SECONDARY_LIGHT, Roles.SECONDARY_DARK, None),
+        "danger": (Roles.DANGER, Roles.ON_DANGER, None),
+        "ghost": (Roles.BG_PRIMARY, Roles.PRIMARY, ft.border.all(Borders.WIDTH_THIN, Roles.PRIMARY)),
+    },
+    "light": {
+        "primary": (Colors.PRIMARY, Colors.TEXT_INVERSE, None),
+        "secondary": (Colors.SECONDARY_LIGHT, Colors.TEXT_PRIMARY, None),
+        "danger": (Colors.DANGER, Colors.TEXT_INVERSE, None),
+        "ghost": (Colors.WHITE, Colors.PRIMARY, TOKENS.border.PRIMARY),
+    },
+    "dark": {
+        "primary": (colors.PRIMARY_100, Colors.PRIMARY_DARK, None),
+        "secondary": (colors.SECONDARY_600, Colors.TEXT_INVERSE, None),
+        "danger": (colors.DANGER_50, colors.DANGER_600, None),
+        "ghost": (Colors.BG_DARK, colors.PRIMARY_100, ft.border.all(Borders.WIDTH_THIN, colors.PRIMARY_100)),
+    },
+}
+
+# Size styles using design tokens: (height, padding, text_size)
+SIZE_STYLES = {
+    "small": (
+        32,
+        ft.padding.symmetric(horizontal=Spacing.SM, vertical=Spacing.XS),
+        Typography.CAPTION["size"]
+    ),
+    "medium": (
+        40,
+        ft.padding.symmetric(horizontal=Spacing.MD, vertical=Spacing.SM),
+        Typography.BUTTON["size"]
+    ),
+    "large": (
+        48,
+        ft.padding.symmetric(horizontal=Spacing.LG, vertical=Spacing.MD),
+        Typography.BODY["size"]
+    ),
+}
+
+# Every (variant, size, theme) combination, built once at import and
+# shared by all buttons in all sessions. Treat the records as read-only.
+STYLES = {
+    (variant, size, theme): ButtonStyle(bgcolor, color, border, height, padding, text_size)
+    for theme, variants in VARIANT_STYLES.items()
+    for variant, (bgcolor, color, border) in variants.items()
+    for size, (height, padding, text_size) in SIZE_STYLES.items()
+}
 
 
-def Button(text="Button", variant="primary", size="medium", on_click=None, icon=None):
+def resolve_style(variant, size, theme="auto"):
+    style = STYLES.get((variant, size, theme))
+    if style is None:
+        theme = theme if theme in VARIANT_STYLES else "auto"
+        variant = variant if variant in VARIANT_STYLES[theme] else "primary"
+        size = size if size in SIZE_STYLES else "medium"
+        style = STYLES[(variant, size, theme)]
+    return style
+
+
+@component
+def Button(text="Button", variant="primary", size="medium", on_click=None, icon=None, ref=None, theme="auto"):
     """
     Button component using Design Tokens
     Demonstrates how to use centralized design system
-    """
     
-    # Variant styles using design tokens
-    variant_styles = {
-        "primary": {
-            "bgcolor": Colors.PRIMARY,
-            "color": Colors.TEXT_INVERSE,
-            "border": None
-        },
-        "secondary": {
-            "bgcolor": Colors.SECONDARY_LIGHT,
-            "color": Colors.TEXT_PRIMARY,
-            "border": None
-        },
-        "danger": {
-            "bgcolor": Colors.DANGER,
-            "color": Colors.TEXT_INVERSE,
-            "border": None
-        },
-        "ghost": {
-            "bgcolor": Colors.WHITE,
-            "color": Colors.PRIMARY,
-            "border": ft.border.all(Borders.WIDTH_THIN, Colors.PRIMARY)
-        }
-    }
-    
-    # Size styles using design tokens
-    size_styles = {
-        "small": {
-            "height": 32,
-            "padding": ft.padding.symmetric(
-                horizontal=Spacing.SM, 
-                vertical=Spacing.XS
-            ),
-            "text_size": Typography.CAPTION["size"]
-        },
-        "medium": {
-            "height": 40,
-            "padding": ft.padding.symmetric(
-                horizontal=Spacing.MD, 
-                vertical=Spacing.SM
-            ),
-            "text_size": Typography.BUTTON["size"]
-        },
-        "large": {
-            "height": 48,
-            "padding": ft.padding.symmetric(
-                horizontal=Spacing.LG, 
-                vertical=Spacing.MD
-            ),
-            "text_size": Typography.BODY["size"]
-        }
-    }
+    Themes: auto (follows the page theme), light, dark
+    """
     
-    style = variant_styles.get(variant, variant_styles["primary"])
-    size_style = size_styles.get(size, size_styles["medium"])
+    style = resolve_style(variant, size, theme)
     
     # Build row content
     row_content = []
     if icon:
-        row_content.append(ft.Icon(icon, size=16, color=style["color"]))
+        row_content.append(ft.Icon(icon, size=16, color=style.color))
     row_content.append(
         ft.Text(
             text, 
             weight=Typography.BUTTON["weight"],
-            size=size_style["text_size"],
-            color=style["color"]
+            size=style.text_size,
+            color=style.color
         )
     )
     
@@ -85,11 +113,12 @@ def Button(text="Button", variant="primary", size="medium", on_click=None, icon=
             alignment=ft.MainAxisAlignment.CENTER,
             spacing=Spacing.SM
         ),
-        bgcolor=style["bgcolor"],
-        border=style.get("border"),
-        border_radius=Borders.RADIUS_BUTTON,
-        padding=size_style["padding"],
-        height=size_style["height"],
-        on_click=on_click,
-        ink=True
-    )
\ No newline at end of file
+        bgcolor=style.bgcolor,
+        border=style.border,
+        border_radius=TOKENS.radius.BUTTON,
+        padding=style.padding,
+        height=style.height,
+        on_click=handler(on_click, "TokenButton.on_click"),
+        ink=True,
+        ref=ref
+    )
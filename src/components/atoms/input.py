@@ -1,7 +1,61 @@
+from typing import NamedTuple
+
 import flet as ft
+from perf.instrumentation import component, handler
+from ..events import coalesce
+
+
+class InputStyle(NamedTuple):
+    border: ft.InputBorder
+    bgcolor: str
+    height: int
+    text_size: int
+
+
+# Variant styles: (border, bgcolor) per theme
+VARIANT_STYLES = {
+    "light": {
+        "default": (ft.InputBorder.UNDERLINE, ft.Colors.TRANSPARENT),
+        "outlined": (ft.InputBorder.OUTLINE, ft.Colors.TRANSPARENT),
+        "filled": (ft.InputBorder.NONE, ft.Colors.GREY_100),
+    },
+    "dark": {
+        "default": (ft.InputBorder.UNDERLINE, ft.Colors.TRANSPARENT),
+        "outlined": (ft.InputBorder.OUTLINE, ft.Colors.TRANSPARENT),
+        "filled": (ft.InputBorder.NONE, ft.Colors.GREY_800),
+    },
+}
+
+# Size styles: (height, text_size)
+SIZE_STYLES = {
+    "small": (32, 12),
+    "medium": (40, 14),
+    "large": (48, 16),
+}
 
+# Every (variant, size, theme) combination, built once at import and
+# shared by all inputs in all sessions
+STYLES = {
+    (variant, size, theme): InputStyle(border, bgcolor, height, text_size)
+    for theme, variants in VARIANT_STYLES.items()
+    for variant, (border, bgcolor) in variants.items()
+    for size, (height, text_size) in SIZE_STYLES.items()
+}
 
-def Input(placeholder="Enter text...", variant="default", size="medium", on_change=None, on_submit=None):
+
+def resolve_style(variant, size, theme="light"):
+    style = STYLES.get((variant, size, theme))
+    if style is None:
+        theme = theme if theme in VARIANT_STYLES else "light"
+        variant = variant if variant in VARIANT_STYLES[theme] else "default"
+        size = size if size in SIZE_STYLES else "medium"
+        style = STYLES[(variant, size, theme)]
+    return style
+
+
+@component
+def Input(placeholder="Enter text...", variant="default", size="medium", on_change=None, on_submit=None, ref=None, theme="light",
+          change_mode="immediate", change_wait=0.3):
     """
     Atomic Input component with variants
     
@@ -14,41 +68,32 @@ def Input(placeholder="Enter text...", variant="default", size="medium", on_chan
     - small: 32px height
     - medium: 40px height
     - large: 48px height
-    """
     
-    # Variant styles
-    variant_styles = {
-        "default": {
-            "border": ft.InputBorder.UNDERLINE,
-            "bgcolor": ft.Colors.TRANSPARENT
-        },
-        "outlined": {
-            "border": ft.InputBorder.OUTLINE,
-            "bgcolor": ft.Colors.TRANSPARENT
-        },
-        "filled": {
-            "border": ft.InputBorder.NONE,
-            "bgcolor": ft.Colors.GREY_100
-        }
-    }
+    Themes: light, dark
+    
+    Change modes (see events.ChangeCoalescer):
+    - immediate: on_change runs for every keystroke
+    - debounce: once typing pauses for change_wait seconds
+    - throttle: at most once every change_wait seconds
+    - idle: once typing pauses, only if the value changed; also on blur
+    Outside immediate mode the TextField's on_change is the coalescer,
+    so its counters are at `field.on_change.stats()`.
     
-    # Size styles
-    size_styles = {
-        "small": {"height": 32, "text_size": 12},
-        "medium": {"height": 40, "text_size": 14},
-        "large": {"height": 48, "text_size": 16}
-    }
+    Pass an ft.Ref as `ref` to get a handle on the TextField.
+    """
     
-    style = variant_styles.get(variant, variant_styles["default"])
-    size_style = size_styles.get(size, size_styles["medium"])
+    style = resolve_style(variant, size, theme)
+    on_change = coalesce(handler(on_change, "Input.on_change"), change_mode, change_wait)
     
     return ft.TextField(
         hint_text=placeholder,
-        border=style["border"],
-        bgcolor=style["bgcolor"],
-        height=size_style["height"],
-        text_size=size_style["text_size"],
+        border=style.border,
+        bgcolor=style.bgcolor,
+        height=style.height,
+        text_size=style.text_size,
         on_change=on_change,
-        on_submit=on_submit,
-        border_radius=6
-    )
\ No newline at end of file
+        on_blur=on_change.flush if change_mode == "idle" and on_change else None,
+        on_submit=handler(on_submit, "Input.on_submit"),
+        border_radius=6,
+        ref=ref
+    )
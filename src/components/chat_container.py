@@ -1,6 +1,8 @@
 import flet as ft
+from perf.instrumentation import component
 
 
+@component
 def ChatContainer(children):
     return ft.Container(
         ft.Container(
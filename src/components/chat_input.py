@@ -1,15 +1,25 @@
 import flet as ft
+from perf.instrumentation import component, handler
 
 
-def ChatInput(on_send, on_submit):
+@component
+def ChatInput(on_send, on_submit, refs=None, name="chat_input"):
+    """
+    Chat text field with a send button
+
+    When a RefRegistry is passed as `refs`, the controls are registered
+    as "<name>.field" and "<name>.send".
+    """
     return ft.Row([
         ft.TextField(
             hint_text="Type a message...",
             expand=True,
-            on_submit=on_submit
+            on_submit=handler(on_submit, "ChatInput.on_submit"),
+            ref=refs.ref(f"{name}.field") if refs else None
         ),
         ft.IconButton(
             icon=ft.Icons.SEND,
-            on_click=on_send
+            on_click=handler(on_send, "ChatInput.on_send"),
+            ref=refs.ref(f"{name}.send") if refs else None
         )
-    ])
\ No newline at end of file
+    ])
@@ -1,5 +1,380 @@
+import threading
+import time
+
 import flet as ft
+from perf.instrumentation import component
+from .message_bubble import (
+    AVATAR_SIZE, LARGE_MESSAGE, LargeMessageBubble, MessageBubble, MessageGroupBubble, append_to_group, group_part,
+    is_large
+)
+
+
+@component
+def ChatMessagesList(windowed=False, items=None, build_item=None, window_size=40, overscan=20, group_runs=False,
+                     large_message=LARGE_MESSAGE, thumbnails=None, avatars=None, scheduler=None):
+    """
+    Chat history list
+
+    By default returns a plain ListView and the caller appends bubbles to
+    its controls. With windowed=True returns a WindowedListView that keeps
+    only the visible rows plus an overscan buffer as real controls;
+    group_runs=True additionally merges consecutive messages from the
+    same sender into one bubble.
+
+    Messages longer than `large_message` characters get a
+    LargeMessageBubble, reading further chunks from `items` when it is a
+    MessageStore; None turns this off.
+
+    Message images, and avatars from `avatars` ({sender: image path}),
+    are shown as thumbnails from `thumbnails` (a media.thumbnails
+    ThumbnailCache) when one is given, and as they are otherwise.
+
+    Pass the session's UpdateScheduler as `scheduler` so the windowed
+    list and its bubbles send their changes through it.
+    """
+    if not windowed:
+        return ft.ListView(expand=True, spacing=10, padding=20)
+
+    items = items if items is not None else []
+    read_text = getattr(items, "read_text", None)
+
+    def src(path, size=None):
+        return thumbnails.src(path, size) if thumbnails is not None and path else path
+
+    def avatar(message):
+        return src(avatars.get(message.sender), AVATAR_SIZE) if avatars else None
+
+    def build(message):
+        image = src(message.image)
+        if is_large(message, large_message):
+            load_text = (lambda start, length: read_text(message.id, start, length)) if read_text else None
+            return LargeMessageBubble(message, load_text, large_message, image=image, scheduler=scheduler)
+        return MessageBubble(message.text, message.sender, message.is_user, image, avatar(message))
+
+    return WindowedListView(
+        items,
+        build_item or build,
+        window_size=window_size,
+        overscan=overscan,
+        group_runs=group_runs,
+        large_message=large_message,
+        build_group=lambda run: MessageGroupBubble(run, avatar(run[0])),
+        scheduler=scheduler
+    )
+
+
+def _same_run(a, b):
+    return a.sender == b.sender and a.is_user == b.is_user
+
+
+class WindowedListView(ft.ListView):
+    """
+    ListView that renders a sliding window over a sequence of items
+
+    `items` can be any sequence supporting len() and slicing, such as a
+    list of chat.message.Message records or a MessageStore. The window
+    holds at most window_size + 2 * overscan items; rows that scroll out
+    of it are dropped and rebuilt with `build_item` when the user scrolls
+    back towards them.
+
+    With group_runs=True each row is a MessageGroupBubble covering a run
+    of up to `max_group` same-sender messages, and messages appended to
+    the open run become spans of its bubble rather than new rows.
+    Messages longer than `large_message` characters, and messages with
+    an image, are never grouped and always get a row built by
+    `build_item`; other rows are built by `build_group(run)`.
+
+    Appends, scrolling, jumps and replies change the window from handler
+    threads and the event loop alike, so every change and row lookup
+    holds `lock`: the lock of `scheduler`, an UpdateScheduler, which
+    then never diffs the list halfway through a change. Callers that
+    read a row and then change it (see ResponderPipeline) hold it across
+    both. Scrolling and jumps mark the list on the scheduler and scroll
+    once the new rows are sent; without one they update it directly.
+    """
+
+    def __init__(self, items, build_item, window_size=40, overscan=20, group_runs=False, max_group=50,
+                 large_message=None, build_group=MessageGroupBubble, scheduler=None):
+        super().__init__(
+            expand=True,
+            spacing=10,
+            padding=20,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=100
+        )
+        self.items = items
+        self.build_item = build_item
+        self.window_size = window_size
+        self.overscan = overscan
+        self.group_runs = group_runs
+        self.max_group = max_group
+        self.large_message = large_message
+        self.build_group = build_group
+        self.scheduler = scheduler
+        self.lock = scheduler.lock if scheduler else threading.RLock()
+
+        total = len(items)
+        self.window_start = max(0, total - self.capacity)
+        self._sizes = []  # items covered by each row, parallel to controls
+        self._count = 0   # items covered by the window
+        self._push_back(self._render(items[self.window_start:total]))
+        self._synced = total
+        self._row_extent = 0
+
+    @property
+    def capacity(self):
+        return self.window_size + 2 * self.overscan
+
+    @property
+    def window_end(self):
+        return self.window_start + self._count
+
+    @property
+    def following(self):
+        """Whether the window ends at the newest item, so appends show up"""
+        return self.window_end >= self._synced
+
+    def append(self, item):
+        """Add an item to the source and return its index"""
+        with self.lock:
+            self.items.append(item)
+            self.sync()
+            return len(self.items) - 1
+
+    def row(self, index):
+        """Control rendering item `index`, or None when it is outside the window"""
+        with self.lock:
+            control, offset = self._row_at(index)
+            if control is None or not self.group_runs:
+                return control
+            return group_part(control, offset)
+
+    def _row_at(self, index):
+        """The row holding item `index` and the item's position within it"""
+        if not self.window_start <= index < self.window_end:
+            return None, 0
+        offset = index - self.window_start
+        for control, size in zip(self.controls, self._sizes):
+            if offset < size:
+                return control, offset
+            offset -= size
+        return None, 0
+
+    def refresh(self, index):
+        """
+        Rebuild the row holding item `index` from the source, e.g. after
+        its text changed enough to need a different kind of bubble
+
+        Returns False when the item is outside the window.
+        """
+        with self.lock:
+            if not self.window_start <= index < self.window_end:
+                return False
+            start = self.window_start
+            for position, size in enumerate(self._sizes):
+                if index < start + size:
+                    break
+                start += size
+            rows = self._render(self.items[start:start + size])
+            self.controls[position:position + 1] = [control for control, _ in rows]
+            self._sizes[position:position + 1] = [size for _, size in rows]
+            return True
+
+    def jump_to(self, index, duration=300):
+        """
+        Move the window to item `index` and scroll it into view
+
+        The window is rebuilt around the item (or at the tail when it is
+        one of the newest), sent, and then scrolled to by key, since row
+        offsets aren't known until the client has laid the rows out.
+        """
+        with self.lock:
+            total = len(self.items)
+            self._synced = total
+            self._reset(max(0, min(index - self.capacity // 2, total - self.capacity)))
+
+            control, _ = self._row_at(index)
+            if control is None:
+                self._send()
+                return
+            control.key = f"item-{index}"
+            self._send(key=control.key, duration=duration)
+
+    def _send(self, **scroll):
+        """
+        Send the window, then scroll_to(**scroll) if given; call with the
+        lock held
+
+        The scroll goes out after the rows, which the client has to lay
+        out first. With a scheduler both are marked rather than sent: the
+        scroll on the flush after the one carrying the rows.
+        """
+        if self.scheduler is None:
+            self.update()
+            if scroll:
+                self.scroll_to(**scroll)
+            return
+        self.scheduler.mark(self)
+        if scroll:
+            self.scheduler.after_flush(lambda: self._mark_scroll(scroll))
+
+    def _mark_scroll(self, scroll):
+        # What scroll_to() sets, without the update() it ends with
+        with self.lock:
+            self._set_attr_json("method", {"n": "scroll_to", "i": str(time.time()), "p": scroll})
+        self.scheduler.mark(self)
+
+    def _reset(self, start):
+        """Replace every row with a full window starting at item `start`"""
+        self.controls.clear()
+        self._sizes = []
+        self._count = 0
+        self.window_start = start
+        self._push_back(self._render(self.items[start:start + self.capacity]))
+
+    def sync(self):
+        """
+        Render items appended to the source since the last sync
+
+        New rows are only built while the window is following the tail;
+        otherwise they are picked up when the user scrolls down to them.
+        After a bulk append larger than the window, only the new tail is
+        read and built.
+        """
+        with self.lock:
+            self._sync()
+
+    def _sync(self):
+        total = len(self.items)
+        following = self.window_end == self._synced
+        self._synced = total
+        if not following or self.window_end >= total:
+            return
+        if total - self.window_end >= self.capacity:
+            self._reset(total - self.capacity)
+            return
+
+        new_items = self.items[self.window_end:total]
+        if self.group_runs and self.controls:
+            last = self.items[self.window_end - 1]
+            while new_items and self._sizes[-1] < self.max_group and self._joins(last, new_items[0]):
+                append_to_group(self.controls[-1], new_items[0])
+                self._sizes[-1] += 1
+                self._count += 1
+                new_items = new_items[1:]
+
+        self._push_back(self._render(new_items))
+        self._trim_front()
+
+    def _alone(self, item):
+        """Whether an item always gets a row of its own"""
+        return is_large(item, self.large_message) or getattr(item, "image", None) is not None
+
+    def _joins(self, a, b):
+        """Whether item `b` can go into the same group bubble as item `a`"""
+        return _same_run(a, b) and not self._alone(a) and not self._alone(b)
+
+    def _render(self, items):
+        """(control, size) rows for a contiguous slice of items"""
+        if not self.group_runs:
+            return [(self.build_item(item), 1) for item in items]
+
+        rows = []
+        run = []
+        for item in items:
+            if run and (len(run) >= self.max_group or not self._joins(run[-1], item)):
+                rows.append((self._group(run), len(run)))
+                run = []
+            run.append(item)
+        if run:
+            rows.append((self._group(run), len(run)))
+        return rows
+
+    def _group(self, run):
+        if len(run) == 1 and self._alone(run[0]):
+            return self.build_item(run[0])
+        return self.build_group(run)
+
+    def _push_back(self, rows):
+        for control, size in rows:
+            self.controls.append(control)
+            self._sizes.append(size)
+            self._count += size
+
+    def _push_front(self, rows):
+        self.controls[:0] = [control for control, _ in rows]
+        self._sizes[:0] = [size for _, size in rows]
+        added = sum(size for _, size in rows)
+        self._count += added
+        self.window_start -= added
+
+    def _pop_front(self):
+        del self.controls[0]
+        size = self._sizes.pop(0)
+        self._count -= size
+        self.window_start += size
+        return size
+
+    def _pop_back(self):
+        del self.controls[-1]
+        size = self._sizes.pop()
+        self._count -= size
+        return size
+
+    def _trim_front(self):
+        dropped = 0
+        while self._count > self.capacity and len(self.controls) > 1:
+            self._pop_front()
+            dropped += 1
+        return dropped
+
+    def _trim_back(self):
+        dropped = 0
+        while self._count > self.capacity and len(self.controls) > 1:
+            self._pop_back()
+            dropped += 1
+        return dropped
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        with self.lock:
+            self._scrolled(e)
+
+    def _scrolled(self, e):
+        if e.pixels is None or e.max_scroll_extent is None or not self.controls:
+            return
+
+        content = e.max_scroll_extent - e.min_scroll_extent + e.viewport_dimension
+        self._row_extent = content / len(self.controls)
+        edge = e.viewport_dimension
+
+        if e.pixels - e.min_scroll_extent < edge and self.window_start > 0:
+            self._shift_back(e.pixels)
+        elif e.max_scroll_extent - e.pixels < edge and self.window_end < len(self.items):
+            self._shift_forward(e.pixels)
+
+    def _shift_back(self, pixels):
+        new_start = max(0, self.window_start - self.overscan)
+        stop = self.window_start
+        replaced = 0
+        if self.group_runs:
+            # Regroup the first row with the older items so a run that
+            # straddles the window edge still renders as one bubble
+            stop += self._pop_front()
+            replaced = 1
+        rows = self._render(self.items[new_start:stop])
+        self._push_front(rows)
+        self._trim_back()
+
+        # Rows inserted above the viewport push the content down;
+        # move the offset by the same amount so the view stays put
+        self._send(offset=pixels + (len(rows) - replaced) * self._row_extent)
 
+    def _shift_forward(self, pixels):
+        start = self.window_end
+        stop = min(len(self.items), start + self.overscan)
+        if self.group_runs:
+            start -= self._pop_back()
+        self._push_back(self._render(self.items[start:stop]))
+        dropped = self._trim_front()
 
-def ChatMessagesList():
-    return ft.ListView(expand=True, spacing=10, padding=20)
\ No newline at end of file
+        self._send(offset=max(0, pixels - dropped * self._row_extent))
@@ -0,0 +1,118 @@
+import asyncio
+import threading
+import time
+
+CHANGE_MODES = ("immediate", "debounce", "throttle", "idle")
+
+
+class ChangeCoalescer:
+    """
+    Event handler that collapses bursts of events into the latest one
+
+    Modes:
+    - debounce: deliver once events have paused for `wait` seconds; with
+      `max_wait`, also at least that often during a long burst
+    - throttle: deliver at most once per `wait` seconds; the first event
+      of a burst goes straight through, the latest one ends each window
+    - idle: deliver after `wait` seconds of quiet, and only if the value
+      differs from the last one delivered; flush() delivers early (the
+      Input atom calls it on blur)
+
+    Timers run on the page event loop, like the UpdateScheduler's; the
+    callback itself runs in the page's handler threads, or on the loop
+    if it is a coroutine function. An event replaced by a later one
+    before it was delivered counts as dropped.
+    """
+
+    def __init__(self, callback, mode="debounce", wait=0.3, max_wait=None):
+        if mode not in CHANGE_MODES or mode == "immediate":
+            raise ValueError(f"unknown change mode {mode!r}")
+        self.callback = callback
+        self.mode = mode
+        self.wait = wait
+        self.max_wait = max_wait
+        self._lock = threading.Lock()
+        self._pending = None
+        self._scheduled = False
+        self._first_event = 0.0
+        self._last_event = 0.0
+        self._last_delivery = float("-inf")
+        self._last_value = None
+
+        # Counters
+        self.received = 0
+        self.delivered = 0
+        self.dropped = 0
+
+    def __call__(self, e):
+        now = time.perf_counter()
+        with self._lock:
+            self.received += 1
+            if self._pending is None:
+                self._first_event = now
+            else:
+                self.dropped += 1
+            self._pending = e
+            self._last_event = now
+            if self._scheduled:
+                return
+            self._scheduled = True
+        e.page.loop.call_soon_threadsafe(self._fire)
+
+    def _deadline(self):
+        if self.mode == "throttle":
+            return self._last_delivery + self.wait
+        deadline = self._last_event + self.wait
+        if self.max_wait is not None:
+            deadline = min(deadline, self._first_event + self.max_wait)
+        return deadline
+
+    def _fire(self):
+        with self._lock:
+            e = self._pending
+            if e is None:
+                self._scheduled = False
+                return
+            delay = self._deadline() - time.perf_counter()
+            if delay > 0:
+                e.page.loop.call_later(delay, self._fire)
+                return
+            self._pending = None
+            self._scheduled = False
+        self._deliver(e)
+
+    def flush(self, e=None):
+        """Deliver the pending event now, if there is one"""
+        with self._lock:
+            pending, self._pending = self._pending, None
+        if pending is not None:
+            self._deliver(pending)
+
+    def _deliver(self, e):
+        with self._lock:
+            value = getattr(e.control, "value", None)
+            if self.mode == "idle" and self.delivered and value == self._last_value:
+                self.dropped += 1
+                return
+            self._last_value = value
+            self._last_delivery = time.perf_counter()
+            self.delivered += 1
+        if asyncio.iscoroutinefunction(self.callback):
+            e.page.run_task(self.callback, e)
+        else:
+            e.page.run_thread(self.callback, e)
+
+    def stats(self):
+        return {
+            "mode": self.mode,
+            "received": self.received,
+            "delivered": self.delivered,
+            "dropped": self.dropped,
+        }
+
+
+def coalesce(callback, mode="immediate", wait=0.3, max_wait=None):
+    """`callback` wrapped in a ChangeCoalescer, or as is for mode "immediate" """
+    if callback is None or mode == "immediate":
+        return callback
+    return ChangeCoalescer(callback, mode, wait, max_wait)
@@ -1,11 +1,156 @@
+from contextlib import nullcontext
+
 import flet as ft
+from perf.instrumentation import component, handler
+
+# Messages longer than this many characters are shown as a preview of
+# that length; "Show more" then adds EXPAND_CHUNK characters at a time
+LARGE_MESSAGE = 4000
+EXPAND_CHUNK = 16000
+
+# Logical pixels an attached image and an avatar are shown at; thumbnails
+# are made at twice that for high-density screens
+IMAGE_WIDTH = 160
+AVATAR_RADIUS = 16
+AVATAR_SIZE = 4 * AVATAR_RADIUS
+
 
+@component
+def MessageBubble(message, sender="You", is_user=True, image=None, avatar=None):
+    """
+    Bubble for one message, optionally with an image above the text and
+    the sender's avatar beside it
 
-def MessageBubble(message, sender="You", is_user=True):
+    `image` and `avatar` are Image srcs, normally thumbnails from
+    media.thumbnails rather than the files themselves.
+    """
+    content = ft.Text(f"{sender}: {message}", color=ft.Colors.WHITE)
+    if image:
+        content = ft.Column([_attachment(image), content], spacing=6, tight=True)
+    if avatar:
+        content.expand = True
+        content = ft.Row(
+            [ft.CircleAvatar(foreground_image_src=avatar, radius=AVATAR_RADIUS), content],
+            vertical_alignment=ft.CrossAxisAlignment.START
+        )
     return ft.Container(
-        ft.Text(f"{sender}: {message}", color=ft.Colors.WHITE),
+        content,
         bgcolor=ft.Colors.BLUE if is_user else ft.Colors.GREY,
         padding=10,
         border_radius=10,
         alignment=ft.alignment.center_right if is_user else ft.alignment.center_left
-    )
\ No newline at end of file
+    )
+
+
+def _attachment(src):
+    return ft.Image(src=src, width=IMAGE_WIDTH, fit=ft.ImageFit.CONTAIN, border_radius=8)
+
+
+def bubble_text(bubble):
+    """The Text of a MessageBubble, however its content is laid out"""
+    content = bubble.content
+    while not isinstance(content, ft.Text):
+        content = content.controls[-1]
+    return content
+
+
+def is_large(message, threshold=LARGE_MESSAGE):
+    """Whether a chat.message.Message should render as a LargeMessageBubble"""
+    return threshold is not None and message.length > threshold
+
+
+@component
+def LargeMessageBubble(message, load_text=None, preview_chars=LARGE_MESSAGE, chunk_chars=EXPAND_CHUNK, image=None,
+                       scheduler=None):
+    """
+    Bubble showing the start of a long message, expandable in chunks
+
+    Only the preview is in the control tree at first; each "Show more"
+    click appends the next chunk as a TextSpan, so the client receives
+    and lays out one chunk at a time. load_text(start, length) returns
+    part of the full text, e.g. MessageStore.read_text for the message's
+    id; without it the chunks are sliced from message.text. `image` is
+    shown above the text, as in MessageBubble.
+
+    With an UpdateScheduler the chunk is added under its lock and the
+    bubble marked for the next flush; without one it is updated directly.
+    """
+    if load_text is None:
+        load_text = lambda start, length: message.text[start:start + length]
+    preview = message.text[:preview_chars]
+    length = message.length
+    body = ft.Text(f"{message.sender}: {preview}", color=ft.Colors.WHITE, spans=[])
+    toggle = ft.TextButton(style=ft.ButtonStyle(color=ft.Colors.WHITE))
+    shown = len(preview)
+
+    def label():
+        left = length - shown
+        toggle.text = f"Show more ({left:,} characters left)" if left > 0 else "Show less"
+
+    def expand(e):
+        nonlocal shown
+        # Read outside the lock, so a flush doesn't wait for the store
+        part = load_text(shown, chunk_chars) if shown < length else None
+        with scheduler.lock if scheduler else nullcontext():
+            if part is not None:
+                body.spans.append(ft.TextSpan(part))
+                # A text that shrank since the preview was read has no more to show
+                shown = shown + len(part) if part else length
+            else:
+                body.spans.clear()
+                shown = len(preview)
+            label()
+        if scheduler:
+            scheduler.mark(bubble)
+        else:
+            bubble.update()
+
+    label()
+    toggle.on_click = handler(expand, "LargeMessageBubble.expand")
+    bubble = ft.Container(
+        ft.Column([_attachment(image), body, toggle] if image else [body, toggle], spacing=4, tight=True),
+        bgcolor=ft.Colors.BLUE if message.is_user else ft.Colors.GREY,
+        padding=10,
+        border_radius=10,
+        alignment=ft.alignment.center_right if message.is_user else ft.alignment.center_left
+    )
+    return bubble
+
+
+@component
+def MessageGroupBubble(messages, avatar=None):
+    """
+    One bubble for a run of consecutive messages from the same sender
+
+    The first message is the Text value and each following message is
+    a TextSpan, so growing the run adds one small span instead of a
+    Container/Text pair per message. Messages with images aren't grouped.
+    """
+    first = messages[0]
+    bubble = MessageBubble(first.text, first.sender, first.is_user, avatar=avatar)
+    for message in messages[1:]:
+        append_to_group(bubble, message)
+    return bubble
+
+
+def append_to_group(bubble, message):
+    bubble_text(bubble).spans.append(ft.TextSpan(f"\n{message.text}"))
+
+
+def group_part(bubble, position):
+    """Control showing the message at `position` within a group bubble"""
+    return bubble if position == 0 else bubble_text(bubble).spans[position - 1]
+
+
+def update_message(target, message, sender="You", limit=None):
+    """
+    Replace the text of a bubble, or of a message span inside a group bubble
+
+    Text longer than `limit` characters is cut there and ends in "…".
+    """
+    if limit is not None and len(message) > limit:
+        message = f"{message[:limit]}…"
+    if isinstance(target, ft.TextSpan):
+        target.text = f"\n{message}"
+    else:
+        bubble_text(target).value = f"{sender}: {message}"
@@ -1,28 +1,35 @@
 import flet as ft
+from perf.instrumentation import component
 from ..atoms.input import Input
 from ..atoms.button import Button
 
 
-def InputWithButton(placeholder="Type here...", button_text="Send", on_send=None, on_submit=None):
+@component
+def InputWithButton(placeholder="Type here...", button_text="Send", on_send=None, on_submit=None, refs=None, name="input_with_button"):
     """
     Molecule: Input field combined with a button
     Uses atomic Input and Button components
+    
+    When a RefRegistry is passed as `refs`, the controls are registered
+    as "<name>.input" and "<name>.button".
     """
     
     input_field = Input(
         placeholder=placeholder,
         variant="outlined",
-        on_submit=on_submit
+        on_submit=on_submit,
+        ref=refs.ref(f"{name}.input") if refs else None
     )
     
     send_button = Button(
         text=button_text,
         variant="primary",
         icon=ft.Icons.SEND,
-        on_click=on_send
+        on_click=on_send,
+        ref=refs.ref(f"{name}.button") if refs else None
     )
     
     return ft.Row([
         ft.Container(input_field, expand=True),
         send_button
-    ], spacing=8)
\ No newline at end of file
+    ], spacing=8)
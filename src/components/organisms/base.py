@@ -0,0 +1,138 @@
+import inspect
+from contextlib import nullcontext
+
+import flet as ft
+from ..updates import UpdateScope
+
+# Props of these types are compared by value; anything else (lists,
+# stores, registries) by identity, so a comparison never walks a container
+_VALUE_TYPES = (str, bytes, int, float, bool, tuple, frozenset, type(None))
+
+
+class _Callback:
+    """Comparison key for a callable prop: only its presence and kind count"""
+
+    def __init__(self, is_async):
+        self.is_async = is_async
+
+    def __eq__(self, other):
+        return isinstance(other, _Callback) and other.is_async == self.is_async
+
+
+def _is_callback(value):
+    return callable(value) and not isinstance(value, type)
+
+
+def _key(value):
+    if _is_callback(value):
+        return _Callback(inspect.iscoroutinefunction(value))
+    return value
+
+
+def _same(a, b):
+    a, b = _key(a), _key(b)
+    if a is b:
+        return True
+    if isinstance(a, _Callback) or type(a) is type(b) and isinstance(a, _VALUE_TYPES):
+        return a == b
+    return False
+
+
+class Organism(ft.Column):
+    """
+    Base for stateful organisms: a Column of parts that are rebuilt only
+    when the props they are built from change
+
+    Subclasses list their parts in `parts`, in layout order, mapping each
+    part name to the names of its props, and implement build_<name>()
+    taking those props as keyword arguments.
+
+    set_props() merges new props into the current ones and rebuilds just
+    the parts whose props differ. Strings, numbers and tuples compare by
+    value, other objects by identity. Callable props reach the parts as
+    stable forwarders to the current callable, so passing a new lambda
+    for a handler rebuilds nothing. Rebuilt parts are pushed through the
+    organism's own UpdateScope, or marked on `scheduler` when one is
+    given and swapped in under its lock; unchanged parts are neither
+    rebuilt nor re-sent. Parts can be replaced, so look them up with
+    part() (or a property built on it) rather than keeping them.
+    """
+
+    parts = {}
+
+    def __init__(self, scheduler=None, **props):
+        super().__init__()
+        self.scheduler = scheduler
+        self.props = props
+        self._forwarders = {}
+        self._scope = None
+
+        # Counters, per part; the first build isn't counted
+        self.rebuilds = dict.fromkeys(self.parts, 0)
+        self.skips = dict.fromkeys(self.parts, 0)
+
+        self.controls = [self._build(name) for name in self.parts]
+
+    def part(self, name):
+        """Current control of part `name`"""
+        return self.controls[list(self.parts).index(name)]
+
+    def set_props(self, **props):
+        """Update props and rebuild the parts they affect; returns the names of the rebuilt parts"""
+        rebuilt = []
+        with self.scheduler.lock if self.scheduler else nullcontext():
+            previous, self.props = self.props, {**self.props, **props}
+            for position, (name, names) in enumerate(self.parts.items()):
+                if all(_same(previous.get(prop), self.props.get(prop)) for prop in names):
+                    self.skips[name] += 1
+                    continue
+                self.controls[position] = self._build(name)
+                self.rebuilds[name] += 1
+                rebuilt.append(name)
+        if rebuilt:
+            self._push()
+        return rebuilt
+
+    def _build(self, name):
+        props = {prop: self._prop(prop) for prop in self.parts[name]}
+        return getattr(self, f"build_{name}")(**props)
+
+    def _prop(self, name):
+        value = self.props.get(name)
+        if not _is_callback(value):
+            return value
+
+        is_async = inspect.iscoroutinefunction(value)
+        forwarder = self._forwarders.get((name, is_async))
+        if forwarder is None:
+            # Async handlers need an async forwarder, or Flet would run
+            # them on a handler thread instead of the event loop
+            if is_async:
+                async def forwarder(*args):
+                    return await self.props[name](*args)
+            else:
+                def forwarder(*args):
+                    return self.props[name](*args)
+            self._forwarders[(name, is_async)] = forwarder
+        return forwarder
+
+    @property
+    def scope(self):
+        """The organism's UpdateScope, once it is on a page"""
+        if self._scope is None and self.page is not None:
+            self._scope = UpdateScope(self.page)
+        return self._scope
+
+    def _push(self):
+        if self.scheduler:
+            self.scheduler.mark(self)
+        elif self.scope:
+            # Not yet on a page otherwise; the first add sends everything
+            self.scope.mark(self).flush()
+
+    def stats(self):
+        return {
+            "rebuilds": sum(self.rebuilds.values()),
+            "skips": sum(self.skips.values()),
+            "parts": {name: {"rebuilds": self.rebuilds[name], "skips": self.skips[name]} for name in self.parts},
+        }
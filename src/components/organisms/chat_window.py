@@ -0,0 +1,52 @@
+from ..chat_input import ChatInput
+from ..chat_messages_list import ChatMessagesList
+from ..message_bubble import LARGE_MESSAGE
+from .base import Organism
+
+
+class ChatWindow(Organism):
+    """
+    Organism: windowed message list above a chat input
+
+    The list is rebuilt only when `items`, `group_runs`,
+    `large_message`, `thumbnails` or `avatars` change, and the input only
+    when a handler is added or removed or `refs`/`name` change; see
+    Organism.set_props(). With a scheduler, the list changes under the
+    scheduler's lock, so its flushes never see a half-changed window,
+    and the list and its bubbles send their changes through it.
+    """
+
+    parts = {
+        "messages": ("items", "group_runs", "large_message", "thumbnails", "avatars"),
+        "input": ("on_send", "on_submit", "refs", "name"),
+    }
+
+    def __init__(self, items=None, on_send=None, on_submit=None, group_runs=False, large_message=LARGE_MESSAGE,
+                 thumbnails=None, avatars=None, refs=None, name="chat_input", scheduler=None):
+        super().__init__(
+            scheduler,
+            items=items if items is not None else [],
+            on_send=on_send,
+            on_submit=on_submit,
+            group_runs=group_runs,
+            large_message=large_message,
+            thumbnails=thumbnails,
+            avatars=avatars,
+            refs=refs,
+            name=name
+        )
+        self.expand = True
+
+    @property
+    def messages(self):
+        """The WindowedListView currently showing the history"""
+        return self.part("messages")
+
+    def build_messages(self, items, group_runs, large_message, thumbnails, avatars):
+        return ChatMessagesList(
+            windowed=True, items=items, group_runs=group_runs, large_message=large_message,
+            thumbnails=thumbnails, avatars=avatars, scheduler=self.scheduler
+        )
+
+    def build_input(self, on_send, on_submit, refs, name):
+        return ChatInput(on_send, on_submit, refs=refs, name=name)
@@ -0,0 +1,85 @@
+import asyncio
+import os
+
+import flet as ft
+from perf.instrumentation import KINDS, METRICS
+from ..updates import UpdateScope
+
+DEFAULT_METRICS_FILE = "chat_metrics.txt"
+
+
+def DebugOverlay(metrics=METRICS, path=None, top=5):
+    """
+    Organism: floating panel with the slowest components, handlers and updates
+
+    Shows count, mean, p95 and max per name for the `top` entries of each
+    kind, most total time first. The export button writes the metrics as
+    a text file to `path` (CHAT_METRICS_FILE, or chat_metrics.txt).
+    """
+    path = path or os.getenv("CHAT_METRICS_FILE", DEFAULT_METRICS_FILE)
+    table = ft.Text(metrics_table(metrics, top), font_family="monospace", size=11, color=ft.Colors.WHITE)
+    status = ft.Text("", size=11, color=ft.Colors.WHITE70)
+
+    def export(e):
+        status.value = f"wrote {metrics.export(path)}"
+        status.update()
+
+    return ft.Container(
+        ft.Column([
+            ft.Row([
+                ft.Text("Metrics", weight=ft.FontWeight.W_500, color=ft.Colors.WHITE),
+                ft.TextButton("Export", on_click=export),
+            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN),
+            table,
+            status,
+        ], spacing=4, tight=True),
+        bgcolor=ft.Colors.with_opacity(0.85, ft.Colors.BLACK),
+        border_radius=6,
+        padding=10,
+        right=10,
+        bottom=10,
+        data=(metrics, top),
+    )
+
+
+def metrics_table(metrics=METRICS, top=5):
+    lines = [f"{'':<40} {'n':>6} {'mean':>8} {'p95':>8} {'max':>8}"]
+    for kind in KINDS:
+        rows = metrics.rows(kind)[:top]
+        if not rows:
+            continue
+        lines.append(kind)
+        for name, h in rows:
+            lines.append(
+                f"  {name[:38]:<38} {h.count:>6} {h.mean * 1000:>6.2f}ms "
+                f"{h.quantile(0.95) * 1000:>6.2f}ms {h.max * 1000:>6.2f}ms"
+            )
+    return "\n".join(lines)
+
+
+def refresh_overlay(overlay):
+    """Re-render the table of an overlay built by DebugOverlay"""
+    metrics, top = overlay.data
+    overlay.content.controls[1].value = metrics_table(metrics, top)
+
+
+def attach_debug_overlay(page, metrics=METRICS, interval=1.0):
+    """
+    Show a DebugOverlay on `page` and refresh it every `interval` seconds
+
+    The refresh task stops once the page disconnects.
+    """
+    overlay = DebugOverlay(metrics)
+    page.overlay.append(overlay)
+
+    async def refresh():
+        while True:
+            await asyncio.sleep(interval)
+            refresh_overlay(overlay)
+            try:
+                UpdateScope(page).mark(overlay).flush()
+            except ft.PageDisconnectedException:
+                return
+
+    page.run_task(refresh)
+    return overlay
@@ -0,0 +1,30 @@
+import flet as ft
+from perf.instrumentation import component
+
+
+@component
+def ImportProgress(on_cancel=None):
+    """
+    Organism: progress bar, status line and cancel button for an import
+
+    Starts as an empty, hidden container; the row is built by the first
+    update_import_progress() call, so idle screens don't ship it.
+    """
+    panel = ft.Container(visible=False)
+    panel.data = on_cancel
+    return panel
+
+
+def update_import_progress(panel, status):
+    """Show a chat.importer.ImportStatus on a panel built by ImportProgress"""
+    if panel.content is None:
+        panel.content = ft.Row([
+            ft.ProgressBar(value=0, expand=True),
+            ft.Text("", size=12),
+            ft.TextButton("Cancel", on_click=panel.data),
+        ], spacing=8)
+    bar, text, cancel = panel.content.controls
+    panel.visible = True
+    bar.value = 1 if status.done else status.fraction
+    text.value = str(status)
+    cancel.visible = not status.done
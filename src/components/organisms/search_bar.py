@@ -0,0 +1,95 @@
+import itertools
+import re
+import threading
+
+import flet as ft
+from chat.store import MATCH_END, MATCH_START
+from perf.instrumentation import component
+from ..atoms.input import Input
+
+_MARKERS = re.compile(f"[{MATCH_START}{MATCH_END}]")
+
+
+@component
+def SearchBar(search, on_select, scheduler=None, limit=8, refs=None, name="search", wait=0.2):
+    """
+    Organism: search field with a list of highlighted matches
+
+    `search(query, limit)` returns chat.store.SearchHit records; results
+    refresh once typing pauses for `wait` seconds, and on submit. Each
+    search runs on its own handler thread, so results of a query that a
+    newer one has replaced are dropped. Clicking one hides the list and
+    calls on_select(index) with the message's position in the history.
+
+    Changes are marked on `scheduler` when one is given, and made under
+    its lock; otherwise the result list is updated directly. When a
+    RefRegistry is passed as `refs`, the field is registered as
+    "<name>.field".
+    """
+    results = ft.Column(spacing=2, visible=False, tight=True)
+    lock = scheduler.lock if scheduler else threading.Lock()
+    queries = itertools.count(1)
+    latest = [0]
+
+    def push():
+        if scheduler:
+            scheduler.mark(results)
+        else:
+            results.update()
+
+    def select(index):
+        with lock:
+            results.visible = False
+        push()
+        on_select(index)
+
+    def run(e):
+        query = e.control.value or ""
+        with lock:
+            latest[0] = number = next(queries)
+        hits = search(query, limit) if query.strip() else []
+        with lock:
+            if number != latest[0]:
+                return
+            results.controls = [SearchResult(hit, select) for hit in hits]
+            results.visible = bool(hits)
+        push()
+
+    field = Input(
+        placeholder="Search messages...",
+        variant="outlined",
+        size="small",
+        on_change=run,
+        change_mode="debounce",
+        change_wait=wait,
+        on_submit=run,
+        ref=refs.ref(f"{name}.field") if refs else None
+    )
+
+    return ft.Column([field, results], spacing=4)
+
+
+def SearchResult(hit, on_select):
+    return ft.Container(
+        ft.Text(
+            spans=[ft.TextSpan(f"{hit.message.sender}: ")] + highlight_spans(hit.marked),
+            size=13,
+            max_lines=2,
+            overflow=ft.TextOverflow.ELLIPSIS
+        ),
+        padding=6,
+        border_radius=6,
+        ink=True,
+        on_click=lambda e: on_select(hit.index)
+    )
+
+
+def highlight_spans(marked):
+    """TextSpans for a search excerpt, with the matched words emphasised"""
+    match_style = ft.TextStyle(weight=ft.FontWeight.BOLD, bgcolor=ft.Colors.AMBER_100)
+    spans = []
+    # Parts alternate between plain text and matches
+    for i, part in enumerate(_MARKERS.split(marked)):
+        if part:
+            spans.append(ft.TextSpan(part, style=match_style if i % 2 else None))
+    return spans
@@ -0,0 +1,60 @@
+import warnings
+import flet as ft
+
+
+class RefRegistry:
+    """
+    Named ft.Ref handles for one page
+
+    Components register the controls that handlers need at build time,
+    so a handler looks them up by name instead of walking the tree.
+    With debug=True, get() warns when a ref points at a control that
+    was mounted and has since been removed (e.g. its subtree was replaced).
+    """
+
+    def __init__(self, page, debug=False):
+        self.page = page
+        self.debug = debug
+        self._refs = {}
+
+    def ref(self, name):
+        """Return the ft.Ref registered under `name`, creating it on first use"""
+        ref = self._refs.get(name)
+        if ref is None:
+            ref = self._refs[name] = ft.Ref()
+        return ref
+
+    def get(self, name):
+        control = self._refs[name].current
+        if self.debug and self._is_stale(control):
+            warnings.warn(f"Stale ref '{name}': {control} is no longer on the page", stacklevel=2)
+        return control
+
+    __getitem__ = get
+
+    def __contains__(self, name):
+        return name in self._refs
+
+    def stale(self):
+        """Names whose control was removed from the page"""
+        return [name for name, ref in self._refs.items() if self._is_stale(ref.current)]
+
+    def check(self):
+        """Warn about every stale ref; returns the stale names"""
+        names = self.stale()
+        for name in names:
+            warnings.warn(f"Stale ref '{name}'", stacklevel=2)
+        return names
+
+    def _is_stale(self, control):
+        # Controls get a uid when mounted and leave the page index when removed
+        return control is not None and control.uid is not None and self.page.get_control(control.uid) is not control
+
+
+def refs_for(page, debug=False):
+    """Per-page RefRegistry, kept in the page session"""
+    refs = page.session.get("refs")
+    if refs is None:
+        refs = RefRegistry(page, debug=debug)
+        page.session.set("refs", refs)
+    return refs
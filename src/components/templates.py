@@ -0,0 +1,218 @@
+import asyncio
+import dataclasses
+import logging
+import os
+import threading
+
+import flet as ft
+from .events import ChangeCoalescer
+
+logger = logging.getLogger(__name__)
+
+_HANDLERS = "template_handlers"
+
+
+class Slot:
+    """
+    Stand-in for a per-session event handler inside a template
+
+    The template, and every clone of it, holds the same Slot; when it
+    fires it looks up the handler the event's session bound under its
+    key, so clones need no rewiring.
+    """
+
+    __slots__ = ("key",)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __call__(self, e):
+        callback = (e.page.session.get(_HANDLERS) or {}).get(self.key)
+        if callback is None:
+            return None
+        if asyncio.iscoroutinefunction(callback):
+            return e.page.run_task(callback, e)
+        return callback(e)
+
+    def __repr__(self):
+        return f"Slot({self.key!r})"
+
+
+class Template:
+    """
+    Control tree built once per process and cloned for each session
+
+    `build(slot)` returns the tree, or a list of controls to splice into
+    a parent; slot(name) is the handler to use for anything the session
+    must respond to. The tree is never added to a page itself: clone()
+    hands out a copy with fresh control state and binds the session's
+    handlers to the slots.
+
+    Only static sections belong in a template. Handlers must be slots or
+    stateless functions (coalesced Inputs keep per-session state and are
+    refused), and refs are not carried over to clones.
+    """
+
+    def __init__(self, key, build):
+        self.key = key
+        self.root = build(lambda name: Slot(f"{key}.{name}"))
+        roots = self.root if isinstance(self.root, list) else [self.root]
+        for control in roots:
+            _check(control, key)
+        self._plans = [_plan(control) for control in roots]
+        self.clones = 0
+
+    def clone(self, page, **handlers):
+        bind(page, self.key, **handlers)
+        self.clones += 1
+        clones = [_instantiate(plan) for plan in self._plans]
+        return clones if isinstance(self.root, list) else clones[0]
+
+
+def bind(page, key, **handlers):
+    """Set this session's handlers for the slots of template `key`"""
+    bound = page.session.get(_HANDLERS)
+    if bound is None:
+        bound = {}
+        page.session.set(_HANDLERS, bound)
+    bound.update({f"{key}.{name}": callback for name, callback in handlers.items()})
+
+
+def clone_control(control):
+    """Copy of a control tree that can be added to another page"""
+    if not SUPPORTED:
+        raise RuntimeError(f"can't clone controls with Flet {ft.version.version}")
+    return _instantiate(_plan(control))
+
+
+# How each attribute of a control is copied into a clone
+_CONTROL, _CONTROLS, _VALUE = range(3)
+
+# A clone has never been sent anywhere
+_FRESH = {"_Control__uid": None, "_Control__page": None, "_Control__previous_children": None, "parent": None}
+
+
+def _supported():
+    """
+    Whether Flet keeps control state in the private attributes a clone
+    resets (and _check reads); they are not part of its API
+    """
+    state = vars(ft.Text())
+    return all(name in state for name in [*_FRESH, "_Control__event_handlers"])
+
+
+SUPPORTED = _supported()
+
+# CHAT_TEMPLATES=0 builds every template from scratch for each session,
+# as does a Flet version whose controls can't be cloned
+ENABLED = os.getenv("CHAT_TEMPLATES", "1") != "0"
+if ENABLED and not SUPPORTED:
+    logger.warning("Control templates don't support Flet %s; building every session from scratch", ft.version.version)
+    ENABLED = False
+
+
+def _plan(control):
+    """
+    (class, shared state, fixups) recipe for cloning `control`
+
+    Working out which attributes hold child controls or mutable state is
+    the expensive part of copying a tree, so it is done once per
+    template; a clone is then a dict copy per control plus the fixups.
+    Dicts (attribute values, event handlers), lists and style objects
+    are copied all the way down, since Flet normalises some of them in
+    place while sending.
+    """
+    state = {**vars(control), **_FRESH}
+    fixups = []
+    for name, value in state.items():
+        if isinstance(value, ft.Control):
+            fixups.append((name, _CONTROL, _plan(value)))
+        elif isinstance(value, list) and any(isinstance(item, ft.Control) for item in value):
+            items = [(_plan(item), None) if isinstance(item, ft.Control) else (None, item) for item in value]
+            fixups.append((name, _CONTROLS, items))
+        else:
+            recipe = _value_plan(value)
+            if recipe is not None:
+                fixups.append((name, _VALUE, recipe))
+    return type(control), state, fixups
+
+
+def _value_plan(value):
+    """
+    (type, state, nested recipes) for copying a dict, list or style
+    object and everything mutable in it; None for values to share
+    """
+    if isinstance(value, dict):
+        cls, state, items = dict, value, value.items()
+    elif isinstance(value, list):
+        cls, state, items = list, value, enumerate(value)
+    elif dataclasses.is_dataclass(value) and not isinstance(value, type):
+        cls, state = type(value), vars(value)
+        items = state.items()
+    else:
+        return None
+    return cls, state, [(key, recipe) for key, item in items if (recipe := _value_plan(item)) is not None]
+
+
+def _copy_value(recipe):
+    cls, state, nested = recipe
+    if cls is dict or cls is list:
+        copy = target = cls(state)
+    else:
+        copy = object.__new__(cls)
+        target = copy.__dict__
+        target.update(state)
+    for key, item in nested:
+        target[key] = _copy_value(item)
+    return copy
+
+
+def _instantiate(plan):
+    cls, state, fixups = plan
+    clone = object.__new__(cls)
+    copy = clone.__dict__
+    copy.update(state)
+    copy["_Control__previous_children"] = []
+    for name, kind, value in fixups:
+        if kind == _CONTROL:
+            copy[name] = _instantiate(value)
+        elif kind == _CONTROLS:
+            copy[name] = [_instantiate(plan) if plan else item for plan, item in value]
+        else:
+            copy[name] = _copy_value(value)
+    return clone
+
+
+def _check(control, key):
+    for callback in vars(control).get("_Control__event_handlers", {}).values():
+        if isinstance(callback, ChangeCoalescer) or isinstance(getattr(callback, "__self__", None), ChangeCoalescer):
+            raise TypeError(f"template {key!r}: {type(control).__name__} has a stateful handler; build it per session")
+    for child in control._get_children():
+        _check(child, key)
+
+
+_templates = {}
+_lock = threading.Lock()
+
+
+def template(key, build, page, **handlers):
+    """
+    A clone of the process-wide template `key` for `page`, built with
+    build(slot) on first use, with `handlers` bound to its slots
+    """
+    if not ENABLED:
+        bind(page, key, **handlers)
+        return Template(key, build).root
+    cached = _templates.get(key)
+    if cached is None:
+        with _lock:
+            cached = _templates.get(key)
+            if cached is None:
+                cached = _templates[key] = Template(key, build)
+    return cached.clone(page, **handlers)
+
+
+def clear():
+    """Drop every cached template, e.g. after the design tokens change"""
+    with _lock:
+        _templates.clear()
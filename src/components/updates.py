@@ -0,0 +1,167 @@
+import threading
+import time
+
+from perf.instrumentation import ENABLED as INSTRUMENTED, METRICS
+
+
+class UpdateScope:
+    """
+    Collects the controls a handler changed and pushes only those
+
+    page.update() makes Flet diff the whole page tree. Flushing a scope
+    calls page.update(*controls) instead, so only the marked subtrees are
+    walked and sent in a single batch.
+    """
+
+    def __init__(self, page, meter=None):
+        self.page = page
+        self.meter = meter
+        self.controls = []
+
+    def mark(self, *controls):
+        for control in controls:
+            if not any(control is c for c in self.controls):
+                self.controls.append(control)
+        return self
+
+    def flush(self):
+        if not self.controls:
+            return
+        controls, self.controls = self.controls, []
+        start = time.perf_counter()
+        if self.meter:
+            with self.meter.measure(*controls):
+                self.page.update(*controls)
+        else:
+            self.page.update(*controls)
+        if INSTRUMENTED:
+            METRICS.observe("update", "page.update", time.perf_counter() - start)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.flush()
+
+
+class UpdateScheduler:
+    """
+    Per-session update batching, capped at `rate` flushes per second
+
+    Components call mark(*controls) instead of update(). The first mark
+    after a flush schedules one on the page event loop for the next tick;
+    marks that land before it are coalesced into the same batch, and
+    controls with a marked ancestor are dropped since the ancestor's diff
+    already covers them. mark() is safe to call from handler threads.
+
+    Flushes diff the marked controls while holding `lock`. Handlers that
+    change controls from threads take the same lock around the change,
+    so a flush never walks a tree that is halfway through one.
+
+    after_flush(callback) runs a callback on the event loop once the
+    next flush has been sent, for client calls such as scroll_to() that
+    need the controls they refer to to be there first.
+    """
+
+    def __init__(self, page, rate=60, meter=None):
+        self.page = page
+        self.interval = 1 / rate
+        self.meter = meter
+        self.lock = threading.RLock()
+        self._lock = threading.Lock()
+        self._dirty = {}
+        self._callbacks = []
+        self._first_mark = None
+        self._scheduled = False
+        self._last_flush = 0.0
+
+        # Counters
+        self.marks = 0
+        self.flushes = 0
+        self.flushed_controls = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def mark(self, *controls):
+        with self._lock:
+            for control in controls:
+                self._dirty[id(control)] = control
+            self.marks += len(controls)
+            if self._first_mark is None:
+                self._first_mark = time.perf_counter()
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self.page.loop.call_soon_threadsafe(self._schedule)
+
+    def after_flush(self, callback):
+        """Call `callback()` on the event loop after the next flush"""
+        with self._lock:
+            self._callbacks.append(callback)
+        self.mark()
+
+    def _schedule(self):
+        delay = max(0.0, self._last_flush + self.interval - time.perf_counter())
+        self.page.loop.call_later(delay, self.flush)
+
+    def flush(self):
+        """Push everything marked so far; normally called by the event loop"""
+        with self._lock:
+            dirty, self._dirty = self._dirty, {}
+            callbacks, self._callbacks = self._callbacks, []
+            first_mark, self._first_mark = self._first_mark, None
+            self._scheduled = False
+        with self.lock:
+            controls = _outermost(dirty)
+            if controls:
+                UpdateScope(self.page, self.meter).mark(*controls).flush()
+        for callback in callbacks:
+            callback()
+
+        self._last_flush = time.perf_counter()
+        if first_mark is not None:
+            latency = self._last_flush - first_mark
+            self.flushes += 1
+            self.flushed_controls += len(controls)
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            if INSTRUMENTED:
+                METRICS.observe("update", "scheduler.mark_to_flush", latency)
+
+    @property
+    def coalesced(self):
+        """Marks that did not turn into a control of their own in a flush"""
+        return self.marks - self.flushed_controls
+
+    def stats(self):
+        return {
+            "flushes": self.flushes,
+            "marks": self.marks,
+            "coalesced": self.coalesced,
+            "flushed_controls": self.flushed_controls,
+            "latency_avg_ms": 1000 * self.latency_total / self.flushes if self.flushes else 0.0,
+            "latency_max_ms": 1000 * self.latency_max,
+        }
+
+
+def _outermost(dirty):
+    controls = []
+    for control in dirty.values():
+        parent = control.parent
+        while parent is not None and id(parent) not in dirty:
+            parent = parent.parent
+        # A control that was never sent goes out whole with the update
+        # that adds it, which may still be on its way from a handler
+        if parent is None and control.uid is not None:
+            controls.append(control)
+    return controls
+
+
+def scheduler_for(page, rate=60, meter=None):
+    """Per-page UpdateScheduler, kept in the page session"""
+    scheduler = page.session.get("update_scheduler")
+    if scheduler is None:
+        scheduler = UpdateScheduler(page, rate=rate, meter=meter)
+        page.session.set("update_scheduler", scheduler)
+    return scheduler
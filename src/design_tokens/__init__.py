@@ -1 +1,36 @@
-# Design Tokens package
\ No newline at end of file
+"""
+Design Tokens package
+
+The token modules (colors, spacing, typography, borders, shadows) are
+plain Python and load without Flet. The Flet-backed helpers (TOKENS,
+Roles and the theme functions) are exported lazily and import Flet on
+first use.
+"""
+
+import importlib
+
+_EXPORTS = {
+    "Colors": ".colors",
+    "Spacing": ".spacing",
+    "Typography": ".typography",
+    "Borders": ".borders",
+    "Shadows": ".shadows",
+    "TOKENS": ".compiled",
+    "Roles": ".theme",
+    "apply_theme": ".theme",
+    "set_theme_mode": ".theme",
+    "toggle_theme_mode": ".theme",
+}
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
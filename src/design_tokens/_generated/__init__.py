@@ -0,0 +1,3 @@
+# Generated by tools/build_tokens.py from design_tokens/tokens.json; do not edit.
+
+SOURCE_HASH = "e7103fe05425cf01b58c1a548989b98d8c28fdf6529f317a69312fae409fc374"
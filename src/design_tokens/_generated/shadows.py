@@ -0,0 +1,37 @@
+# Generated by tools/build_tokens.py from design_tokens/tokens.json; do not edit.
+
+__all__ = [
+    "SHADOW_NONE",
+    "SHADOW_SM",
+    "SHADOW_BASE",
+    "SHADOW_MD",
+    "SHADOW_LG",
+    "SHADOW_XL",
+    "SHADOW_2XL",
+    "Shadows",
+]
+
+# Shadow Definitions, written as CSS box-shadow and compiled to ft.BoxShadow keyword specs
+SHADOW_NONE = ()
+SHADOW_SM = ({"spread_radius": 0.0, "blur_radius": 2.0, "color": "#000000,0.05", "offset": (0.0, 1.0)},)
+SHADOW_BASE = ({"spread_radius": 0.0, "blur_radius": 3.0, "color": "#000000,0.1", "offset": (0.0, 1.0)}, {"spread_radius": 0.0, "blur_radius": 2.0, "color": "#000000,0.06", "offset": (0.0, 1.0)})
+SHADOW_MD = ({"spread_radius": -1.0, "blur_radius": 6.0, "color": "#000000,0.1", "offset": (0.0, 4.0)}, {"spread_radius": -1.0, "blur_radius": 4.0, "color": "#000000,0.06", "offset": (0.0, 2.0)})
+SHADOW_LG = ({"spread_radius": -3.0, "blur_radius": 15.0, "color": "#000000,0.1", "offset": (0.0, 10.0)}, {"spread_radius": -2.0, "blur_radius": 6.0, "color": "#000000,0.05", "offset": (0.0, 4.0)})
+SHADOW_XL = ({"spread_radius": -5.0, "blur_radius": 25.0, "color": "#000000,0.1", "offset": (0.0, 20.0)}, {"spread_radius": -5.0, "blur_radius": 10.0, "color": "#000000,0.04", "offset": (0.0, 10.0)})
+SHADOW_2XL = ({"spread_radius": -12.0, "blur_radius": 50.0, "color": "#000000,0.25", "offset": (0.0, 25.0)},)
+
+
+# Semantic Shadows
+class Shadows:
+    BUTTON = SHADOW_SM
+    CARD = SHADOW_BASE
+    MODAL = SHADOW_LG
+    DROPDOWN = SHADOW_MD
+    TOOLTIP = SHADOW_SM
+
+    # Elevation levels
+    LEVEL_1 = SHADOW_SM  # Buttons, small cards
+    LEVEL_2 = SHADOW_BASE  # Cards, inputs
+    LEVEL_3 = SHADOW_MD  # Dropdowns, popovers
+    LEVEL_4 = SHADOW_LG  # Modals, drawers
+    LEVEL_5 = SHADOW_XL  # High-priority overlays
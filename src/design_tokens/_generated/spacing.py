@@ -0,0 +1,61 @@
+# Generated by tools/build_tokens.py from design_tokens/tokens.json; do not edit.
+
+__all__ = [
+    "BASE_UNIT",
+    "SPACE_0",
+    "SPACE_1",
+    "SPACE_2",
+    "SPACE_3",
+    "SPACE_4",
+    "SPACE_5",
+    "SPACE_6",
+    "SPACE_8",
+    "SPACE_10",
+    "SPACE_12",
+    "SPACE_16",
+    "SPACE_20",
+    "SPACE_24",
+    "SPACE_32",
+    "Spacing",
+]
+
+# Base spacing unit (4px)
+BASE_UNIT = 4
+
+# Spacing Scale (based on 4px grid)
+SPACE_0 = 0
+SPACE_1 = 4  # 4px
+SPACE_2 = 8  # 8px
+SPACE_3 = 12  # 12px
+SPACE_4 = 16  # 16px
+SPACE_5 = 20  # 20px
+SPACE_6 = 24  # 24px
+SPACE_8 = 32  # 32px
+SPACE_10 = 40  # 40px
+SPACE_12 = 48  # 48px
+SPACE_16 = 64  # 64px
+SPACE_20 = 80  # 80px
+SPACE_24 = 96  # 96px
+SPACE_32 = 128  # 128px
+
+
+# Semantic Spacing
+class Spacing:
+    # Component Internal Spacing
+    XS = SPACE_1
+    SM = SPACE_2
+    MD = SPACE_4
+    LG = SPACE_6
+    XL = SPACE_8
+
+    # Layout Spacing
+    SECTION = SPACE_12
+    PAGE = SPACE_16
+
+    # Component Specific
+    BUTTON_PADDING_X = SPACE_4
+    BUTTON_PADDING_Y = SPACE_2
+    INPUT_PADDING_X = SPACE_3
+    INPUT_PADDING_Y = SPACE_2
+    CARD_PADDING = SPACE_6
+    MODAL_PADDING = SPACE_8
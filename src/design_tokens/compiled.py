@@ -0,0 +1,89 @@
+"""
+Compiled Design Tokens
+Ready-to-use Flet style objects, built once from the token modules
+"""
+
+import flet as ft
+
+from . import colors
+from .borders import Borders
+from .colors import Colors
+from .shadows import Shadows
+from .spacing import Spacing
+from .typography import Typography
+
+
+class TokenGroup:
+    """Frozen, slot-based namespace of prebuilt style objects"""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is frozen")
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(self.__slots__)})"
+
+
+def _group(name, values):
+    group = object.__new__(type(name, (TokenGroup,), {"__slots__": tuple(values)}))
+    for key, value in values.items():
+        object.__setattr__(group, key, value)
+    return group
+
+
+def _semantic(tokens):
+    return {name: value for name, value in vars(tokens).items() if name.isupper()}
+
+
+def box_shadows(specs):
+    """ft.BoxShadow list from a shadow token (keyword specs precompiled by tools/build_tokens.py)"""
+    return [ft.BoxShadow(**{**spec, "offset": ft.Offset(*spec["offset"])}) for spec in specs]
+
+
+def compile_tokens():
+    text = {
+        name: ft.TextStyle(size=spec["size"], weight=spec["weight"], height=spec["line_height"])
+        for name, spec in _semantic(Typography).items()
+    }
+
+    padding = {
+        name.replace("_PADDING", ""): ft.padding.all(value)
+        for name, value in _semantic(Spacing).items() if not name.endswith(("_X", "_Y"))
+    }
+    padding["BUTTON"] = ft.padding.symmetric(horizontal=Spacing.BUTTON_PADDING_X, vertical=Spacing.BUTTON_PADDING_Y)
+    padding["INPUT"] = ft.padding.symmetric(horizontal=Spacing.INPUT_PADDING_X, vertical=Spacing.INPUT_PADDING_Y)
+
+    radius = {
+        name[len("RADIUS_"):]: ft.border_radius.all(value)
+        for name, value in _semantic(Borders).items() if name.startswith("RADIUS_")
+    }
+
+    border = {
+        "THIN": ft.border.all(Borders.WIDTH_THIN, colors.GRAY_300),
+        "THICK": ft.border.all(Borders.WIDTH_THICK, colors.GRAY_300),
+        "FOCUS": ft.border.all(Borders.WIDTH_FOCUS, Colors.PRIMARY),
+        "PRIMARY": ft.border.all(Borders.WIDTH_THIN, Colors.PRIMARY),
+        "DANGER": ft.border.all(Borders.WIDTH_THIN, Colors.DANGER),
+    }
+
+    shadow = {name: box_shadows(value) for name, value in _semantic(Shadows).items()}
+
+    return _group("CompiledTokens", {
+        "text": _group("TextTokens", text),
+        "padding": _group("PaddingTokens", padding),
+        "radius": _group("RadiusTokens", radius),
+        "border": _group("BorderTokens", border),
+        "shadow": _group("ShadowTokens", shadow),
+    })
+
+
+# Built once at import; components reference these objects directly
+# instead of re-deriving styles per control. Treat them as read-only.
+TOKENS = compile_tokens()
@@ -0,0 +1,114 @@
+"""
+Theme Tokens
+Maps the semantic color tokens onto Flet ColorScheme roles
+"""
+
+import flet as ft
+
+from . import colors
+from .colors import Colors
+
+
+# ColorScheme roles per palette
+LIGHT_SCHEME = {
+    "primary": Colors.PRIMARY,
+    "on_primary": Colors.TEXT_INVERSE,
+    "primary_container": Colors.PRIMARY_LIGHT,
+    "on_primary_container": Colors.PRIMARY_DARK,
+    "secondary": Colors.SECONDARY,
+    "on_secondary": Colors.TEXT_INVERSE,
+    "secondary_container": Colors.SECONDARY_LIGHT,
+    "on_secondary_container": Colors.TEXT_PRIMARY,
+    "tertiary": Colors.SUCCESS,
+    "on_tertiary": Colors.TEXT_INVERSE,
+    "error": Colors.DANGER,
+    "on_error": Colors.TEXT_INVERSE,
+    "surface": Colors.BG_PRIMARY,
+    "on_surface": Colors.TEXT_PRIMARY,
+    "on_surface_variant": Colors.TEXT_SECONDARY,
+    "outline": colors.GRAY_300,
+}
+
+DARK_SCHEME = {
+    "primary": colors.PRIMARY_100,
+    "on_primary": colors.PRIMARY_900,
+    "primary_container": colors.PRIMARY_600,
+    "on_primary_container": colors.PRIMARY_50,
+    "secondary": colors.SECONDARY_100,
+    "on_secondary": colors.SECONDARY_900,
+    "secondary_container": colors.SECONDARY_600,
+    "on_secondary_container": colors.SECONDARY_50,
+    "tertiary": colors.SUCCESS_500,
+    "on_tertiary": colors.WHITE,
+    "error": colors.DANGER_50,
+    "on_error": colors.DANGER_600,
+    "surface": colors.GRAY_900,
+    "on_surface": colors.GRAY_50,
+    "on_surface_variant": colors.GRAY_400,
+    "outline": colors.GRAY_600,
+}
+
+
+# Semantic color roles for components. These resolve on the client
+# against the active theme, so switching palettes doesn't touch controls.
+class Roles:
+    PRIMARY = ft.Colors.PRIMARY
+    ON_PRIMARY = ft.Colors.ON_PRIMARY
+    PRIMARY_LIGHT = ft.Colors.PRIMARY_CONTAINER
+    PRIMARY_DARK = ft.Colors.ON_PRIMARY_CONTAINER
+
+    SECONDARY = ft.Colors.SECONDARY
+    ON_SECONDARY = ft.Colors.ON_SECONDARY
+    SECONDARY_LIGHT = ft.Colors.SECONDARY_CONTAINER
+    SECONDARY_DARK = ft.Colors.ON_SECONDARY_CONTAINER
+
+    SUCCESS = ft.Colors.TERTIARY
+    ON_SUCCESS = ft.Colors.ON_TERTIARY
+    DANGER = ft.Colors.ERROR
+    ON_DANGER = ft.Colors.ON_ERROR
+
+    BG_PRIMARY = ft.Colors.SURFACE
+    BG_SECONDARY = ft.Colors.SECONDARY_CONTAINER
+    BORDER = ft.Colors.OUTLINE
+
+    TEXT_PRIMARY = ft.Colors.ON_SURFACE
+    TEXT_SECONDARY = ft.Colors.ON_SURFACE_VARIANT
+    TEXT_INVERSE = ft.Colors.ON_PRIMARY
+
+
+def build_theme(scheme):
+    return ft.Theme(color_scheme=ft.ColorScheme(**scheme), use_material3=True)
+
+
+LIGHT_THEME = build_theme(LIGHT_SCHEME)
+DARK_THEME = build_theme(DARK_SCHEME)
+
+
+def apply_theme(page, mode=ft.ThemeMode.LIGHT):
+    """Install the light and dark themes once; call before the first page update"""
+    page.theme = LIGHT_THEME
+    page.dark_theme = DARK_THEME
+    page.theme_mode = mode
+
+
+def set_theme_mode(page, mode, scheduler=None):
+    """
+    Switch palettes with a single page-level patch
+
+    Controls reference Roles, so nothing in the tree changes and only
+    the page's theme_mode is sent to the client. With the session's
+    UpdateScheduler the change is made under its lock and the page
+    marked for the next flush; without one the page is updated directly.
+    """
+    if scheduler is None:
+        page.theme_mode = mode
+        page.update()
+        return
+    with scheduler.lock:
+        page.theme_mode = mode
+    scheduler.mark(page)
+
+
+def toggle_theme_mode(page, scheduler=None):
+    dark = page.theme_mode == ft.ThemeMode.DARK
+    set_theme_mode(page, ft.ThemeMode.LIGHT if dark else ft.ThemeMode.DARK, scheduler)
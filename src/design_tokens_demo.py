@@ -1,26 +1,52 @@
 import flet as ft
-from components.atoms.button_with_tokens import Button
-from design_tokens.colors import Colors
-from design_tokens.spacing import Spacing
-from design_tokens.typography import Typography
 
 
 def main(page: ft.Page):
+    # Components and compiled tokens load on the first page build
+    from components.templates import template
+    from components.updates import scheduler_for
+    from design_tokens import Spacing, Roles, apply_theme, toggle_theme_mode
+    
     page.title = "Design Tokens Demo"
-    page.bgcolor = Colors.BG_PRIMARY
+    page.bgcolor = Roles.BG_PRIMARY
     page.padding = Spacing.PAGE
     
+    # Colors below are theme roles, so switching palettes is one page patch
+    apply_theme(page)
+    
     def button_clicked(e):
         print(f"Button clicked: {e.control}")
     
+    # The showcase is static: it is built once per process and each
+    # session gets a clone with its own handlers bound
     page.add(
+        template(
+            "design_tokens_demo", showcase, page,
+            button_clicked=button_clicked,
+            toggle_theme=lambda e: toggle_theme_mode(page, scheduler_for(page))
+        )
+    )
+
+
+def showcase(slot):
+    from components import TokenButton as Button
+    from design_tokens import Spacing, TOKENS, Roles
+    
+    return (
         ft.Column([
+            ft.Row([
+                ft.IconButton(
+                    icon=ft.Icons.DARK_MODE,
+                    tooltip="Toggle theme",
+                    on_click=slot("toggle_theme")
+                )
+            ], alignment=ft.MainAxisAlignment.END),
+            
             # Header using typography tokens
             ft.Text(
                 "Design Tokens System", 
-                size=Typography.H1["size"],
-                weight=Typography.H1["weight"],
-                color=Colors.TEXT_PRIMARY
+                style=TOKENS.text.H1,
+                color=Roles.TEXT_PRIMARY
             ),
             
             ft.Container(height=Spacing.SECTION),  # Section spacing
@@ -28,40 +54,39 @@ def main(page: ft.Page):
             # Color Palette
             ft.Text(
                 "Color Palette", 
-                size=Typography.H3["size"],
-                weight=Typography.H3["weight"],
-                color=Colors.TEXT_PRIMARY
+                style=TOKENS.text.H3,
+                color=Roles.TEXT_PRIMARY
             ),
             
             ft.Row([
                 ft.Container(
-                    ft.Text("Primary", color=Colors.TEXT_INVERSE, size=12),
-                    bgcolor=Colors.PRIMARY,
-                    padding=Spacing.MD,
+                    ft.Text("Primary", color=Roles.ON_PRIMARY, size=12),
+                    bgcolor=Roles.PRIMARY,
+                    padding=TOKENS.padding.MD,
                     border_radius=4,
                     width=100,
                     alignment=ft.alignment.center
                 ),
                 ft.Container(
-                    ft.Text("Secondary", color=Colors.TEXT_PRIMARY, size=12),
-                    bgcolor=Colors.SECONDARY,
-                    padding=Spacing.MD,
+                    ft.Text("Secondary", color=Roles.ON_SECONDARY, size=12),
+                    bgcolor=Roles.SECONDARY,
+                    padding=TOKENS.padding.MD,
                     border_radius=4,
                     width=100,
                     alignment=ft.alignment.center
                 ),
                 ft.Container(
-                    ft.Text("Success", color=Colors.TEXT_INVERSE, size=12),
-                    bgcolor=Colors.SUCCESS,
-                    padding=Spacing.MD,
+                    ft.Text("Success", color=Roles.ON_SUCCESS, size=12),
+                    bgcolor=Roles.SUCCESS,
+                    padding=TOKENS.padding.MD,
                     border_radius=4,
                     width=100,
                     alignment=ft.alignment.center
                 ),
                 ft.Container(
-                    ft.Text("Danger", color=Colors.TEXT_INVERSE, size=12),
-                    bgcolor=Colors.DANGER,
-                    padding=Spacing.MD,
+                    ft.Text("Danger", color=Roles.ON_DANGER, size=12),
+                    bgcolor=Roles.DANGER,
+                    padding=TOKENS.padding.MD,
                     border_radius=4,
                     width=100,
                     alignment=ft.alignment.center
@@ -73,19 +98,18 @@ def main(page: ft.Page):
             # Typography Scale
             ft.Text(
                 "Typography Scale", 
-                size=Typography.H3["size"],
-                weight=Typography.H3["weight"],
-                color=Colors.TEXT_PRIMARY
+                style=TOKENS.text.H3,
+                color=Roles.TEXT_PRIMARY
             ),
             
             ft.Column([
-                ft.Text("Heading 1", size=Typography.H1["size"], weight=Typography.H1["weight"]),
-                ft.Text("Heading 2", size=Typography.H2["size"], weight=Typography.H2["weight"]),
-                ft.Text("Heading 3", size=Typography.H3["size"], weight=Typography.H3["weight"]),
-                ft.Text("Body Large", size=Typography.BODY_LARGE["size"], weight=Typography.BODY_LARGE["weight"]),
-                ft.Text("Body", size=Typography.BODY["size"], weight=Typography.BODY["weight"]),
-                ft.Text("Body Small", size=Typography.BODY_SMALL["size"], weight=Typography.BODY_SMALL["weight"]),
-                ft.Text("Caption", size=Typography.CAPTION["size"], weight=Typography.CAPTION["weight"]),
+                ft.Text("Heading 1", style=TOKENS.text.H1),
+                ft.Text("Heading 2", style=TOKENS.text.H2),
+                ft.Text("Heading 3", style=TOKENS.text.H3),
+                ft.Text("Body Large", style=TOKENS.text.BODY_LARGE),
+                ft.Text("Body", style=TOKENS.text.BODY),
+                ft.Text("Body Small", style=TOKENS.text.BODY_SMALL),
+                ft.Text("Caption", style=TOKENS.text.CAPTION),
             ], spacing=Spacing.XS),
             
             ft.Container(height=Spacing.SECTION),
@@ -93,22 +117,21 @@ def main(page: ft.Page):
             # Buttons with Design Tokens
             ft.Text(
                 "Buttons with Design Tokens", 
-                size=Typography.H3["size"],
-                weight=Typography.H3["weight"],
-                color=Colors.TEXT_PRIMARY
+                style=TOKENS.text.H3,
+                color=Roles.TEXT_PRIMARY
             ),
             
             ft.Row([
-                Button("Primary", variant="primary", on_click=button_clicked),
-                Button("Secondary", variant="secondary", on_click=button_clicked),
-                Button("Danger", variant="danger", on_click=button_clicked),
-                Button("Ghost", variant="ghost", on_click=button_clicked),
+                Button("Primary", variant="primary", on_click=slot("button_clicked")),
+                Button("Secondary", variant="secondary", on_click=slot("button_clicked")),
+                Button("Danger", variant="danger", on_click=slot("button_clicked")),
+                Button("Ghost", variant="ghost", on_click=slot("button_clicked")),
             ], spacing=Spacing.SM),
             
             ft.Row([
-                Button("Small", size="small", on_click=button_clicked),
-                Button("Medium", size="medium", on_click=button_clicked),
-                Button("Large", size="large", on_click=button_clicked),
+                Button("Small", size="small", on_click=slot("button_clicked")),
+                Button("Medium", size="medium", on_click=slot("button_clicked")),
+                Button("Large", size="large", on_click=slot("button_clicked")),
             ], spacing=Spacing.SM),
             
             ft.Container(height=Spacing.SECTION),
@@ -116,34 +139,33 @@ def main(page: ft.Page):
             # Spacing Examples
             ft.Text(
                 "Spacing System", 
-                size=Typography.H3["size"],
-                weight=Typography.H3["weight"],
-                color=Colors.TEXT_PRIMARY
+                style=TOKENS.text.H3,
+                color=Roles.TEXT_PRIMARY
             ),
             
             ft.Column([
                 ft.Container(
                     ft.Text("XS Padding", size=12),
-                    bgcolor=Colors.GRAY_LIGHT,
-                    padding=Spacing.XS,
+                    bgcolor=Roles.BG_SECONDARY,
+                    padding=TOKENS.padding.XS,
                     border_radius=4
                 ),
                 ft.Container(
                     ft.Text("SM Padding", size=12),
-                    bgcolor=Colors.GRAY_LIGHT,
-                    padding=Spacing.SM,
+                    bgcolor=Roles.BG_SECONDARY,
+                    padding=TOKENS.padding.SM,
                     border_radius=4
                 ),
                 ft.Container(
                     ft.Text("MD Padding", size=12),
-                    bgcolor=Colors.GRAY_LIGHT,
-                    padding=Spacing.MD,
+                    bgcolor=Roles.BG_SECONDARY,
+                    padding=TOKENS.padding.MD,
                     border_radius=4
                 ),
                 ft.Container(
                     ft.Text("LG Padding", size=12),
-                    bgcolor=Colors.GRAY_LIGHT,
-                    padding=Spacing.LG,
+                    bgcolor=Roles.BG_SECONDARY,
+                    padding=TOKENS.padding.LG,
                     border_radius=4
                 ),
             ], spacing=Spacing.SM),
@@ -152,4 +174,5 @@ def main(page: ft.Page):
     )
 
 
-ft.app(main)
\ No newline at end of file
+if __name__ == "__main__":
+    ft.app(main)
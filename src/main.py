@@ -1,51 +1,174 @@
-import flet as ft
-from components.message_bubble import MessageBubble
-from components.chat_input import ChatInput
-from components.chat_container import ChatContainer
-from components.chat_messages_list import ChatMessagesList
+from __future__ import annotations
+
+import os
 
 
 def main(page: ft.Page):
+    # App modules load on the first page build rather than at process
+    # start, so the Flet server/window comes up before they are imported.
+    # flet itself is imported here too: reply worker processes import
+    # this module again (as __mp_main__) and don't need it
+    import flet as ft
+    from components import ChatContainer, ChatWindow, SearchBar, ImportProgress
+    from components.message_bubble import LARGE_MESSAGE
+    from components.organisms.import_progress import update_import_progress
+    from components.updates import scheduler_for
+    from components.refs import refs_for
+    from chat.message import Message
+    from chat.store import DEFAULT_CONVERSATION, open_store, session_conversation
+    from chat.responder import Busy, ReplyQueue, ResponderPipeline, pooled
+    from chat.workers import echo
+    from chat.importer import ImportStatus, TranscriptImport
+    from media.assets import ASSETS_DIR
+    from media.thumbnails import open_thumbnails
+    
     page.title = "Echo Chat"
     page.bgcolor = ft.Colors.WHITE
     
+    # Named handles to controls, registered by components at build time
+    # CHAT_DEBUG_REFS=1 warns when a handler reaches a removed control
+    refs = refs_for(page, debug=bool(os.getenv("CHAT_DEBUG_REFS")))
+    
+    # CHAT_LARGE_MESSAGE sets the length (in characters) above which a
+    # message is shown as a preview that expands in chunks
+    large_message = int(os.getenv("CHAT_LARGE_MESSAGE", LARGE_MESSAGE))
+    
+    # History is persisted in the message store; the windowed list only
+    # pages in the rows it shows, so startup cost doesn't grow with history.
+    # Long texts are read only up to the preview length until expanded.
+    # Each web session has a conversation of its own, deleted when the
+    # session closes (FLET_SESSION_TIMEOUT seconds, default an hour, after
+    # its tab disconnects); the desktop app keeps one history across runs
+    conversation = session_conversation(page) if page.web else DEFAULT_CONVERSATION
+    store = open_store(conversation, preview_chars=large_message)
+    
+    # CHAT_MEASURE=1 prints the diff and patch cost of every update
+    meter = None
+    if os.getenv("CHAT_MEASURE"):
+        from perf.patch_meter import PatchMeter
+        meter = PatchMeter(page, verbose=True)
+    
+    # Images in messages are shown as small thumbnails, made on first
+    # view and kept in an on-disk cache of CHAT_THUMB_CACHE_MB megabytes;
+    # its directory is only created once an image is shown
+    thumbnails = open_thumbnails()
+    # Replies carry the app icon as their avatar, thumbnailed like any image
+    avatars = {"Echo": ASSETS_DIR / "icon.png"}
+    
+    # Controls are marked dirty and flushed together once per tick
+    scheduler = scheduler_for(page, meter=meter)
+    
     # Initialize components
-    chat_list = ChatMessagesList()
+    # The chat window owns the message list and input and only rebuilds
+    # the part whose props change
+    # CHAT_GROUP_RUNS=1 merges consecutive messages from one sender into a single bubble
+    chat_window = ChatWindow(
+        items=store,
+        on_send=lambda e: send_message(),
+        on_submit=lambda e: send_message(),
+        group_runs=bool(os.getenv("CHAT_GROUP_RUNS")),
+        large_message=large_message,
+        thumbnails=thumbnails,
+        avatars=avatars,
+        refs=refs,
+        scheduler=scheduler
+    )
+    
+    # Replies are generated in a worker process pool shared by all
+    # sessions (CHAT_REPLY_WORKERS processes, 0 for threads) and streamed
+    # into their bubble on the page event loop.
+    # CHAT_REPLY_QUEUE caps the replies a session can have outstanding;
+    # while it is full, sends are refused and the input says so
+    def show_busy(queue):
+        message_input = refs.get("chat_input.field")
+        error = f"{responder.sender} is still replying to your last {queue.limit} messages" if queue.full else None
+        if message_input and message_input.error_text != error:
+            message_input.error_text = error
+            scheduler.mark(message_input)
+    
+    reply_queue = ReplyQueue(int(os.getenv("CHAT_REPLY_QUEUE", 3)), on_change=show_busy)
+    # The window may rebuild its list (see Organism.set_props), so the
+    # list is looked up through chat_window.messages on every use
+    responder = ResponderPipeline(page, lambda: chat_window.messages, scheduler, producer=pooled(echo), queue=reply_queue)
+    
+    # Replies still waiting or streaming are dropped when the user
+    # closes or leaves the page
+    page.on_disconnect = lambda e: responder.cancel()
     
     def send_message():
-        message_input = None
-        # Find the TextField in the input component
-        for control in page.controls[0].content.content.controls[1].controls:
-            if isinstance(control, ft.TextField):
-                message_input = control
-                break
+        message_input = refs.get("chat_input.field")
         
         if message_input and message_input.value.strip():
-            # Add user message using component
-            chat_list.controls.append(
-                MessageBubble(message_input.value, "You", True)
-            )
+            # Back to the newest messages if the list was scrolled or
+            # jumped away from them
+            if not chat_window.messages.following:
+                chat_window.messages.jump_to(len(store) - 1)
             
-            # Add echo message using component
-            chat_list.controls.append(
-                MessageBubble(message_input.value, "Echo", False)
-            )
+            # Add the user message and an empty echo bubble that the
+            # responder fills in; messages are written to the store and
+            # the list builds their bubbles on demand
+            text = message_input.value
+            try:
+                responder.reply_to(text, before=lambda: chat_window.messages.append(Message("You", True, text)))
+            except Busy:
+                # Keep the text; the input shows why it wasn't sent
+                return
             
             message_input.value = ""
-            page.update()
+            
+            # Push only the list and the cleared field, not the whole page
+            scheduler.mark(chat_window.messages, message_input)
     
-    # Build UI using components
-    chat_input = ChatInput(
-        on_send=lambda e: send_message(),
-        on_submit=lambda e: send_message()
+    # CHAT_INSTRUMENT=1 times components, handlers and updates and shows them in an overlay
+    from perf.instrumentation import ENABLED as INSTRUMENTED
+    if INSTRUMENTED:
+        from components.organisms.debug_overlay import attach_debug_overlay
+        attach_debug_overlay(page)
+    
+    # Search hits come from the store's full-text index; picking one
+    # moves the list window to it
+    search_bar = SearchBar(store.search, lambda index: chat_window.messages.jump_to(index), scheduler=scheduler, refs=refs)
+    search_bar.expand = True
+    
+    # JSONL transcripts are imported on a worker thread in chunks; after
+    # each chunk the list re-reads only its tail window
+    importer = None
+    
+    def import_progress(status):
+        with scheduler.lock:
+            update_import_progress(import_panel, status)
+            chat_window.messages.sync()
+        scheduler.mark(import_panel, chat_window.messages)
+    
+    def import_transcript(e: ft.FilePickerResultEvent):
+        nonlocal importer
+        if not e.files:
+            return
+        if e.files[0].path is None:
+            # Web sessions only get file names, not paths on the server
+            import_progress(ImportStatus(0, 0, 0.0, True, error="transcripts can only be imported in the desktop app"))
+            return
+        importer = TranscriptImport(store, e.files[0].path, on_progress=import_progress)
+        importer.start(page)
+    
+    file_picker = ft.FilePicker(on_result=import_transcript)
+    page.overlay.append(file_picker)
+    import_panel = ImportProgress(on_cancel=lambda e: importer and importer.cancel())
+    import_button = ft.IconButton(
+        icon=ft.Icons.UPLOAD_FILE,
+        tooltip="Import transcript",
+        on_click=lambda e: file_picker.pick_files(allowed_extensions=["jsonl"])
     )
     
     page.add(
         ChatContainer([
-            chat_list,
-            chat_input
+            ft.Row([search_bar, import_button], vertical_alignment=ft.CrossAxisAlignment.START),
+            import_panel,
+            chat_window
         ])
     )
 
 
-ft.app(main)
+if __name__ == "__main__":
+    import flet as ft
+    ft.app(main)
@@ -0,0 +1 @@
+# Media package
\ No newline at end of file
@@ -0,0 +1,62 @@
+"""
+Asset Manifest
+Content-hashed names for files in the assets directory
+
+tools/build_assets.py copies each asset to dist/<stem>.<hash>.<ext>, next
+to pre-compressed .gz/.br variants, and records the mapping in
+assets/manifest.json. A hashed file never changes, so it can be served
+with a far-future cache lifetime; asset_src() gives the current name.
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+ASSETS_DIR = Path(__file__).resolve().parents[1] / "assets"
+MANIFEST = "manifest.json"
+HASHED_DIR = "dist"
+
+_manifest = None
+_lock = threading.Lock()
+
+
+def content_hash(data, length=12):
+    """Hex digest identifying `data` (bytes or a file path)"""
+    digest = hashlib.sha256()
+    if isinstance(data, (bytes, bytearray)):
+        digest.update(data)
+    else:
+        with open(data, "rb") as f:
+            for block in iter(lambda: f.read(1 << 16), b""):
+                digest.update(block)
+    return digest.hexdigest()[:length]
+
+
+def hashed_name(name, digest):
+    """avatar.png -> avatar.<digest>.png"""
+    path = Path(name)
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def load_manifest(assets_dir=ASSETS_DIR):
+    """{asset name: {"path", "size", "encodings": {encoding: size}}}, empty if no build has run"""
+    try:
+        with open(Path(assets_dir) / MANIFEST, encoding="utf-8") as f:
+            return json.load(f)["assets"]
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def asset_src(name):
+    """
+    Image/icon src for an asset: its hashed copy when the manifest has
+    one, otherwise the file as is
+    """
+    global _manifest
+    if _manifest is None:
+        with _lock:
+            if _manifest is None:
+                _manifest = load_manifest()
+    entry = _manifest.get(name)
+    return f"/{entry['path']}" if entry else f"/{name}"
@@ -0,0 +1,329 @@
+"""
+Thumbnail Cache
+Bounded on-disk cache of small copies of chat images and avatars
+
+Bubbles show a thumbnail instead of the attachment itself, so a page of
+history costs the client a few tens of kilobytes per image rather than
+the full files. Thumbnails are named after the source's content hash and
+the requested size, which makes their URLs safe to cache forever; the
+directory is kept under `max_bytes` by dropping the least recently used
+ones.
+
+Resizing needs Pillow. Without it the source is copied as is under its
+hashed name, which keeps the cache and URLs working at full size; only
+files that start like a PNG, JPEG, GIF, WebP or BMP image are copied.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+from .assets import ASSETS_DIR, asset_src, content_hash
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = ASSETS_DIR / "thumbs"
+THUMBNAIL_SIZE = 320
+MAX_BYTES = 64 * 1024 * 1024
+
+# Content hashes of recently seen sources, by path, so a cache hit
+# doesn't read the whole file
+_DIGESTS = 4096
+
+# Seconds between checks that a source file is unchanged, and between
+# writes of the access times of the thumbnails served meanwhile
+RECHECK_INTERVAL = 60
+
+
+class ThumbnailCache:
+    """
+    Thumbnails of local image files, `size` px on their longest side
+
+    src(path) returns the URL to use as an Image src. `directory` must
+    be inside the app's assets directory, which the URLs are relative
+    to, unless `url_prefix` says where else it is served. Sources that
+    are already URLs are returned unchanged.
+
+    A hit costs no disk access: a source is stat()ed again only after
+    RECHECK_INTERVAL seconds (so a file replaced in place can show its
+    old thumbnail for that long), and the access times that carry the
+    LRU order across restarts are written in batches as often.
+
+    The directory is created and indexed on the first src() call. If it
+    can't be created, bubbles show the full images: files from the assets
+    directory by their asset_src() URL, others as they are.
+
+    Safe to share between sessions: the index is guarded by a lock, and
+    thumbnails are written to a temporary file and renamed into place.
+    """
+
+    def __init__(self, directory=THUMBNAIL_DIR, max_bytes=MAX_BYTES, size=THUMBNAIL_SIZE, url_prefix=None):
+        self.directory = Path(directory)
+        if url_prefix is None:
+            try:
+                url_prefix = "/" + self.directory.resolve().relative_to(ASSETS_DIR).as_posix()
+            except ValueError:
+                raise ValueError(f"thumbnail directory {self.directory} is not inside {ASSETS_DIR}") from None
+        self.max_bytes = max_bytes
+        self.size = size
+        self.url_prefix = url_prefix.rstrip("/")
+        self.hits = self.misses = self.evictions = self.errors = 0
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # "<hash>-<size>" -> (file name, bytes), least recently used first
+        self._bytes = 0
+        self._digests = OrderedDict()  # path -> (mtime, size, digest, checked at)
+        self._touched = set()
+        self._next_touch = 0.0
+        self._opened = None
+
+    def _open(self):
+        """Create and index the directory on first use; False if it can't be"""
+        with self._lock:
+            if self._opened is None:
+                try:
+                    self.directory.mkdir(parents=True, exist_ok=True)
+                    self._load()
+                    self._opened = True
+                except OSError as e:
+                    logger.warning("No thumbnail cache in %s (%s); showing images at full size", self.directory, e)
+                    self._opened = False
+            return self._opened
+
+    def _load(self):
+        """Index thumbnails left by earlier runs, oldest access first"""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.startswith("."):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._entries[name.partition(".")[0]] = (name, size)
+            self._bytes += size
+        self._evict()
+
+    def src(self, path, size=None):
+        """
+        URL of the thumbnail of image `path`, created on first use; None
+        if the file can't be read or isn't an image
+        """
+        path = str(path)
+        if "://" in path or path.startswith("data:"):
+            return path
+        if not self._open():
+            return _full_size(path)
+        size = size or self.size
+        try:
+            digest = self._digest(path)
+        except OSError:
+            return self._failed()
+
+        key = f"{digest}-{size}"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is not None:
+            self._touch(entry[0])
+            return f"{self.url_prefix}/{entry[0]}"
+
+        try:
+            name, written = self._create(path, key, size)
+        except (OSError, ValueError):
+            # Unreadable or not an image (Pillow raises OSError subclasses)
+            return self._failed()
+        with self._lock:
+            self.misses += 1
+            # Another session may have created it meanwhile
+            self._bytes += written - self._entries.pop(key, (name, 0))[1]
+            self._entries[key] = (name, written)
+            self._evict()
+        return f"{self.url_prefix}/{name}"
+
+    def _failed(self):
+        with self._lock:
+            self.errors += 1
+        return None
+
+    def _digest(self, path):
+        now = time.monotonic()
+        with self._lock:
+            cached = self._digests.get(path)
+            if cached is not None and now - cached[3] < RECHECK_INTERVAL:
+                self._digests.move_to_end(path)
+                return cached[2]
+        stat = os.stat(path)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            digest = cached[2]
+        else:
+            digest = content_hash(path)
+        with self._lock:
+            self._digests[path] = (stat.st_mtime_ns, stat.st_size, digest, now)
+            self._digests.move_to_end(path)
+            if len(self._digests) > _DIGESTS:
+                self._digests.popitem(last=False)
+        return digest
+
+    def _create(self, path, key, size):
+        """Write the thumbnail of `path`; returns its file name and size"""
+        pillow = _pillow()
+        if pillow is None:
+            with open(path, "rb") as source:
+                name = f"{key}{_image_suffix(source.read(12))}"
+                source.seek(0)
+                self._write(name, lambda f: shutil.copyfileobj(source, f))
+            return name, os.path.getsize(self.directory / name)
+
+        Image, ImageOps = pillow
+        with Image.open(path) as image:
+            # JPEGs can be decoded straight at a fraction of their size
+            image.draft("RGB", (size, size))
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail((size, size))
+            if _has_alpha(image):
+                name = f"{key}.png"
+                self._write(name, lambda f: image.save(f, "PNG", optimize=True))
+            else:
+                name = f"{key}.jpg"
+                image = image.convert("RGB")
+                self._write(name, lambda f: image.save(f, "JPEG", quality=80, optimize=True, progressive=True))
+        return name, os.path.getsize(self.directory / name)
+
+    def _write(self, name, save):
+        fd, temp = tempfile.mkstemp(dir=self.directory, prefix=".")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                save(f)
+            os.replace(temp, self.directory / name)
+        except BaseException:
+            os.unlink(temp)
+            raise
+
+    def _touch(self, name):
+        # Access order survives restarts through the files' mtimes,
+        # written for all thumbnails served since the last batch
+        now = time.monotonic()
+        with self._lock:
+            self._touched.add(name)
+            if now < self._next_touch:
+                return
+            names, self._touched = self._touched, set()
+            self._next_touch = now + RECHECK_INTERVAL
+        for name in names:
+            try:
+                os.utime(self.directory / name)
+            except OSError:
+                pass
+
+    def _evict(self):
+        """Drop least recently used thumbnails until under max_bytes; call with the lock held"""
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            _, (name, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+            try:
+                os.unlink(self.directory / name)
+            except OSError:
+                pass
+
+    def stats(self):
+        """Hits, misses, evictions, errors, hit rate and current size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "errors": self.errors,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "bytes": self._bytes,
+                "entries": len(self._entries),
+            }
+
+    def __str__(self):
+        stats = self.stats()
+        return (
+            f"thumbnails: {stats['hit_rate']:.0%} hit rate ({stats['hits']} hits, {stats['misses']} misses), "
+            f"{stats['entries']} files, {stats['bytes'] / 2**20:.1f} of {self.max_bytes / 2**20:.0f} MB, "
+            f"{stats['evictions']} evicted"
+        )
+
+
+_PIL = []
+
+
+def _pillow():
+    """(Image, ImageOps), or None without Pillow; imported on the first thumbnail"""
+    if not _PIL:
+        try:
+            from PIL import Image, ImageOps
+            _PIL.append((Image, ImageOps))
+        except ImportError:
+            _PIL.append(None)
+    return _PIL[0]
+
+
+def _full_size(path):
+    """Src for an image shown without a thumbnail"""
+    try:
+        return asset_src(Path(path).resolve().relative_to(ASSETS_DIR).as_posix())
+    except ValueError:
+        return path
+
+
+# Leading bytes of the formats copied without Pillow
+_SIGNATURES = [
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+    (b"BM", ".bmp"),
+]
+
+
+def _image_suffix(header):
+    """File suffix for an image starting with `header`; ValueError otherwise"""
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return ".webp"
+    for signature, suffix in _SIGNATURES:
+        if header.startswith(signature):
+            return suffix
+    raise ValueError("not an image")
+
+
+def _has_alpha(image):
+    """Whether an image has transparent pixels, which JPEG can't keep"""
+    if image.mode == "P":
+        return "transparency" in image.info
+    if image.mode in ("RGBA", "LA"):
+        return image.getextrema()[-1][0] < 255
+    return False
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def open_thumbnails(directory=None, max_bytes=None):
+    """
+    Process-wide ThumbnailCache
+
+    Thumbnails go to CHAT_THUMB_DIR if set, otherwise assets/thumbs, and
+    the cache is capped at CHAT_THUMB_CACHE_MB megabytes (default 64).
+    Relative directories are taken from the assets directory; others
+    must be inside it. Arguments only apply to the call that opens the
+    cache.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            directory = ASSETS_DIR / (directory or os.getenv("CHAT_THUMB_DIR") or THUMBNAIL_DIR)
+            if max_bytes is None:
+                max_bytes = int(float(os.getenv("CHAT_THUMB_CACHE_MB", MAX_BYTES / 1024 / 1024)) * 1024 * 1024)
+            _cache = ThumbnailCache(directory, max_bytes)
+        return _cache
@@ -0,0 +1 @@
+# Performance tooling package
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+Instrumentation
+Opt-in timings for component construction, event handlers and page updates
+
+Set CHAT_INSTRUMENT=1 before the app starts to turn it on. The setting is
+read once at import: when it is off, `component` and `handler` hand back
+the function they were given, so the hot paths carry no wrapper at all.
+
+Timings go into histograms in METRICS, keyed by kind and name:
+
+- component: construction time of each decorated component function,
+  including the components it builds
+- handler: latency of event callbacks (on_click, on_submit, on_change)
+- update: page.update() pushes and scheduler mark-to-flush latency
+"""
+
+import functools
+import inspect
+import os
+import threading
+import time
+from bisect import bisect_left
+
+ENABLED = bool(os.getenv("CHAT_INSTRUMENT"))
+
+KINDS = ("component", "handler", "update")
+
+# Upper bounds of the histogram buckets, in seconds
+BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram"""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the q-th observation"""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class Metrics:
+    """Histograms by (kind, name), safe to feed from handler threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.histograms = {}
+
+    def observe(self, kind, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get((kind, name))
+            if histogram is None:
+                histogram = self.histograms[(kind, name)] = Histogram()
+            histogram.observe(seconds)
+
+    def rows(self, kind):
+        """(name, histogram) pairs of one kind, most total time first"""
+        with self._lock:
+            rows = [(name, h) for (k, name), h in self.histograms.items() if k == kind]
+        return sorted(rows, key=lambda row: row[1].total, reverse=True)
+
+    def reset(self):
+        with self._lock:
+            self.histograms.clear()
+
+    def to_text(self):
+        """Metrics in the Prometheus text exposition format"""
+        lines = []
+        for kind in KINDS:
+            metric = f"chat_{kind}_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            for name, histogram in self.rows(kind):
+                label = f'name="{name}"'
+                cumulative = 0
+                for bound, count in zip(BUCKETS, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{metric}_bucket{{{label},le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{label},le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum{{{label}}} {histogram.total:.6f}")
+                lines.append(f"{metric}_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write to_text() to `path` and return the path"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_text())
+        return path
+
+
+METRICS = Metrics()
+
+
+def component(fn):
+    """Decorator recording construction time of a component function"""
+    if not ENABLED:
+        return fn
+
+    name = f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            METRICS.observe("component", name, time.perf_counter() - start)
+
+    return wrapper
+
+
+def handler(callback, name):
+    """
+    Wrap an event callback so its latency is recorded under `name`
+
+    Async callbacks get an async wrapper, so Flet still runs them on the
+    page event loop rather than in a worker thread.
+    """
+    if not ENABLED or callback is None:
+        return callback
+
+    if inspect.iscoroutinefunction(callback):
+        @functools.wraps(callback)
+        async def async_wrapper(*args):
+            start = time.perf_counter()
+            try:
+                return await callback(*args)
+            finally:
+                METRICS.observe("handler", name, time.perf_counter() - start)
+
+        return async_wrapper
+
+    @functools.wraps(callback)
+    def wrapper(*args):
+        start = time.perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            METRICS.observe("handler", name, time.perf_counter() - start)
+
+    return wrapper
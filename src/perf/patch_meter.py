@@ -0,0 +1,84 @@
+"""
+Patch Meter
+Measures what page updates cost: controls diffed and bytes on the wire
+"""
+
+import json
+import weakref
+from contextlib import contextmanager
+from typing import NamedTuple
+
+from flet.core.protocol import CommandEncoder
+
+
+class PatchSample(NamedTuple):
+    controls: int   # controls Flet walked while diffing
+    commands: int   # add/set/remove commands produced
+    bytes: int      # JSON size of those commands
+
+    def __str__(self):
+        return f"diffed {self.controls} controls, {self.commands} commands, {self.bytes} patch bytes"
+
+
+def count_controls(control):
+    """Number of controls Flet visits when diffing `control`'s subtree"""
+    count = 1
+    for child in control._get_children():
+        count += 1 if child.is_isolated() else count_controls(child)
+    return count
+
+
+class PatchMeter:
+    """
+    Records a PatchSample for every measured update of one page
+
+    The page connection's send_commands is wrapped once; batches are
+    routed to the meter registered for their session id, which is
+    dropped once the meter is no longer used. With verbose=True every
+    sample is printed as it is recorded.
+    """
+
+    def __init__(self, page, verbose=False):
+        self.page = page
+        self.verbose = verbose
+        self.samples = []
+        self._commands = 0
+        self._bytes = 0
+        _install(page.connection)[page.session_id] = self
+
+    @property
+    def last(self):
+        return self.samples[-1] if self.samples else None
+
+    @contextmanager
+    def measure(self, *controls):
+        self._commands = 0
+        self._bytes = 0
+        diffed = sum(count_controls(c) for c in controls or (self.page,))
+        yield
+        sample = PatchSample(diffed, self._commands, self._bytes)
+        self.samples.append(sample)
+        if self.verbose:
+            print(f"update: {sample}")
+
+    def _record(self, commands):
+        self._commands += len(commands)
+        self._bytes += len(json.dumps(commands, cls=CommandEncoder, separators=(",", ":")))
+
+
+def _install(conn):
+    meters = getattr(conn, "_patch_meters", None)
+    if meters is not None:
+        return meters
+
+    meters = conn._patch_meters = weakref.WeakValueDictionary()
+    send_commands = conn.send_commands
+
+    def metered_send_commands(session_id, commands):
+        meter = meters.get(session_id)
+        if meter:
+            meter._record(commands)
+        return send_commands(session_id, commands)
+
+    conn.send_commands = metered_send_commands
+    return meters
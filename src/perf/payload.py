@@ -0,0 +1,214 @@
+"""
+Payload Analyzer
+Breaks down what a screen costs on the wire and checks it against a budget
+
+Builds an entry point on a headless stub page, keeps the messages Flet
+would send and reports:
+
+- bytes and control count per control type
+- properties sent with the value the client uses anyway
+- wrapper chains: single-child Containers nested in a Container, and
+  Rows/Columns laying out a single control
+- the screen total against SCREEN_BUDGETS
+
+Run from src/, like the app:
+
+    python -m perf.payload [entry ...] [--budget main=1200] [--json]
+
+Exits with status 1 when a screen is over budget.
+"""
+
+import argparse
+import importlib
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import NamedTuple
+
+# First-page bytes per entry point, including the page title update
+SCREEN_BUDGETS = {
+    "main": 1700,
+    "atomic_example": 6000,
+    "design_tokens_demo": 10500,
+}
+
+# Values the Flutter client falls back to when a property is absent;
+# "*" applies to every control type
+CLIENT_DEFAULTS = {
+    "*": {"disabled": "false", "visible": "true", "opacity": "1", "expand": "false", "rtl": "false"},
+    "container": {"bgcolor": "transparent", "ink": "false", "borderradius": "0", "padding": "0", "margin": "0"},
+    "row": {"spacing": "10", "alignment": "start", "wrap": "false", "tight": "false"},
+    "column": {"spacing": "10", "alignment": "start", "wrap": "false", "tight": "false"},
+    "text": {"weight": "normal", "italic": "false", "selectable": "false"},
+    "textfield": {"multiline": "false", "password": "false", "readonly": "false"},
+}
+
+# Keys every control entry carries: type, id, parent, children, slot name, index
+STRUCTURAL = {"t", "i", "p", "c", "n", "at"}
+
+WRAPPERS = {"container", "row", "column"}
+
+
+class Finding(NamedTuple):
+    kind: str       # "default" or "wrapper"
+    control: str    # control type
+    id: str
+    detail: str
+    bytes: int      # bytes the fix would save, roughly
+
+    def __str__(self):
+        return f"{self.kind:<8} {self.control}#{self.id}: {self.detail} ({self.bytes} B)"
+
+
+def entry_size(entry):
+    return len(json.dumps(entry, separators=(",", ":")))
+
+
+def added_controls(messages):
+    """Control entries of every addPageControls in a list of sent messages"""
+    controls = []
+    for data in messages:
+        _collect(json.loads(data), controls)
+    return controls
+
+
+def _collect(message, controls):
+    payload = message.get("payload")
+    if message.get("action") == "addPageControls":
+        controls.extend(payload["controls"])
+    elif isinstance(payload, list):
+        for inner in payload:
+            _collect(inner, controls)
+
+
+def redundant_defaults(entry):
+    defaults = {**CLIENT_DEFAULTS["*"], **CLIENT_DEFAULTS.get(entry["t"], {})}
+    return [
+        (name, value)
+        for name, value in entry.items()
+        if name not in STRUCTURAL and defaults.get(name) == _number(value)
+    ]
+
+
+def _number(value):
+    """'10.0' -> '10', so numeric defaults match however they were written"""
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return value
+    return str(int(number)) if number.is_integer() else value
+
+
+def wrapper_chains(entries):
+    """Findings for controls that only wrap a single child"""
+    by_id = {entry["i"]: entry for entry in entries}
+    findings = []
+    for entry in entries:
+        if entry["t"] not in WRAPPERS or len(entry["c"]) != 1:
+            continue
+        child = by_id.get(entry["c"][0])
+        if child is None:
+            continue
+        if entry["t"] == "container" and child["t"] == "container":
+            findings.append(Finding(
+                "wrapper", "container", entry["i"],
+                f"wraps container#{child['i']}; merge their properties into one",
+                entry_size(child)
+            ))
+        elif entry["t"] in ("row", "column"):
+            findings.append(Finding(
+                "wrapper", entry["t"], entry["i"],
+                f"lays out only {child['t']}#{child['i']}",
+                entry_size(entry)
+            ))
+    return findings
+
+
+class ScreenReport:
+    """Payload breakdown of one built screen"""
+
+    def __init__(self, name, messages, total_bytes, budget=None):
+        self.name = name
+        self.bytes = total_bytes
+        self.budget = budget
+        entries = added_controls(messages)
+        self.controls = len(entries)
+
+        self.by_type = defaultdict(lambda: [0, 0])
+        self.findings = []
+        for entry in entries:
+            stats = self.by_type[entry["t"]]
+            stats[0] += 1
+            stats[1] += entry_size(entry)
+            for name, value in redundant_defaults(entry):
+                self.findings.append(Finding(
+                    "default", entry["t"], entry["i"], f"{name}={value}",
+                    len(json.dumps({name: value}, separators=(",", ":"))) - 1
+                ))
+        self.findings.extend(wrapper_chains(entries))
+
+    @property
+    def over_budget(self):
+        return self.budget is not None and self.bytes > self.budget
+
+    def to_dict(self):
+        return {
+            "bytes": self.bytes,
+            "budget": self.budget,
+            "controls": self.controls,
+            "by_type": {t: {"count": c, "bytes": b} for t, (c, b) in self.by_type.items()},
+            "findings": [f._asdict() for f in self.findings],
+        }
+
+    def __str__(self):
+        budget = f" / budget {self.budget} B" if self.budget is not None else ""
+        status = " OVER BUDGET" if self.over_budget else ""
+        lines = [f"{self.name}: {self.bytes} B{budget}, {self.controls} controls{status}"]
+        for control, (count, size) in sorted(self.by_type.items(), key=lambda item: -item[1][1]):
+            lines.append(f"  {control:<14} {count:>4} x {size / count:>6.0f} B = {size:>6} B")
+        for finding in self.findings:
+            lines.append(f"  {finding}")
+        if self.findings:
+            saving = sum(f.bytes for f in self.findings)
+            lines.append(f"  {len(self.findings)} findings, about {saving} B to save")
+        return "\n".join(lines)
+
+
+def analyze_screen(entry, budget=None):
+    """Build entry point module `entry` on a stub page and report its payload"""
+    from perf.stub_page import stub_page
+
+    module = importlib.import_module(entry)
+    page = stub_page(keep=True)
+    module.main(page)
+    return ScreenReport(entry, page.connection.sent, page.connection.bytes, budget)
+
+
+def _budget(value):
+    name, _, size = value.partition("=")
+    return name, int(size)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("entries", nargs="*", default=list(SCREEN_BUDGETS))
+    parser.add_argument("--budget", type=_budget, action="append", default=[],
+                        metavar="ENTRY=BYTES", help="override a screen budget")
+    parser.add_argument("--json", action="store_true", help="print reports as JSON")
+    args = parser.parse_args(argv)
+
+    # The chat screen reads history from CHAT_DB; keep it off the real file
+    os.environ.setdefault("CHAT_DB", ":memory:")
+    budgets = {**SCREEN_BUDGETS, **dict(args.budget)}
+    reports = [analyze_screen(entry, budgets.get(entry)) for entry in args.entries]
+
+    if args.json:
+        print(json.dumps({r.name: r.to_dict() for r in reports}, indent=2))
+    else:
+        print("\n\n".join(str(r) for r in reports))
+    return 1 if any(r.over_budget for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
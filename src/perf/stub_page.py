@@ -0,0 +1,75 @@
+"""
+Stub Page
+Headless Flet page for benchmarks and tooling
+
+Commands go through the same processing the desktop/web transport
+applies before sending, so control ids, patch messages and their sizes
+are real; the messages are counted and dropped instead of rendered.
+"""
+
+import asyncio
+import json
+
+import flet as ft
+from flet.core.local_connection import LocalConnection
+from flet.core.protocol import (
+    ClientActions,
+    ClientMessage,
+    CommandEncoder,
+    PageCommandResponsePayload,
+    PageCommandsBatchResponsePayload,
+)
+
+
+class StubConnection(LocalConnection):
+    """Counts outgoing messages and their bytes; keeps them too if `keep` is set"""
+
+    def __init__(self, keep=False):
+        super().__init__()
+        self.keep = keep
+        self.sent = []
+        self.messages = 0
+        self.bytes = 0
+
+    def send_command(self, session_id, command):
+        result, message = self._process_command(command)
+        if message:
+            self._send(message)
+        return PageCommandResponsePayload(result=result, error="")
+
+    def send_commands(self, session_id, commands):
+        results = []
+        messages = []
+        for command in commands:
+            result, message = self._process_command(command)
+            if command.name in ["add", "get"]:
+                results.append(result)
+            if message:
+                messages.append(message)
+        if messages:
+            self._send(ClientMessage(ClientActions.PAGE_CONTROLS_BATCH, messages))
+        return PageCommandsBatchResponsePayload(results=results, error="")
+
+    def _send(self, message):
+        data = json.dumps(message, cls=CommandEncoder, separators=(",", ":"))
+        self.messages += 1
+        self.bytes += len(data)
+        if self.keep:
+            self.sent.append(data)
+
+    def reset(self):
+        self.sent = []
+        self.messages = 0
+        self.bytes = 0
+
+
+def stub_page(session_id="stub", loop=None, keep=False):
+    """
+    A Page wired to a StubConnection
+
+    The event loop is not run; code that schedules work on it (the
+    UpdateScheduler, page.run_task) needs an explicit flush or a loop
+    running in another thread. With keep=True the connection also keeps
+    every message as the JSON string that would have been sent.
+    """
+    return ft.Page(StubConnection(keep), session_id, loop or asyncio.new_event_loop())
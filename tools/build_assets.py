@@ -0,0 +1,136 @@
+"""
+Asset build
+Content-hashes src/assets into assets/dist and pre-compresses the copies
+
+Each asset is copied to dist/<stem>.<hash>.<ext>, so its URL changes
+whenever its bytes do and it can be cached for good. Next to each copy go
+gzip and, when the brotli package is installed, brotli variants (.gz, .br)
+for a static web host to serve as is, e.g. the output of `flet build web`
+behind nginx's gzip_static/brotli_static. A variant is only kept if it
+saves at least MIN_SAVING of the size, which already-compressed PNG or
+JPEG files rarely do.
+
+The mapping is written to assets/manifest.json (see media.assets).
+Generated files are skipped. Icons and splash screens are hashed like
+any other asset; `flet build` still finds the originals by name.
+
+    python tools/build_assets.py [--check]
+
+--check exits with status 1 if the manifest is out of date.
+"""
+
+import argparse
+import fnmatch
+import gzip
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from media.assets import ASSETS_DIR, HASHED_DIR, MANIFEST, content_hash, hashed_name, load_manifest
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Generated
+SKIP = [MANIFEST, f"{HASHED_DIR}/*", "thumbs/*"]
+
+# Smallest size reduction worth keeping a compressed variant for
+MIN_SAVING = 0.05
+
+
+def sources(assets_dir=ASSETS_DIR):
+    for path in sorted(assets_dir.rglob("*")):
+        name = path.relative_to(assets_dir).as_posix()
+        if path.is_file() and not any(fnmatch.fnmatch(name, pattern) for pattern in SKIP):
+            yield name, path
+
+
+def compressed(data):
+    """{encoding: bytes} for the variants worth keeping"""
+    variants = {"gzip": gzip.compress(data, 9, mtime=0)}
+    if brotli is not None:
+        variants["br"] = brotli.compress(data, quality=11)
+    return {
+        encoding: variant for encoding, variant in variants.items()
+        if len(variant) <= len(data) * (1 - MIN_SAVING)
+    }
+
+
+SUFFIXES = {"gzip": ".gz", "br": ".br"}
+
+
+def plan(assets_dir=ASSETS_DIR):
+    """The manifest a build would write"""
+    assets = {}
+    for name, path in sources(assets_dir):
+        assets[name] = {"path": f"{HASHED_DIR}/{hashed_name(name, content_hash(path))}"}
+    return assets
+
+
+def build(assets_dir=ASSETS_DIR):
+    """Write hashed copies, variants and the manifest; returns the manifest entries"""
+    output = assets_dir / HASHED_DIR
+    assets = {}
+    written = set()
+    for name, path in sources(assets_dir):
+        data = path.read_bytes()
+        target = assets_dir / HASHED_DIR / hashed_name(name, content_hash(data))
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if not target.exists():
+            target.write_bytes(data)
+        written.add(target)
+
+        variants = compressed(data)
+        for encoding, variant in variants.items():
+            path = target.with_name(target.name + SUFFIXES[encoding])
+            path.write_bytes(variant)
+            written.add(path)
+        assets[name] = {
+            "path": target.relative_to(assets_dir).as_posix(),
+            "size": len(data),
+            "encodings": {encoding: len(variant) for encoding, variant in variants.items()},
+        }
+
+    # Copies of old versions of the assets
+    if output.exists():
+        for stale in output.rglob("*"):
+            if stale.is_file() and stale not in written:
+                stale.unlink()
+
+    manifest = {"assets": assets}
+    (assets_dir / MANIFEST).write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    return assets
+
+
+def is_current(assets_dir=ASSETS_DIR):
+    return {name: entry["path"] for name, entry in load_manifest(assets_dir).items()} == {
+        name: entry["path"] for name, entry in plan(assets_dir).items()
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true", help="only report whether the manifest is current")
+    args = parser.parse_args()
+
+    if args.check:
+        current = is_current()
+        print("assets up to date" if current else "assets out of date; run tools/build_assets.py")
+        return 0 if current else 1
+
+    assets = build()
+    for name, entry in assets.items():
+        variants = ", ".join(f"{encoding} {size} B" for encoding, size in entry["encodings"].items())
+        print(f"{name} -> {entry['path']} ({entry['size']} B{'; ' + variants if variants else ''})")
+    if brotli is None:
+        print("brotli not installed; only gzip variants were written")
+    print(f"wrote {ASSETS_DIR / MANIFEST}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Design token build
+Compiles src/design_tokens/tokens.json into the design_tokens._generated package
+
+Aliases are resolved and CSS box-shadows are parsed here, so the app only
+imports plain Python constants. The output is stamped with a hash of the
+source and this generator; when the stamp matches, nothing is rewritten.
+
+    python tools/build_tokens.py [--check] [--force]
+
+--check exits with status 1 if the generated package is out of date.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+DESIGN_TOKENS = Path(__file__).resolve().parents[1] / "src" / "design_tokens"
+SOURCE = DESIGN_TOKENS / "tokens.json"
+OUTPUT = DESIGN_TOKENS / "_generated"
+
+# Bump when the generated code changes shape, to invalidate the cache
+GENERATOR_VERSION = "2"
+
+HEADER = "# Generated by tools/build_tokens.py from design_tokens/tokens.json; do not edit.\n"
+
+_ALIAS = re.compile(r"^\{([A-Za-z_][\w.]*)\}$")
+_TOKEN = re.compile(r"^[A-Z][A-Z0-9_]*$")
+_HASH = re.compile(r'^SOURCE_HASH = "([0-9a-f]+)"$', re.MULTILINE)
+_SHADOW = re.compile(
+    r"(-?[\d.]+)(?:px)?\s+(-?[\d.]+)(?:px)?\s+([\d.]+)(?:px)?\s+(-?[\d.]+)(?:px)?\s+"
+    r"rgba\(\s*(\d+),\s*(\d+),\s*(\d+),\s*([\d.]+)\s*\)"
+)
+
+
+class TokenError(Exception):
+    pass
+
+
+def parse_shadow(css):
+    """CSS box-shadow ("x y blur spread rgba(...)", comma separated) to ft.BoxShadow keyword specs"""
+    layers = []
+    for x, y, blur, spread, r, g, b, alpha in _SHADOW.findall(css):
+        layers.append({
+            "spread_radius": float(spread),
+            "blur_radius": float(blur),
+            # The format ft.Colors.with_opacity() produces
+            "color": f"#{int(r):02X}{int(g):02X}{int(b):02X},{float(alpha)}",
+            "offset": (float(x), float(y)),
+        })
+    if not layers and css.strip() != "none":
+        raise TokenError(f"can't parse shadow {css!r}")
+    return tuple(layers)
+
+
+def literal(value):
+    """Python source for a resolved value, with double-quoted strings like the rest of the code"""
+    if isinstance(value, str):
+        return json.dumps(value)
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{literal(k)}: {literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, tuple):
+        items = ", ".join(literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    return repr(value)
+
+
+class Token:
+    def __init__(self, module, owner, name, raw, comment=None):
+        self.module = module    # token module name, e.g. "colors"
+        self.owner = owner      # class name, or None at module level
+        self.name = name
+        self.raw = raw
+        self.comment = comment
+
+    @property
+    def key(self):
+        return ".".join(part for part in (self.module, self.owner, self.name) if part)
+
+
+def _entry(value):
+    if isinstance(value, dict) and "value" in value:
+        return value["value"], value.get("comment")
+    return value, None
+
+
+def _walk(module, owner, tree, tokens, blocks):
+    """Collect tokens into `tokens` and the layout (sections, classes) into `blocks`"""
+    for key, value in tree.items():
+        if key.startswith("$"):
+            continue
+        if key.startswith("class "):
+            members = []
+            blocks.append(("class", key[len("class "):], value.get("$comment"), members))
+            _walk(module, key[len("class "):], value, tokens, members)
+        elif _TOKEN.match(key):
+            raw, comment = _entry(value)
+            token = Token(module, owner, key, raw, comment)
+            tokens[token.key] = token
+            blocks.append(("token", token))
+        elif isinstance(value, dict):
+            members = []
+            blocks.append(("section", key, members))
+            _walk(module, owner, value, tokens, members)
+        else:
+            raise TokenError(f"{module}: {key!r} is neither a token, a section nor a class")
+
+
+class Compiler:
+    def __init__(self, source):
+        self.modules = {}
+        self.tokens = {}
+        for module, tree in source.items():
+            if module.startswith("$"):
+                continue
+            blocks = []
+            _walk(module, None, tree, self.tokens, blocks)
+            self.modules[module] = (tree, blocks)
+
+    def target(self, token, alias):
+        name = alias
+        for key in (f"{token.module}.{name}", name):
+            if key in self.tokens:
+                return self.tokens[key]
+        raise TokenError(f"{token.key}: unknown alias {{{alias}}}")
+
+    def resolve(self, token, value=None, seen=()):
+        """Literal value of `value` (default: the token's own), aliases followed"""
+        value = token.raw if value is None else value
+        if isinstance(value, dict):
+            return {k: self.resolve(token, v, seen) for k, v in value.items()}
+        match = _ALIAS.match(value) if isinstance(value, str) else None
+        if match:
+            target = self.target(token, match.group(1))
+            if target.key in seen:
+                raise TokenError(f"alias cycle: {' -> '.join(seen + (target.key,))}")
+            return self.resolve(target, None, seen + (target.key,))
+        tree, _ = self.modules[token.module]
+        if tree.get("$type") == "shadow" and token.owner is None and isinstance(value, str):
+            return parse_shadow(value)
+        return value
+
+    def expression(self, token, value):
+        """Python source for `value`: a name for aliases of module-level tokens of the same module"""
+        match = _ALIAS.match(value) if isinstance(value, str) else None
+        if match:
+            target = self.target(token, match.group(1))
+            if target.module == token.module and target.owner is None:
+                return target.name
+        return literal(self.resolve(token, value))
+
+    def token_lines(self, token, indent):
+        pad = " " * indent
+        comment = f"  # {token.comment}" if token.comment else ""
+        if isinstance(token.raw, dict):
+            lines = [f"{pad}{token.name} = {{"]
+            fields = [f'{pad}    "{k}": {self.expression(token, v)}' for k, v in token.raw.items()]
+            lines.append(",\n".join(fields))
+            lines.append(f"{pad}}}{comment}")
+            return lines
+        match = _ALIAS.match(token.raw) if isinstance(token.raw, str) else None
+        if match and not comment:
+            target = self.target(token, match.group(1))
+            if target.module != token.module:
+                comment = f"  # {target.key}"
+        return [f"{pad}{token.name} = {self.expression(token, token.raw)}{comment}"]
+
+    def block_lines(self, blocks, indent=0):
+        lines = []
+        pad = " " * indent
+        for block in blocks:
+            if block[0] == "token":
+                lines.extend(self.token_lines(block[1], indent))
+            elif block[0] == "section":
+                if lines:
+                    lines.append("")
+                lines.append(f"{pad}# {block[1]}")
+                lines.extend(self.block_lines(block[2], indent))
+            else:
+                _, name, comment, members = block
+                lines.extend(["", ""] if lines else [])
+                if comment:
+                    lines.append(f"# {comment}")
+                lines.append(f"class {name}:")
+                lines.extend(self.block_lines(members, indent + 4) or ["    pass"])
+        return lines
+
+    def module_source(self, module):
+        tree, blocks = self.modules[module]
+        names = [token.name for token in self.tokens.values() if token.module == module and token.owner is None]
+        names += [block[1] for block in blocks if block[0] == "class"]
+        body = self.block_lines(blocks)
+        return (
+            HEADER + "\n"
+            + "__all__ = [\n" + "".join(f'    "{name}",\n' for name in names) + "]\n\n"
+            + "\n".join(body) + "\n"
+        )
+
+
+def source_hash(data):
+    return hashlib.sha256(data + GENERATOR_VERSION.encode()).hexdigest()
+
+
+def current_hash(output=OUTPUT):
+    init = output / "__init__.py"
+    if not init.exists():
+        return None
+    match = _HASH.search(init.read_text(encoding="utf-8"))
+    return match.group(1) if match else None
+
+
+def build(source=SOURCE, output=OUTPUT, force=False):
+    """Regenerate `output` from `source`; returns False when the cache was up to date"""
+    data = source.read_bytes()
+    digest = source_hash(data)
+    if not force and current_hash(output) == digest:
+        return False
+
+    compiler = Compiler(json.loads(data))
+    files = {f"{module}.py": compiler.module_source(module) for module in compiler.modules}
+    files["__init__.py"] = HEADER + f'\nSOURCE_HASH = "{digest}"\n'
+
+    output.mkdir(exist_ok=True)
+    for stale in output.glob("*.py"):
+        if stale.name not in files:
+            stale.unlink()
+    # __init__ last, so an interrupted build is never stamped as current
+    for name in sorted(files, key=lambda name: name == "__init__.py"):
+        (output / name).write_text(files[name], encoding="utf-8")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--check", action="store_true", help="only report whether the output is current")
+    parser.add_argument("--force", action="store_true", help="rebuild even if the hash matches")
+    args = parser.parse_args()
+
+    if args.check:
+        current = current_hash() == source_hash(SOURCE.read_bytes())
+        print("design tokens up to date" if current else "design tokens out of date; run tools/build_tokens.py")
+        return 0 if current else 1
+
+    try:
+        built = build(force=args.force)
+    except TokenError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    print(f"wrote {OUTPUT}" if built else "design tokens up to date")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())